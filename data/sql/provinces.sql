@@ -1,36 +0,0 @@
--- Provinces from CSV
-INSERT INTO tabProvince (name, creation, modified, modified_by, owner, docstatus, idx, province_code, province_name) VALUES
-('11', '2025-09-01 19:45:53.798380', '2025-09-01 19:45:53.798380', 'Administrator', 'Administrator', 0, 0, '11', 'ACEH'),
-('12', '2025-09-01 19:45:53.948843', '2025-09-01 19:45:53.948843', 'Administrator', 'Administrator', 0, 0, '12', 'SUMATERA UTARA'),
-('13', '2025-09-01 19:45:53.948879', '2025-09-01 19:45:53.948879', 'Administrator', 'Administrator', 0, 0, '13', 'SUMATERA BARAT'),
-('14', '2025-09-01 19:45:53.948890', '2025-09-01 19:45:53.948890', 'Administrator', 'Administrator', 0, 0, '14', 'RIAU'),
-('15', '2025-09-01 19:45:53.948898', '2025-09-01 19:45:53.948898', 'Administrator', 'Administrator', 0, 0, '15', 'JAMBI'),
-('16', '2025-09-01 19:45:53.948905', '2025-09-01 19:45:53.948905', 'Administrator', 'Administrator', 0, 0, '16', 'SUMATERA SELATAN'),
-('17', '2025-09-01 19:45:53.948912', '2025-09-01 19:45:53.948912', 'Administrator', 'Administrator', 0, 0, '17', 'BENGKULU'),
-('18', '2025-09-01 19:45:53.948922', '2025-09-01 19:45:53.948922', 'Administrator', 'Administrator', 0, 0, '18', 'LAMPUNG'),
-('19', '2025-09-01 19:45:53.948936', '2025-09-01 19:45:53.948936', 'Administrator', 'Administrator', 0, 0, '19', 'KEPULAUAN BANGKA BELITUNG'),
-('21', '2025-09-01 19:45:53.948952', '2025-09-01 19:45:53.948952', 'Administrator', 'Administrator', 0, 0, '21', 'KEPULAUAN RIAU'),
-('31', '2025-09-01 19:45:53.948959', '2025-09-01 19:45:53.948959', 'Administrator', 'Administrator', 0, 0, '31', 'DKI JAKARTA'),
-('32', '2025-09-01 19:45:53.948975', '2025-09-01 19:45:53.948975', 'Administrator', 'Administrator', 0, 0, '32', 'JAWA BARAT'),
-('33', '2025-09-01 19:45:53.948982', '2025-09-01 19:45:53.948982', 'Administrator', 'Administrator', 0, 0, '33', 'JAWA TENGAH'),
-('34', '2025-09-01 19:45:53.948989', '2025-09-01 19:45:53.948989', 'Administrator', 'Administrator', 0, 0, '34', 'DI YOGYAKARTA'),
-('35', '2025-09-01 19:45:53.948995', '2025-09-01 19:45:53.948995', 'Administrator', 'Administrator', 0, 0, '35', 'JAWA TIMUR'),
-('36', '2025-09-01 19:45:53.949001', '2025-09-01 19:45:53.949001', 'Administrator', 'Administrator', 0, 0, '36', 'BANTEN'),
-('51', '2025-09-01 19:45:53.949033', '2025-09-01 19:45:53.949033', 'Administrator', 'Administrator', 0, 0, '51', 'BALI'),
-('52', '2025-09-01 19:45:53.949044', '2025-09-01 19:45:53.949044', 'Administrator', 'Administrator', 0, 0, '52', 'NUSA TENGGARA BARAT'),
-('53', '2025-09-01 19:45:53.949051', '2025-09-01 19:45:53.949051', 'Administrator', 'Administrator', 0, 0, '53', 'NUSA TENGGARA TIMUR'),
-('61', '2025-09-01 19:45:53.949058', '2025-09-01 19:45:53.949058', 'Administrator', 'Administrator', 0, 0, '61', 'KALIMANTAN BARAT'),
-('62', '2025-09-01 19:45:53.949064', '2025-09-01 19:45:53.949064', 'Administrator', 'Administrator', 0, 0, '62', 'KALIMANTAN TENGAH'),
-('63', '2025-09-01 19:45:53.949070', '2025-09-01 19:45:53.949070', 'Administrator', 'Administrator', 0, 0, '63', 'KALIMANTAN SELATAN'),
-('64', '2025-09-01 19:45:53.949077', '2025-09-01 19:45:53.949077', 'Administrator', 'Administrator', 0, 0, '64', 'KALIMANTAN TIMUR'),
-('65', '2025-09-01 19:45:53.949089', '2025-09-01 19:45:53.949089', 'Administrator', 'Administrator', 0, 0, '65', 'KALIMANTAN UTARA'),
-('71', '2025-09-01 19:45:53.949098', '2025-09-01 19:45:53.949098', 'Administrator', 'Administrator', 0, 0, '71', 'SULAWESI UTARA'),
-('72', '2025-09-01 19:45:53.949105', '2025-09-01 19:45:53.949105', 'Administrator', 'Administrator', 0, 0, '72', 'SULAWESI TENGAH'),
-('73', '2025-09-01 19:45:53.949111', '2025-09-01 19:45:53.949111', 'Administrator', 'Administrator', 0, 0, '73', 'SULAWESI SELATAN'),
-('74', '2025-09-01 19:45:53.949118', '2025-09-01 19:45:53.949118', 'Administrator', 'Administrator', 0, 0, '74', 'SULAWESI TENGGARA'),
-('75', '2025-09-01 19:45:53.949124', '2025-09-01 19:45:53.949124', 'Administrator', 'Administrator', 0, 0, '75', 'GORONTALO'),
-('76', '2025-09-01 19:45:53.949130', '2025-09-01 19:45:53.949130', 'Administrator', 'Administrator', 0, 0, '76', 'SULAWESI BARAT'),
-('81', '2025-09-01 19:45:53.949137', '2025-09-01 19:45:53.949137', 'Administrator', 'Administrator', 0, 0, '81', 'MALUKU'),
-('82', '2025-09-01 19:45:53.949143', '2025-09-01 19:45:53.949143', 'Administrator', 'Administrator', 0, 0, '82', 'MALUKU UTARA'),
-('91', '2025-09-01 19:45:53.949168', '2025-09-01 19:45:53.949168', 'Administrator', 'Administrator', 0, 0, '91', 'PAPUA BARAT'),
-('94', '2025-09-01 19:45:53.949203', '2025-09-01 19:45:53.949203', 'Administrator', 'Administrator', 0, 0, '94', 'PAPUA');
@@ -1,516 +0,0 @@
--- Regencies from CSV
-INSERT INTO tabRegency (name, creation, modified, modified_by, owner, docstatus, idx, regency_code, regency_name, province, province_code) VALUES
-('1101', '2025-09-01 19:45:53.959136', '2025-09-01 19:45:53.959136', 'Administrator', 'Administrator', 0, 0, '1101', 'KABUPATEN SIMEULUE', '11', '11'),
-('1102', '2025-09-01 19:45:53.959311', '2025-09-01 19:45:53.959311', 'Administrator', 'Administrator', 0, 0, '1102', 'KABUPATEN ACEH SINGKIL', '11', '11'),
-('1103', '2025-09-01 19:45:53.959362', '2025-09-01 19:45:53.959362', 'Administrator', 'Administrator', 0, 0, '1103', 'KABUPATEN ACEH SELATAN', '11', '11'),
-('1104', '2025-09-01 19:45:53.959386', '2025-09-01 19:45:53.959386', 'Administrator', 'Administrator', 0, 0, '1104', 'KABUPATEN ACEH TENGGARA', '11', '11'),
-('1105', '2025-09-01 19:45:53.959406', '2025-09-01 19:45:53.959406', 'Administrator', 'Administrator', 0, 0, '1105', 'KABUPATEN ACEH TIMUR', '11', '11'),
-('1106', '2025-09-01 19:45:53.959440', '2025-09-01 19:45:53.959440', 'Administrator', 'Administrator', 0, 0, '1106', 'KABUPATEN ACEH TENGAH', '11', '11'),
-('1107', '2025-09-01 19:45:53.959469', '2025-09-01 19:45:53.959469', 'Administrator', 'Administrator', 0, 0, '1107', 'KABUPATEN ACEH BARAT', '11', '11'),
-('1108', '2025-09-01 19:45:53.959493', '2025-09-01 19:45:53.959493', 'Administrator', 'Administrator', 0, 0, '1108', 'KABUPATEN ACEH BESAR', '11', '11'),
-('1109', '2025-09-01 19:45:53.959514', '2025-09-01 19:45:53.959514', 'Administrator', 'Administrator', 0, 0, '1109', 'KABUPATEN PIDIE', '11', '11'),
-('1110', '2025-09-01 19:45:53.959555', '2025-09-01 19:45:53.959555', 'Administrator', 'Administrator', 0, 0, '1110', 'KABUPATEN BIREUEN', '11', '11'),
-('1111', '2025-09-01 19:45:53.959575', '2025-09-01 19:45:53.959575', 'Administrator', 'Administrator', 0, 0, '1111', 'KABUPATEN ACEH UTARA', '11', '11'),
-('1112', '2025-09-01 19:45:53.959592', '2025-09-01 19:45:53.959592', 'Administrator', 'Administrator', 0, 0, '1112', 'KABUPATEN ACEH BARAT DAYA', '11', '11'),
-('1113', '2025-09-01 19:45:53.959610', '2025-09-01 19:45:53.959610', 'Administrator', 'Administrator', 0, 0, '1113', 'KABUPATEN GAYO LUES', '11', '11'),
-('1114', '2025-09-01 19:45:53.959688', '2025-09-01 19:45:53.959688', 'Administrator', 'Administrator', 0, 0, '1114', 'KABUPATEN ACEH TAMIANG', '11', '11'),
-('1115', '2025-09-01 19:45:53.959733', '2025-09-01 19:45:53.959733', 'Administrator', 'Administrator', 0, 0, '1115', 'KABUPATEN NAGAN RAYA', '11', '11'),
-('1116', '2025-09-01 19:45:53.959756', '2025-09-01 19:45:53.959756', 'Administrator', 'Administrator', 0, 0, '1116', 'KABUPATEN ACEH JAYA', '11', '11'),
-('1117', '2025-09-01 19:45:53.959777', '2025-09-01 19:45:53.959777', 'Administrator', 'Administrator', 0, 0, '1117', 'KABUPATEN BENER MERIAH', '11', '11'),
-('1118', '2025-09-01 19:45:53.959795', '2025-09-01 19:45:53.959795', 'Administrator', 'Administrator', 0, 0, '1118', 'KABUPATEN PIDIE JAYA', '11', '11'),
-('1171', '2025-09-01 19:45:53.959814', '2025-09-01 19:45:53.959814', 'Administrator', 'Administrator', 0, 0, '1171', 'KOTA BANDA ACEH', '11', '11'),
-('1172', '2025-09-01 19:45:53.959855', '2025-09-01 19:45:53.959855', 'Administrator', 'Administrator', 0, 0, '1172', 'KOTA SABANG', '11', '11'),
-('1173', '2025-09-01 19:45:53.959873', '2025-09-01 19:45:53.959873', 'Administrator', 'Administrator', 0, 0, '1173', 'KOTA LANGSA', '11', '11'),
-('1174', '2025-09-01 19:45:53.959889', '2025-09-01 19:45:53.959889', 'Administrator', 'Administrator', 0, 0, '1174', 'KOTA LHOKSEUMAWE', '11', '11'),
-('1175', '2025-09-01 19:45:53.959906', '2025-09-01 19:45:53.959906', 'Administrator', 'Administrator', 0, 0, '1175', 'KOTA SUBULUSSALAM', '11', '11'),
-('1201', '2025-09-01 19:45:53.959937', '2025-09-01 19:45:53.959937', 'Administrator', 'Administrator', 0, 0, '1201', 'KABUPATEN NIAS', '12', '12'),
-('1202', '2025-09-01 19:45:53.959962', '2025-09-01 19:45:53.959962', 'Administrator', 'Administrator', 0, 0, '1202', 'KABUPATEN MANDAILING NATAL', '12', '12'),
-('1203', '2025-09-01 19:45:53.960017', '2025-09-01 19:45:53.960017', 'Administrator', 'Administrator', 0, 0, '1203', 'KABUPATEN TAPANULI SELATAN', '12', '12'),
-('1204', '2025-09-01 19:45:53.960056', '2025-09-01 19:45:53.960056', 'Administrator', 'Administrator', 0, 0, '1204', 'KABUPATEN TAPANULI TENGAH', '12', '12'),
-('1205', '2025-09-01 19:45:53.960146', '2025-09-01 19:45:53.960146', 'Administrator', 'Administrator', 0, 0, '1205', 'KABUPATEN TAPANULI UTARA', '12', '12'),
-('1206', '2025-09-01 19:45:53.960169', '2025-09-01 19:45:53.960169', 'Administrator', 'Administrator', 0, 0, '1206', 'KABUPATEN TOBA SAMOSIR', '12', '12'),
-('1207', '2025-09-01 19:45:53.960192', '2025-09-01 19:45:53.960192', 'Administrator', 'Administrator', 0, 0, '1207', 'KABUPATEN LABUHAN BATU', '12', '12'),
-('1208', '2025-09-01 19:45:53.960212', '2025-09-01 19:45:53.960212', 'Administrator', 'Administrator', 0, 0, '1208', 'KABUPATEN ASAHAN', '12', '12'),
-('1209', '2025-09-01 19:45:53.960231', '2025-09-01 19:45:53.960231', 'Administrator', 'Administrator', 0, 0, '1209', 'KABUPATEN SIMALUNGUN', '12', '12'),
-('1210', '2025-09-01 19:45:53.960259', '2025-09-01 19:45:53.960259', 'Administrator', 'Administrator', 0, 0, '1210', 'KABUPATEN DAIRI', '12', '12'),
-('1211', '2025-09-01 19:45:53.960277', '2025-09-01 19:45:53.960277', 'Administrator', 'Administrator', 0, 0, '1211', 'KABUPATEN KARO', '12', '12'),
-('1212', '2025-09-01 19:45:53.960294', '2025-09-01 19:45:53.960294', 'Administrator', 'Administrator', 0, 0, '1212', 'KABUPATEN DELI SERDANG', '12', '12'),
-('1213', '2025-09-01 19:45:53.960310', '2025-09-01 19:45:53.960310', 'Administrator', 'Administrator', 0, 0, '1213', 'KABUPATEN LANGKAT', '12', '12'),
-('1214', '2025-09-01 19:45:53.960327', '2025-09-01 19:45:53.960327', 'Administrator', 'Administrator', 0, 0, '1214', 'KABUPATEN NIAS SELATAN', '12', '12'),
-('1215', '2025-09-01 19:45:53.960354', '2025-09-01 19:45:53.960354', 'Administrator', 'Administrator', 0, 0, '1215', 'KABUPATEN HUMBANG HASUNDUTAN', '12', '12'),
-('1216', '2025-09-01 19:45:53.960419', '2025-09-01 19:45:53.960419', 'Administrator', 'Administrator', 0, 0, '1216', 'KABUPATEN PAKPAK BHARAT', '12', '12'),
-('1217', '2025-09-01 19:45:53.960446', '2025-09-01 19:45:53.960446', 'Administrator', 'Administrator', 0, 0, '1217', 'KABUPATEN SAMOSIR', '12', '12'),
-('1218', '2025-09-01 19:45:53.960458', '2025-09-01 19:45:53.960458', 'Administrator', 'Administrator', 0, 0, '1218', 'KABUPATEN SERDANG BEDAGAI', '12', '12'),
-('1219', '2025-09-01 19:45:53.960465', '2025-09-01 19:45:53.960465', 'Administrator', 'Administrator', 0, 0, '1219', 'KABUPATEN BATU BARA', '12', '12'),
-('1220', '2025-09-01 19:45:53.960472', '2025-09-01 19:45:53.960472', 'Administrator', 'Administrator', 0, 0, '1220', 'KABUPATEN PADANG LAWAS UTARA', '12', '12'),
-('1221', '2025-09-01 19:45:53.960479', '2025-09-01 19:45:53.960479', 'Administrator', 'Administrator', 0, 0, '1221', 'KABUPATEN PADANG LAWAS', '12', '12'),
-('1222', '2025-09-01 19:45:53.960485', '2025-09-01 19:45:53.960485', 'Administrator', 'Administrator', 0, 0, '1222', 'KABUPATEN LABUHAN BATU SELATAN', '12', '12'),
-('1223', '2025-09-01 19:45:53.960492', '2025-09-01 19:45:53.960492', 'Administrator', 'Administrator', 0, 0, '1223', 'KABUPATEN LABUHAN BATU UTARA', '12', '12'),
-('1224', '2025-09-01 19:45:53.960498', '2025-09-01 19:45:53.960498', 'Administrator', 'Administrator', 0, 0, '1224', 'KABUPATEN NIAS UTARA', '12', '12'),
-('1225', '2025-09-01 19:45:53.960505', '2025-09-01 19:45:53.960505', 'Administrator', 'Administrator', 0, 0, '1225', 'KABUPATEN NIAS BARAT', '12', '12'),
-('1271', '2025-09-01 19:45:53.960511', '2025-09-01 19:45:53.960511', 'Administrator', 'Administrator', 0, 0, '1271', 'KOTA SIBOLGA', '12', '12'),
-('1272', '2025-09-01 19:45:53.960517', '2025-09-01 19:45:53.960517', 'Administrator', 'Administrator', 0, 0, '1272', 'KOTA TANJUNG BALAI', '12', '12'),
-('1273', '2025-09-01 19:45:53.960524', '2025-09-01 19:45:53.960524', 'Administrator', 'Administrator', 0, 0, '1273', 'KOTA PEMATANG SIANTAR', '12', '12'),
-('1274', '2025-09-01 19:45:53.960530', '2025-09-01 19:45:53.960530', 'Administrator', 'Administrator', 0, 0, '1274', 'KOTA TEBING TINGGI', '12', '12'),
-('1275', '2025-09-01 19:45:53.960536', '2025-09-01 19:45:53.960536', 'Administrator', 'Administrator', 0, 0, '1275', 'KOTA MEDAN', '12', '12'),
-('1276', '2025-09-01 19:45:53.960543', '2025-09-01 19:45:53.960543', 'Administrator', 'Administrator', 0, 0, '1276', 'KOTA BINJAI', '12', '12'),
-('1277', '2025-09-01 19:45:53.960550', '2025-09-01 19:45:53.960550', 'Administrator', 'Administrator', 0, 0, '1277', 'KOTA PADANGSIDIMPUAN', '12', '12'),
-('1278', '2025-09-01 19:45:53.960556', '2025-09-01 19:45:53.960556', 'Administrator', 'Administrator', 0, 0, '1278', 'KOTA GUNUNGSITOLI', '12', '12'),
-('1301', '2025-09-01 19:45:53.960570', '2025-09-01 19:45:53.960570', 'Administrator', 'Administrator', 0, 0, '1301', 'KABUPATEN KEPULAUAN MENTAWAI', '13', '13'),
-('1302', '2025-09-01 19:45:53.960580', '2025-09-01 19:45:53.960580', 'Administrator', 'Administrator', 0, 0, '1302', 'KABUPATEN PESISIR SELATAN', '13', '13'),
-('1303', '2025-09-01 19:45:53.960588', '2025-09-01 19:45:53.960588', 'Administrator', 'Administrator', 0, 0, '1303', 'KABUPATEN SOLOK', '13', '13'),
-('1304', '2025-09-01 19:45:53.960596', '2025-09-01 19:45:53.960596', 'Administrator', 'Administrator', 0, 0, '1304', 'KABUPATEN SIJUNJUNG', '13', '13'),
-('1305', '2025-09-01 19:45:53.960603', '2025-09-01 19:45:53.960603', 'Administrator', 'Administrator', 0, 0, '1305', 'KABUPATEN TANAH DATAR', '13', '13'),
-('1306', '2025-09-01 19:45:53.960609', '2025-09-01 19:45:53.960609', 'Administrator', 'Administrator', 0, 0, '1306', 'KABUPATEN PADANG PARIAMAN', '13', '13'),
-('1307', '2025-09-01 19:45:53.960679', '2025-09-01 19:45:53.960679', 'Administrator', 'Administrator', 0, 0, '1307', 'KABUPATEN AGAM', '13', '13'),
-('1308', '2025-09-01 19:45:53.960697', '2025-09-01 19:45:53.960697', 'Administrator', 'Administrator', 0, 0, '1308', 'KABUPATEN LIMA PULUH KOTA', '13', '13'),
-('1309', '2025-09-01 19:45:53.960705', '2025-09-01 19:45:53.960705', 'Administrator', 'Administrator', 0, 0, '1309', 'KABUPATEN PASAMAN', '13', '13'),
-('1310', '2025-09-01 19:45:53.960716', '2025-09-01 19:45:53.960716', 'Administrator', 'Administrator', 0, 0, '1310', 'KABUPATEN SOLOK SELATAN', '13', '13'),
-('1311', '2025-09-01 19:45:53.960723', '2025-09-01 19:45:53.960723', 'Administrator', 'Administrator', 0, 0, '1311', 'KABUPATEN DHARMASRAYA', '13', '13'),
-('1312', '2025-09-01 19:45:53.960730', '2025-09-01 19:45:53.960730', 'Administrator', 'Administrator', 0, 0, '1312', 'KABUPATEN PASAMAN BARAT', '13', '13'),
-('1371', '2025-09-01 19:45:53.960737', '2025-09-01 19:45:53.960737', 'Administrator', 'Administrator', 0, 0, '1371', 'KOTA PADANG', '13', '13'),
-('1372', '2025-09-01 19:45:53.960743', '2025-09-01 19:45:53.960743', 'Administrator', 'Administrator', 0, 0, '1372', 'KOTA SOLOK', '13', '13'),
-('1373', '2025-09-01 19:45:53.960750', '2025-09-01 19:45:53.960750', 'Administrator', 'Administrator', 0, 0, '1373', 'KOTA SAWAH LUNTO', '13', '13'),
-('1374', '2025-09-01 19:45:53.960756', '2025-09-01 19:45:53.960756', 'Administrator', 'Administrator', 0, 0, '1374', 'KOTA PADANG PANJANG', '13', '13'),
-('1375', '2025-09-01 19:45:53.960763', '2025-09-01 19:45:53.960763', 'Administrator', 'Administrator', 0, 0, '1375', 'KOTA BUKITTINGGI', '13', '13'),
-('1376', '2025-09-01 19:45:53.960776', '2025-09-01 19:45:53.960776', 'Administrator', 'Administrator', 0, 0, '1376', 'KOTA PAYAKUMBUH', '13', '13'),
-('1377', '2025-09-01 19:45:53.960783', '2025-09-01 19:45:53.960783', 'Administrator', 'Administrator', 0, 0, '1377', 'KOTA PARIAMAN', '13', '13'),
-('1401', '2025-09-01 19:45:53.960790', '2025-09-01 19:45:53.960790', 'Administrator', 'Administrator', 0, 0, '1401', 'KABUPATEN KUANTAN SINGINGI', '14', '14'),
-('1402', '2025-09-01 19:45:53.960796', '2025-09-01 19:45:53.960796', 'Administrator', 'Administrator', 0, 0, '1402', 'KABUPATEN INDRAGIRI HULU', '14', '14'),
-('1403', '2025-09-01 19:45:53.960805', '2025-09-01 19:45:53.960805', 'Administrator', 'Administrator', 0, 0, '1403', 'KABUPATEN INDRAGIRI HILIR', '14', '14'),
-('1404', '2025-09-01 19:45:53.960812', '2025-09-01 19:45:53.960812', 'Administrator', 'Administrator', 0, 0, '1404', 'KABUPATEN PELALAWAN', '14', '14'),
-('1405', '2025-09-01 19:45:53.960818', '2025-09-01 19:45:53.960818', 'Administrator', 'Administrator', 0, 0, '1405', 'KABUPATEN S I A K', '14', '14'),
-('1406', '2025-09-01 19:45:53.960824', '2025-09-01 19:45:53.960824', 'Administrator', 'Administrator', 0, 0, '1406', 'KABUPATEN KAMPAR', '14', '14'),
-('1407', '2025-09-01 19:45:53.960831', '2025-09-01 19:45:53.960831', 'Administrator', 'Administrator', 0, 0, '1407', 'KABUPATEN ROKAN HULU', '14', '14'),
-('1408', '2025-09-01 19:45:53.960837', '2025-09-01 19:45:53.960837', 'Administrator', 'Administrator', 0, 0, '1408', 'KABUPATEN BENGKALIS', '14', '14'),
-('1409', '2025-09-01 19:45:53.960843', '2025-09-01 19:45:53.960843', 'Administrator', 'Administrator', 0, 0, '1409', 'KABUPATEN ROKAN HILIR', '14', '14'),
-('1410', '2025-09-01 19:45:53.960850', '2025-09-01 19:45:53.960850', 'Administrator', 'Administrator', 0, 0, '1410', 'KABUPATEN KEPULAUAN MERANTI', '14', '14'),
-('1471', '2025-09-01 19:45:53.960856', '2025-09-01 19:45:53.960856', 'Administrator', 'Administrator', 0, 0, '1471', 'KOTA PEKANBARU', '14', '14'),
-('1473', '2025-09-01 19:45:53.960863', '2025-09-01 19:45:53.960863', 'Administrator', 'Administrator', 0, 0, '1473', 'KOTA D U M A I', '14', '14'),
-('1501', '2025-09-01 19:45:53.960869', '2025-09-01 19:45:53.960869', 'Administrator', 'Administrator', 0, 0, '1501', 'KABUPATEN KERINCI', '15', '15'),
-('1502', '2025-09-01 19:45:53.960875', '2025-09-01 19:45:53.960875', 'Administrator', 'Administrator', 0, 0, '1502', 'KABUPATEN MERANGIN', '15', '15'),
-('1503', '2025-09-01 19:45:53.960881', '2025-09-01 19:45:53.960881', 'Administrator', 'Administrator', 0, 0, '1503', 'KABUPATEN SAROLANGUN', '15', '15'),
-('1504', '2025-09-01 19:45:53.960888', '2025-09-01 19:45:53.960888', 'Administrator', 'Administrator', 0, 0, '1504', 'KABUPATEN BATANG HARI', '15', '15'),
-('1505', '2025-09-01 19:45:53.960899', '2025-09-01 19:45:53.960899', 'Administrator', 'Administrator', 0, 0, '1505', 'KABUPATEN MUARO JAMBI', '15', '15'),
-('1506', '2025-09-01 19:45:53.960906', '2025-09-01 19:45:53.960906', 'Administrator', 'Administrator', 0, 0, '1506', 'KABUPATEN TANJUNG JABUNG TIMUR', '15', '15'),
-('1507', '2025-09-01 19:45:53.960914', '2025-09-01 19:45:53.960914', 'Administrator', 'Administrator', 0, 0, '1507', 'KABUPATEN TANJUNG JABUNG BARAT', '15', '15'),
-('1508', '2025-09-01 19:45:53.960922', '2025-09-01 19:45:53.960922', 'Administrator', 'Administrator', 0, 0, '1508', 'KABUPATEN TEBO', '15', '15'),
-('1509', '2025-09-01 19:45:53.960928', '2025-09-01 19:45:53.960928', 'Administrator', 'Administrator', 0, 0, '1509', 'KABUPATEN BUNGO', '15', '15'),
-('1571', '2025-09-01 19:45:53.960935', '2025-09-01 19:45:53.960935', 'Administrator', 'Administrator', 0, 0, '1571', 'KOTA JAMBI', '15', '15'),
-('1572', '2025-09-01 19:45:53.960941', '2025-09-01 19:45:53.960941', 'Administrator', 'Administrator', 0, 0, '1572', 'KOTA SUNGAI PENUH', '15', '15'),
-('1601', '2025-09-01 19:45:53.960948', '2025-09-01 19:45:53.960948', 'Administrator', 'Administrator', 0, 0, '1601', 'KABUPATEN OGAN KOMERING ULU', '16', '16'),
-('1602', '2025-09-01 19:45:53.960954', '2025-09-01 19:45:53.960954', 'Administrator', 'Administrator', 0, 0, '1602', 'KABUPATEN OGAN KOMERING ILIR', '16', '16'),
-('1603', '2025-09-01 19:45:53.960960', '2025-09-01 19:45:53.960960', 'Administrator', 'Administrator', 0, 0, '1603', 'KABUPATEN MUARA ENIM', '16', '16'),
-('1604', '2025-09-01 19:45:53.960978', '2025-09-01 19:45:53.960978', 'Administrator', 'Administrator', 0, 0, '1604', 'KABUPATEN LAHAT', '16', '16'),
-('1605', '2025-09-01 19:45:53.960985', '2025-09-01 19:45:53.960985', 'Administrator', 'Administrator', 0, 0, '1605', 'KABUPATEN MUSI RAWAS', '16', '16'),
-('1606', '2025-09-01 19:45:53.960991', '2025-09-01 19:45:53.960991', 'Administrator', 'Administrator', 0, 0, '1606', 'KABUPATEN MUSI BANYUASIN', '16', '16'),
-('1607', '2025-09-01 19:45:53.960997', '2025-09-01 19:45:53.960997', 'Administrator', 'Administrator', 0, 0, '1607', 'KABUPATEN BANYU ASIN', '16', '16'),
-('1608', '2025-09-01 19:45:53.961004', '2025-09-01 19:45:53.961004', 'Administrator', 'Administrator', 0, 0, '1608', 'KABUPATEN OGAN KOMERING ULU SELATAN', '16', '16'),
-('1609', '2025-09-01 19:45:53.961011', '2025-09-01 19:45:53.961011', 'Administrator', 'Administrator', 0, 0, '1609', 'KABUPATEN OGAN KOMERING ULU TIMUR', '16', '16'),
-('1610', '2025-09-01 19:45:53.961027', '2025-09-01 19:45:53.961027', 'Administrator', 'Administrator', 0, 0, '1610', 'KABUPATEN OGAN ILIR', '16', '16'),
-('1611', '2025-09-01 19:45:53.961038', '2025-09-01 19:45:53.961038', 'Administrator', 'Administrator', 0, 0, '1611', 'KABUPATEN EMPAT LAWANG', '16', '16'),
-('1612', '2025-09-01 19:45:53.961047', '2025-09-01 19:45:53.961047', 'Administrator', 'Administrator', 0, 0, '1612', 'KABUPATEN PENUKAL ABAB LEMATANG ILIR', '16', '16'),
-('1613', '2025-09-01 19:45:53.961053', '2025-09-01 19:45:53.961053', 'Administrator', 'Administrator', 0, 0, '1613', 'KABUPATEN MUSI RAWAS UTARA', '16', '16'),
-('1671', '2025-09-01 19:45:53.961060', '2025-09-01 19:45:53.961060', 'Administrator', 'Administrator', 0, 0, '1671', 'KOTA PALEMBANG', '16', '16'),
-('1672', '2025-09-01 19:45:53.961066', '2025-09-01 19:45:53.961066', 'Administrator', 'Administrator', 0, 0, '1672', 'KOTA PRABUMULIH', '16', '16'),
-('1673', '2025-09-01 19:45:53.961073', '2025-09-01 19:45:53.961073', 'Administrator', 'Administrator', 0, 0, '1673', 'KOTA PAGAR ALAM', '16', '16'),
-('1674', '2025-09-01 19:45:53.961079', '2025-09-01 19:45:53.961079', 'Administrator', 'Administrator', 0, 0, '1674', 'KOTA LUBUKLINGGAU', '16', '16'),
-('1701', '2025-09-01 19:45:53.961086', '2025-09-01 19:45:53.961086', 'Administrator', 'Administrator', 0, 0, '1701', 'KABUPATEN BENGKULU SELATAN', '17', '17'),
-('1702', '2025-09-01 19:45:53.961092', '2025-09-01 19:45:53.961092', 'Administrator', 'Administrator', 0, 0, '1702', 'KABUPATEN REJANG LEBONG', '17', '17'),
-('1703', '2025-09-01 19:45:53.961099', '2025-09-01 19:45:53.961099', 'Administrator', 'Administrator', 0, 0, '1703', 'KABUPATEN BENGKULU UTARA', '17', '17'),
-('1704', '2025-09-01 19:45:53.961105', '2025-09-01 19:45:53.961105', 'Administrator', 'Administrator', 0, 0, '1704', 'KABUPATEN KAUR', '17', '17'),
-('1705', '2025-09-01 19:45:53.961111', '2025-09-01 19:45:53.961111', 'Administrator', 'Administrator', 0, 0, '1705', 'KABUPATEN SELUMA', '17', '17'),
-('1706', '2025-09-01 19:45:53.961118', '2025-09-01 19:45:53.961118', 'Administrator', 'Administrator', 0, 0, '1706', 'KABUPATEN MUKOMUKO', '17', '17'),
-('1707', '2025-09-01 19:45:53.961124', '2025-09-01 19:45:53.961124', 'Administrator', 'Administrator', 0, 0, '1707', 'KABUPATEN LEBONG', '17', '17'),
-('1708', '2025-09-01 19:45:53.961130', '2025-09-01 19:45:53.961130', 'Administrator', 'Administrator', 0, 0, '1708', 'KABUPATEN KEPAHIANG', '17', '17'),
-('1709', '2025-09-01 19:45:53.961136', '2025-09-01 19:45:53.961136', 'Administrator', 'Administrator', 0, 0, '1709', 'KABUPATEN BENGKULU TENGAH', '17', '17'),
-('1771', '2025-09-01 19:45:53.961154', '2025-09-01 19:45:53.961154', 'Administrator', 'Administrator', 0, 0, '1771', 'KOTA BENGKULU', '17', '17'),
-('1801', '2025-09-01 19:45:53.961166', '2025-09-01 19:45:53.961166', 'Administrator', 'Administrator', 0, 0, '1801', 'KABUPATEN LAMPUNG BARAT', '18', '18'),
-('1802', '2025-09-01 19:45:53.961173', '2025-09-01 19:45:53.961173', 'Administrator', 'Administrator', 0, 0, '1802', 'KABUPATEN TANGGAMUS', '18', '18'),
-('1803', '2025-09-01 19:45:53.961179', '2025-09-01 19:45:53.961179', 'Administrator', 'Administrator', 0, 0, '1803', 'KABUPATEN LAMPUNG SELATAN', '18', '18'),
-('1804', '2025-09-01 19:45:53.961186', '2025-09-01 19:45:53.961186', 'Administrator', 'Administrator', 0, 0, '1804', 'KABUPATEN LAMPUNG TIMUR', '18', '18'),
-('1805', '2025-09-01 19:45:53.961193', '2025-09-01 19:45:53.961193', 'Administrator', 'Administrator', 0, 0, '1805', 'KABUPATEN LAMPUNG TENGAH', '18', '18'),
-('1806', '2025-09-01 19:45:53.961204', '2025-09-01 19:45:53.961204', 'Administrator', 'Administrator', 0, 0, '1806', 'KABUPATEN LAMPUNG UTARA', '18', '18'),
-('1807', '2025-09-01 19:45:53.961211', '2025-09-01 19:45:53.961211', 'Administrator', 'Administrator', 0, 0, '1807', 'KABUPATEN WAY KANAN', '18', '18'),
-('1808', '2025-09-01 19:45:53.961217', '2025-09-01 19:45:53.961217', 'Administrator', 'Administrator', 0, 0, '1808', 'KABUPATEN TULANGBAWANG', '18', '18'),
-('1809', '2025-09-01 19:45:53.961223', '2025-09-01 19:45:53.961223', 'Administrator', 'Administrator', 0, 0, '1809', 'KABUPATEN PESAWARAN', '18', '18'),
-('1810', '2025-09-01 19:45:53.961230', '2025-09-01 19:45:53.961230', 'Administrator', 'Administrator', 0, 0, '1810', 'KABUPATEN PRINGSEWU', '18', '18'),
-('1811', '2025-09-01 19:45:53.961236', '2025-09-01 19:45:53.961236', 'Administrator', 'Administrator', 0, 0, '1811', 'KABUPATEN MESUJI', '18', '18'),
-('1812', '2025-09-01 19:45:53.961242', '2025-09-01 19:45:53.961242', 'Administrator', 'Administrator', 0, 0, '1812', 'KABUPATEN TULANG BAWANG BARAT', '18', '18'),
-('1813', '2025-09-01 19:45:53.961249', '2025-09-01 19:45:53.961249', 'Administrator', 'Administrator', 0, 0, '1813', 'KABUPATEN PESISIR BARAT', '18', '18'),
-('1871', '2025-09-01 19:45:53.961255', '2025-09-01 19:45:53.961255', 'Administrator', 'Administrator', 0, 0, '1871', 'KOTA BANDAR LAMPUNG', '18', '18'),
-('1872', '2025-09-01 19:45:53.961262', '2025-09-01 19:45:53.961262', 'Administrator', 'Administrator', 0, 0, '1872', 'KOTA METRO', '18', '18'),
-('1901', '2025-09-01 19:45:53.961268', '2025-09-01 19:45:53.961268', 'Administrator', 'Administrator', 0, 0, '1901', 'KABUPATEN BANGKA', '19', '19'),
-('1902', '2025-09-01 19:45:53.961291', '2025-09-01 19:45:53.961291', 'Administrator', 'Administrator', 0, 0, '1902', 'KABUPATEN BELITUNG', '19', '19'),
-('1903', '2025-09-01 19:45:53.961304', '2025-09-01 19:45:53.961304', 'Administrator', 'Administrator', 0, 0, '1903', 'KABUPATEN BANGKA BARAT', '19', '19'),
-('1904', '2025-09-01 19:45:53.961310', '2025-09-01 19:45:53.961310', 'Administrator', 'Administrator', 0, 0, '1904', 'KABUPATEN BANGKA TENGAH', '19', '19'),
-('1905', '2025-09-01 19:45:53.961317', '2025-09-01 19:45:53.961317', 'Administrator', 'Administrator', 0, 0, '1905', 'KABUPATEN BANGKA SELATAN', '19', '19'),
-('1906', '2025-09-01 19:45:53.961323', '2025-09-01 19:45:53.961323', 'Administrator', 'Administrator', 0, 0, '1906', 'KABUPATEN BELITUNG TIMUR', '19', '19'),
-('1971', '2025-09-01 19:45:53.961329', '2025-09-01 19:45:53.961329', 'Administrator', 'Administrator', 0, 0, '1971', 'KOTA PANGKAL PINANG', '19', '19'),
-('2101', '2025-09-01 19:45:53.961335', '2025-09-01 19:45:53.961335', 'Administrator', 'Administrator', 0, 0, '2101', 'KABUPATEN KARIMUN', '21', '21'),
-('2102', '2025-09-01 19:45:53.961342', '2025-09-01 19:45:53.961342', 'Administrator', 'Administrator', 0, 0, '2102', 'KABUPATEN BINTAN', '21', '21'),
-('2103', '2025-09-01 19:45:53.961349', '2025-09-01 19:45:53.961349', 'Administrator', 'Administrator', 0, 0, '2103', 'KABUPATEN NATUNA', '21', '21'),
-('2104', '2025-09-01 19:45:53.961356', '2025-09-01 19:45:53.961356', 'Administrator', 'Administrator', 0, 0, '2104', 'KABUPATEN LINGGA', '21', '21'),
-('2105', '2025-09-01 19:45:53.961362', '2025-09-01 19:45:53.961362', 'Administrator', 'Administrator', 0, 0, '2105', 'KABUPATEN KEPULAUAN ANAMBAS', '21', '21'),
-('2171', '2025-09-01 19:45:53.961369', '2025-09-01 19:45:53.961369', 'Administrator', 'Administrator', 0, 0, '2171', 'KOTA B A T A M', '21', '21'),
-('2172', '2025-09-01 19:45:53.961375', '2025-09-01 19:45:53.961375', 'Administrator', 'Administrator', 0, 0, '2172', 'KOTA TANJUNG PINANG', '21', '21'),
-('3101', '2025-09-01 19:45:53.961382', '2025-09-01 19:45:53.961382', 'Administrator', 'Administrator', 0, 0, '3101', 'KABUPATEN KEPULAUAN SERIBU', '31', '31'),
-('3171', '2025-09-01 19:45:53.961388', '2025-09-01 19:45:53.961388', 'Administrator', 'Administrator', 0, 0, '3171', 'KOTA JAKARTA SELATAN', '31', '31'),
-('3172', '2025-09-01 19:45:53.961394', '2025-09-01 19:45:53.961394', 'Administrator', 'Administrator', 0, 0, '3172', 'KOTA JAKARTA TIMUR', '31', '31'),
-('3173', '2025-09-01 19:45:53.961401', '2025-09-01 19:45:53.961401', 'Administrator', 'Administrator', 0, 0, '3173', 'KOTA JAKARTA PUSAT', '31', '31'),
-('3174', '2025-09-01 19:45:53.961408', '2025-09-01 19:45:53.961408', 'Administrator', 'Administrator', 0, 0, '3174', 'KOTA JAKARTA BARAT', '31', '31'),
-('3175', '2025-09-01 19:45:53.961433', '2025-09-01 19:45:53.961433', 'Administrator', 'Administrator', 0, 0, '3175', 'KOTA JAKARTA UTARA', '31', '31'),
-('3201', '2025-09-01 19:45:53.961446', '2025-09-01 19:45:53.961446', 'Administrator', 'Administrator', 0, 0, '3201', 'KABUPATEN BOGOR', '32', '32'),
-('3202', '2025-09-01 19:45:53.961452', '2025-09-01 19:45:53.961452', 'Administrator', 'Administrator', 0, 0, '3202', 'KABUPATEN SUKABUMI', '32', '32'),
-('3203', '2025-09-01 19:45:53.961458', '2025-09-01 19:45:53.961458', 'Administrator', 'Administrator', 0, 0, '3203', 'KABUPATEN CIANJUR', '32', '32'),
-('3204', '2025-09-01 19:45:53.961465', '2025-09-01 19:45:53.961465', 'Administrator', 'Administrator', 0, 0, '3204', 'KABUPATEN BANDUNG', '32', '32'),
-('3205', '2025-09-01 19:45:53.961471', '2025-09-01 19:45:53.961471', 'Administrator', 'Administrator', 0, 0, '3205', 'KABUPATEN GARUT', '32', '32'),
-('3206', '2025-09-01 19:45:53.961478', '2025-09-01 19:45:53.961478', 'Administrator', 'Administrator', 0, 0, '3206', 'KABUPATEN TASIKMALAYA', '32', '32'),
-('3207', '2025-09-01 19:45:53.961484', '2025-09-01 19:45:53.961484', 'Administrator', 'Administrator', 0, 0, '3207', 'KABUPATEN CIAMIS', '32', '32'),
-('3208', '2025-09-01 19:45:53.961490', '2025-09-01 19:45:53.961490', 'Administrator', 'Administrator', 0, 0, '3208', 'KABUPATEN KUNINGAN', '32', '32'),
-('3209', '2025-09-01 19:45:53.961497', '2025-09-01 19:45:53.961497', 'Administrator', 'Administrator', 0, 0, '3209', 'KABUPATEN CIREBON', '32', '32'),
-('3210', '2025-09-01 19:45:53.961503', '2025-09-01 19:45:53.961503', 'Administrator', 'Administrator', 0, 0, '3210', 'KABUPATEN MAJALENGKA', '32', '32'),
-('3211', '2025-09-01 19:45:53.961510', '2025-09-01 19:45:53.961510', 'Administrator', 'Administrator', 0, 0, '3211', 'KABUPATEN SUMEDANG', '32', '32'),
-('3212', '2025-09-01 19:45:53.961516', '2025-09-01 19:45:53.961516', 'Administrator', 'Administrator', 0, 0, '3212', 'KABUPATEN INDRAMAYU', '32', '32'),
-('3213', '2025-09-01 19:45:53.961522', '2025-09-01 19:45:53.961522', 'Administrator', 'Administrator', 0, 0, '3213', 'KABUPATEN SUBANG', '32', '32'),
-('3214', '2025-09-01 19:45:53.961530', '2025-09-01 19:45:53.961530', 'Administrator', 'Administrator', 0, 0, '3214', 'KABUPATEN PURWAKARTA', '32', '32'),
-('3215', '2025-09-01 19:45:53.961536', '2025-09-01 19:45:53.961536', 'Administrator', 'Administrator', 0, 0, '3215', 'KABUPATEN KARAWANG', '32', '32'),
-('3216', '2025-09-01 19:45:53.961562', '2025-09-01 19:45:53.961562', 'Administrator', 'Administrator', 0, 0, '3216', 'KABUPATEN BEKASI', '32', '32'),
-('3217', '2025-09-01 19:45:53.961575', '2025-09-01 19:45:53.961575', 'Administrator', 'Administrator', 0, 0, '3217', 'KABUPATEN BANDUNG BARAT', '32', '32'),
-('3218', '2025-09-01 19:45:53.961581', '2025-09-01 19:45:53.961581', 'Administrator', 'Administrator', 0, 0, '3218', 'KABUPATEN PANGANDARAN', '32', '32'),
-('3271', '2025-09-01 19:45:53.961588', '2025-09-01 19:45:53.961588', 'Administrator', 'Administrator', 0, 0, '3271', 'KOTA BOGOR', '32', '32'),
-('3272', '2025-09-01 19:45:53.961594', '2025-09-01 19:45:53.961594', 'Administrator', 'Administrator', 0, 0, '3272', 'KOTA SUKABUMI', '32', '32'),
-('3273', '2025-09-01 19:45:53.961600', '2025-09-01 19:45:53.961600', 'Administrator', 'Administrator', 0, 0, '3273', 'KOTA BANDUNG', '32', '32'),
-('3274', '2025-09-01 19:45:53.961607', '2025-09-01 19:45:53.961607', 'Administrator', 'Administrator', 0, 0, '3274', 'KOTA CIREBON', '32', '32'),
-('3275', '2025-09-01 19:45:53.961613', '2025-09-01 19:45:53.961613', 'Administrator', 'Administrator', 0, 0, '3275', 'KOTA BEKASI', '32', '32'),
-('3276', '2025-09-01 19:45:53.961619', '2025-09-01 19:45:53.961619', 'Administrator', 'Administrator', 0, 0, '3276', 'KOTA DEPOK', '32', '32'),
-('3277', '2025-09-01 19:45:53.961625', '2025-09-01 19:45:53.961625', 'Administrator', 'Administrator', 0, 0, '3277', 'KOTA CIMAHI', '32', '32'),
-('3278', '2025-09-01 19:45:53.961631', '2025-09-01 19:45:53.961631', 'Administrator', 'Administrator', 0, 0, '3278', 'KOTA TASIKMALAYA', '32', '32'),
-('3279', '2025-09-01 19:45:53.961637', '2025-09-01 19:45:53.961637', 'Administrator', 'Administrator', 0, 0, '3279', 'KOTA BANJAR', '32', '32'),
-('3301', '2025-09-01 19:45:53.961644', '2025-09-01 19:45:53.961644', 'Administrator', 'Administrator', 0, 0, '3301', 'KABUPATEN CILACAP', '33', '33'),
-('3302', '2025-09-01 19:45:53.961650', '2025-09-01 19:45:53.961650', 'Administrator', 'Administrator', 0, 0, '3302', 'KABUPATEN BANYUMAS', '33', '33'),
-('3303', '2025-09-01 19:45:53.961656', '2025-09-01 19:45:53.961656', 'Administrator', 'Administrator', 0, 0, '3303', 'KABUPATEN PURBALINGGA', '33', '33'),
-('3304', '2025-09-01 19:45:53.961663', '2025-09-01 19:45:53.961663', 'Administrator', 'Administrator', 0, 0, '3304', 'KABUPATEN BANJARNEGARA', '33', '33'),
-('3305', '2025-09-01 19:45:53.961669', '2025-09-01 19:45:53.961669', 'Administrator', 'Administrator', 0, 0, '3305', 'KABUPATEN KEBUMEN', '33', '33'),
-('3306', '2025-09-01 19:45:53.961688', '2025-09-01 19:45:53.961688', 'Administrator', 'Administrator', 0, 0, '3306', 'KABUPATEN PURWOREJO', '33', '33'),
-('3307', '2025-09-01 19:45:53.961699', '2025-09-01 19:45:53.961699', 'Administrator', 'Administrator', 0, 0, '3307', 'KABUPATEN WONOSOBO', '33', '33'),
-('3308', '2025-09-01 19:45:53.961706', '2025-09-01 19:45:53.961706', 'Administrator', 'Administrator', 0, 0, '3308', 'KABUPATEN MAGELANG', '33', '33'),
-('3309', '2025-09-01 19:45:53.961712', '2025-09-01 19:45:53.961712', 'Administrator', 'Administrator', 0, 0, '3309', 'KABUPATEN BOYOLALI', '33', '33'),
-('3310', '2025-09-01 19:45:53.961719', '2025-09-01 19:45:53.961719', 'Administrator', 'Administrator', 0, 0, '3310', 'KABUPATEN KLATEN', '33', '33'),
-('3311', '2025-09-01 19:45:53.961725', '2025-09-01 19:45:53.961725', 'Administrator', 'Administrator', 0, 0, '3311', 'KABUPATEN SUKOHARJO', '33', '33'),
-('3312', '2025-09-01 19:45:53.961731', '2025-09-01 19:45:53.961731', 'Administrator', 'Administrator', 0, 0, '3312', 'KABUPATEN WONOGIRI', '33', '33'),
-('3313', '2025-09-01 19:45:53.961737', '2025-09-01 19:45:53.961737', 'Administrator', 'Administrator', 0, 0, '3313', 'KABUPATEN KARANGANYAR', '33', '33'),
-('3314', '2025-09-01 19:45:53.961744', '2025-09-01 19:45:53.961744', 'Administrator', 'Administrator', 0, 0, '3314', 'KABUPATEN SRAGEN', '33', '33'),
-('3315', '2025-09-01 19:45:53.961755', '2025-09-01 19:45:53.961755', 'Administrator', 'Administrator', 0, 0, '3315', 'KABUPATEN GROBOGAN', '33', '33'),
-('3316', '2025-09-01 19:45:53.961766', '2025-09-01 19:45:53.961766', 'Administrator', 'Administrator', 0, 0, '3316', 'KABUPATEN BLORA', '33', '33'),
-('3317', '2025-09-01 19:45:53.961776', '2025-09-01 19:45:53.961776', 'Administrator', 'Administrator', 0, 0, '3317', 'KABUPATEN REMBANG', '33', '33'),
-('3318', '2025-09-01 19:45:53.961782', '2025-09-01 19:45:53.961782', 'Administrator', 'Administrator', 0, 0, '3318', 'KABUPATEN PATI', '33', '33'),
-('3319', '2025-09-01 19:45:53.961788', '2025-09-01 19:45:53.961788', 'Administrator', 'Administrator', 0, 0, '3319', 'KABUPATEN KUDUS', '33', '33'),
-('3320', '2025-09-01 19:45:53.961794', '2025-09-01 19:45:53.961794', 'Administrator', 'Administrator', 0, 0, '3320', 'KABUPATEN JEPARA', '33', '33'),
-('3321', '2025-09-01 19:45:53.961800', '2025-09-01 19:45:53.961800', 'Administrator', 'Administrator', 0, 0, '3321', 'KABUPATEN DEMAK', '33', '33'),
-('3322', '2025-09-01 19:45:53.961807', '2025-09-01 19:45:53.961807', 'Administrator', 'Administrator', 0, 0, '3322', 'KABUPATEN SEMARANG', '33', '33'),
-('3323', '2025-09-01 19:45:53.961832', '2025-09-01 19:45:53.961832', 'Administrator', 'Administrator', 0, 0, '3323', 'KABUPATEN TEMANGGUNG', '33', '33'),
-('3324', '2025-09-01 19:45:53.961843', '2025-09-01 19:45:53.961843', 'Administrator', 'Administrator', 0, 0, '3324', 'KABUPATEN KENDAL', '33', '33'),
-('3325', '2025-09-01 19:45:53.961849', '2025-09-01 19:45:53.961849', 'Administrator', 'Administrator', 0, 0, '3325', 'KABUPATEN BATANG', '33', '33'),
-('3326', '2025-09-01 19:45:53.961856', '2025-09-01 19:45:53.961856', 'Administrator', 'Administrator', 0, 0, '3326', 'KABUPATEN PEKALONGAN', '33', '33'),
-('3327', '2025-09-01 19:45:53.961862', '2025-09-01 19:45:53.961862', 'Administrator', 'Administrator', 0, 0, '3327', 'KABUPATEN PEMALANG', '33', '33'),
-('3328', '2025-09-01 19:45:53.961868', '2025-09-01 19:45:53.961868', 'Administrator', 'Administrator', 0, 0, '3328', 'KABUPATEN TEGAL', '33', '33'),
-('3329', '2025-09-01 19:45:53.961875', '2025-09-01 19:45:53.961875', 'Administrator', 'Administrator', 0, 0, '3329', 'KABUPATEN BREBES', '33', '33'),
-('3371', '2025-09-01 19:45:53.961881', '2025-09-01 19:45:53.961881', 'Administrator', 'Administrator', 0, 0, '3371', 'KOTA MAGELANG', '33', '33'),
-('3372', '2025-09-01 19:45:53.961888', '2025-09-01 19:45:53.961888', 'Administrator', 'Administrator', 0, 0, '3372', 'KOTA SURAKARTA', '33', '33'),
-('3373', '2025-09-01 19:45:53.961894', '2025-09-01 19:45:53.961894', 'Administrator', 'Administrator', 0, 0, '3373', 'KOTA SALATIGA', '33', '33'),
-('3374', '2025-09-01 19:45:53.961901', '2025-09-01 19:45:53.961901', 'Administrator', 'Administrator', 0, 0, '3374', 'KOTA SEMARANG', '33', '33'),
-('3375', '2025-09-01 19:45:53.961908', '2025-09-01 19:45:53.961908', 'Administrator', 'Administrator', 0, 0, '3375', 'KOTA PEKALONGAN', '33', '33'),
-('3376', '2025-09-01 19:45:53.961915', '2025-09-01 19:45:53.961915', 'Administrator', 'Administrator', 0, 0, '3376', 'KOTA TEGAL', '33', '33'),
-('3401', '2025-09-01 19:45:53.961922', '2025-09-01 19:45:53.961922', 'Administrator', 'Administrator', 0, 0, '3401', 'KABUPATEN KULON PROGO', '34', '34'),
-('3402', '2025-09-01 19:45:53.961928', '2025-09-01 19:45:53.961928', 'Administrator', 'Administrator', 0, 0, '3402', 'KABUPATEN BANTUL', '34', '34'),
-('3403', '2025-09-01 19:45:53.961935', '2025-09-01 19:45:53.961935', 'Administrator', 'Administrator', 0, 0, '3403', 'KABUPATEN GUNUNG KIDUL', '34', '34'),
-('3404', '2025-09-01 19:45:53.961941', '2025-09-01 19:45:53.961941', 'Administrator', 'Administrator', 0, 0, '3404', 'KABUPATEN SLEMAN', '34', '34'),
-('3471', '2025-09-01 19:45:53.961947', '2025-09-01 19:45:53.961947', 'Administrator', 'Administrator', 0, 0, '3471', 'KOTA YOGYAKARTA', '34', '34'),
-('3501', '2025-09-01 19:45:53.961982', '2025-09-01 19:45:53.961982', 'Administrator', 'Administrator', 0, 0, '3501', 'KABUPATEN PACITAN', '35', '35'),
-('3502', '2025-09-01 19:45:53.961994', '2025-09-01 19:45:53.961994', 'Administrator', 'Administrator', 0, 0, '3502', 'KABUPATEN PONOROGO', '35', '35'),
-('3503', '2025-09-01 19:45:53.962000', '2025-09-01 19:45:53.962000', 'Administrator', 'Administrator', 0, 0, '3503', 'KABUPATEN TRENGGALEK', '35', '35'),
-('3504', '2025-09-01 19:45:53.962008', '2025-09-01 19:45:53.962008', 'Administrator', 'Administrator', 0, 0, '3504', 'KABUPATEN TULUNGAGUNG', '35', '35'),
-('3505', '2025-09-01 19:45:53.962014', '2025-09-01 19:45:53.962014', 'Administrator', 'Administrator', 0, 0, '3505', 'KABUPATEN BLITAR', '35', '35'),
-('3506', '2025-09-01 19:45:53.962021', '2025-09-01 19:45:53.962021', 'Administrator', 'Administrator', 0, 0, '3506', 'KABUPATEN KEDIRI', '35', '35'),
-('3507', '2025-09-01 19:45:53.962028', '2025-09-01 19:45:53.962028', 'Administrator', 'Administrator', 0, 0, '3507', 'KABUPATEN MALANG', '35', '35'),
-('3508', '2025-09-01 19:45:53.962035', '2025-09-01 19:45:53.962035', 'Administrator', 'Administrator', 0, 0, '3508', 'KABUPATEN LUMAJANG', '35', '35'),
-('3509', '2025-09-01 19:45:53.962041', '2025-09-01 19:45:53.962041', 'Administrator', 'Administrator', 0, 0, '3509', 'KABUPATEN JEMBER', '35', '35'),
-('3510', '2025-09-01 19:45:53.962047', '2025-09-01 19:45:53.962047', 'Administrator', 'Administrator', 0, 0, '3510', 'KABUPATEN BANYUWANGI', '35', '35'),
-('3511', '2025-09-01 19:45:53.962053', '2025-09-01 19:45:53.962053', 'Administrator', 'Administrator', 0, 0, '3511', 'KABUPATEN BONDOWOSO', '35', '35'),
-('3512', '2025-09-01 19:45:53.962060', '2025-09-01 19:45:53.962060', 'Administrator', 'Administrator', 0, 0, '3512', 'KABUPATEN SITUBONDO', '35', '35'),
-('3513', '2025-09-01 19:45:53.962066', '2025-09-01 19:45:53.962066', 'Administrator', 'Administrator', 0, 0, '3513', 'KABUPATEN PROBOLINGGO', '35', '35'),
-('3514', '2025-09-01 19:45:53.962072', '2025-09-01 19:45:53.962072', 'Administrator', 'Administrator', 0, 0, '3514', 'KABUPATEN PASURUAN', '35', '35'),
-('3515', '2025-09-01 19:45:53.962079', '2025-09-01 19:45:53.962079', 'Administrator', 'Administrator', 0, 0, '3515', 'KABUPATEN SIDOARJO', '35', '35'),
-('3516', '2025-09-01 19:45:53.962085', '2025-09-01 19:45:53.962085', 'Administrator', 'Administrator', 0, 0, '3516', 'KABUPATEN MOJOKERTO', '35', '35'),
-('3517', '2025-09-01 19:45:53.962110', '2025-09-01 19:45:53.962110', 'Administrator', 'Administrator', 0, 0, '3517', 'KABUPATEN JOMBANG', '35', '35'),
-('3518', '2025-09-01 19:45:53.962120', '2025-09-01 19:45:53.962120', 'Administrator', 'Administrator', 0, 0, '3518', 'KABUPATEN NGANJUK', '35', '35'),
-('3519', '2025-09-01 19:45:53.962128', '2025-09-01 19:45:53.962128', 'Administrator', 'Administrator', 0, 0, '3519', 'KABUPATEN MADIUN', '35', '35'),
-('3520', '2025-09-01 19:45:53.962135', '2025-09-01 19:45:53.962135', 'Administrator', 'Administrator', 0, 0, '3520', 'KABUPATEN MAGETAN', '35', '35'),
-('3521', '2025-09-01 19:45:53.962143', '2025-09-01 19:45:53.962143', 'Administrator', 'Administrator', 0, 0, '3521', 'KABUPATEN NGAWI', '35', '35'),
-('3522', '2025-09-01 19:45:53.962156', '2025-09-01 19:45:53.962156', 'Administrator', 'Administrator', 0, 0, '3522', 'KABUPATEN BOJONEGORO', '35', '35'),
-('3523', '2025-09-01 19:45:53.962162', '2025-09-01 19:45:53.962162', 'Administrator', 'Administrator', 0, 0, '3523', 'KABUPATEN TUBAN', '35', '35'),
-('3524', '2025-09-01 19:45:53.962169', '2025-09-01 19:45:53.962169', 'Administrator', 'Administrator', 0, 0, '3524', 'KABUPATEN LAMONGAN', '35', '35'),
-('3525', '2025-09-01 19:45:53.962175', '2025-09-01 19:45:53.962175', 'Administrator', 'Administrator', 0, 0, '3525', 'KABUPATEN GRESIK', '35', '35'),
-('3526', '2025-09-01 19:45:53.962181', '2025-09-01 19:45:53.962181', 'Administrator', 'Administrator', 0, 0, '3526', 'KABUPATEN BANGKALAN', '35', '35'),
-('3527', '2025-09-01 19:45:53.962188', '2025-09-01 19:45:53.962188', 'Administrator', 'Administrator', 0, 0, '3527', 'KABUPATEN SAMPANG', '35', '35'),
-('3528', '2025-09-01 19:45:53.962195', '2025-09-01 19:45:53.962195', 'Administrator', 'Administrator', 0, 0, '3528', 'KABUPATEN PAMEKASAN', '35', '35'),
-('3529', '2025-09-01 19:45:53.962202', '2025-09-01 19:45:53.962202', 'Administrator', 'Administrator', 0, 0, '3529', 'KABUPATEN SUMENEP', '35', '35'),
-('3571', '2025-09-01 19:45:53.962208', '2025-09-01 19:45:53.962208', 'Administrator', 'Administrator', 0, 0, '3571', 'KOTA KEDIRI', '35', '35'),
-('3572', '2025-09-01 19:45:53.962215', '2025-09-01 19:45:53.962215', 'Administrator', 'Administrator', 0, 0, '3572', 'KOTA BLITAR', '35', '35'),
-('3573', '2025-09-01 19:45:53.962222', '2025-09-01 19:45:53.962222', 'Administrator', 'Administrator', 0, 0, '3573', 'KOTA MALANG', '35', '35'),
-('3574', '2025-09-01 19:45:53.962229', '2025-09-01 19:45:53.962229', 'Administrator', 'Administrator', 0, 0, '3574', 'KOTA PROBOLINGGO', '35', '35'),
-('3575', '2025-09-01 19:45:53.962251', '2025-09-01 19:45:53.962251', 'Administrator', 'Administrator', 0, 0, '3575', 'KOTA PASURUAN', '35', '35'),
-('3576', '2025-09-01 19:45:53.962261', '2025-09-01 19:45:53.962261', 'Administrator', 'Administrator', 0, 0, '3576', 'KOTA MOJOKERTO', '35', '35'),
-('3577', '2025-09-01 19:45:53.962268', '2025-09-01 19:45:53.962268', 'Administrator', 'Administrator', 0, 0, '3577', 'KOTA MADIUN', '35', '35'),
-('3578', '2025-09-01 19:45:53.962274', '2025-09-01 19:45:53.962274', 'Administrator', 'Administrator', 0, 0, '3578', 'KOTA SURABAYA', '35', '35'),
-('3579', '2025-09-01 19:45:53.962281', '2025-09-01 19:45:53.962281', 'Administrator', 'Administrator', 0, 0, '3579', 'KOTA BATU', '35', '35'),
-('3601', '2025-09-01 19:45:53.962287', '2025-09-01 19:45:53.962287', 'Administrator', 'Administrator', 0, 0, '3601', 'KABUPATEN PANDEGLANG', '36', '36'),
-('3602', '2025-09-01 19:45:53.962295', '2025-09-01 19:45:53.962295', 'Administrator', 'Administrator', 0, 0, '3602', 'KABUPATEN LEBAK', '36', '36'),
-('3603', '2025-09-01 19:45:53.962302', '2025-09-01 19:45:53.962302', 'Administrator', 'Administrator', 0, 0, '3603', 'KABUPATEN TANGERANG', '36', '36'),
-('3604', '2025-09-01 19:45:53.962309', '2025-09-01 19:45:53.962309', 'Administrator', 'Administrator', 0, 0, '3604', 'KABUPATEN SERANG', '36', '36'),
-('3671', '2025-09-01 19:45:53.962315', '2025-09-01 19:45:53.962315', 'Administrator', 'Administrator', 0, 0, '3671', 'KOTA TANGERANG', '36', '36'),
-('3672', '2025-09-01 19:45:53.962322', '2025-09-01 19:45:53.962322', 'Administrator', 'Administrator', 0, 0, '3672', 'KOTA CILEGON', '36', '36'),
-('3673', '2025-09-01 19:45:53.962328', '2025-09-01 19:45:53.962328', 'Administrator', 'Administrator', 0, 0, '3673', 'KOTA SERANG', '36', '36'),
-('3674', '2025-09-01 19:45:53.962336', '2025-09-01 19:45:53.962336', 'Administrator', 'Administrator', 0, 0, '3674', 'KOTA TANGERANG SELATAN', '36', '36'),
-('5101', '2025-09-01 19:45:53.962342', '2025-09-01 19:45:53.962342', 'Administrator', 'Administrator', 0, 0, '5101', 'KABUPATEN JEMBRANA', '51', '51'),
-('5102', '2025-09-01 19:45:53.962349', '2025-09-01 19:45:53.962349', 'Administrator', 'Administrator', 0, 0, '5102', 'KABUPATEN TABANAN', '51', '51'),
-('5103', '2025-09-01 19:45:53.962356', '2025-09-01 19:45:53.962356', 'Administrator', 'Administrator', 0, 0, '5103', 'KABUPATEN BADUNG', '51', '51'),
-('5104', '2025-09-01 19:45:53.962363', '2025-09-01 19:45:53.962363', 'Administrator', 'Administrator', 0, 0, '5104', 'KABUPATEN GIANYAR', '51', '51'),
-('5105', '2025-09-01 19:45:53.962389', '2025-09-01 19:45:53.962389', 'Administrator', 'Administrator', 0, 0, '5105', 'KABUPATEN KLUNGKUNG', '51', '51'),
-('5106', '2025-09-01 19:45:53.962401', '2025-09-01 19:45:53.962401', 'Administrator', 'Administrator', 0, 0, '5106', 'KABUPATEN BANGLI', '51', '51'),
-('5107', '2025-09-01 19:45:53.962408', '2025-09-01 19:45:53.962408', 'Administrator', 'Administrator', 0, 0, '5107', 'KABUPATEN KARANG ASEM', '51', '51'),
-('5108', '2025-09-01 19:45:53.962414', '2025-09-01 19:45:53.962414', 'Administrator', 'Administrator', 0, 0, '5108', 'KABUPATEN BULELENG', '51', '51'),
-('5171', '2025-09-01 19:45:53.962421', '2025-09-01 19:45:53.962421', 'Administrator', 'Administrator', 0, 0, '5171', 'KOTA DENPASAR', '51', '51'),
-('5201', '2025-09-01 19:45:53.962427', '2025-09-01 19:45:53.962427', 'Administrator', 'Administrator', 0, 0, '5201', 'KABUPATEN LOMBOK BARAT', '52', '52'),
-('5202', '2025-09-01 19:45:53.962434', '2025-09-01 19:45:53.962434', 'Administrator', 'Administrator', 0, 0, '5202', 'KABUPATEN LOMBOK TENGAH', '52', '52'),
-('5203', '2025-09-01 19:45:53.962441', '2025-09-01 19:45:53.962441', 'Administrator', 'Administrator', 0, 0, '5203', 'KABUPATEN LOMBOK TIMUR', '52', '52'),
-('5204', '2025-09-01 19:45:53.962447', '2025-09-01 19:45:53.962447', 'Administrator', 'Administrator', 0, 0, '5204', 'KABUPATEN SUMBAWA', '52', '52'),
-('5205', '2025-09-01 19:45:53.962453', '2025-09-01 19:45:53.962453', 'Administrator', 'Administrator', 0, 0, '5205', 'KABUPATEN DOMPU', '52', '52'),
-('5206', '2025-09-01 19:45:53.962460', '2025-09-01 19:45:53.962460', 'Administrator', 'Administrator', 0, 0, '5206', 'KABUPATEN BIMA', '52', '52'),
-('5207', '2025-09-01 19:45:53.962466', '2025-09-01 19:45:53.962466', 'Administrator', 'Administrator', 0, 0, '5207', 'KABUPATEN SUMBAWA BARAT', '52', '52'),
-('5208', '2025-09-01 19:45:53.962473', '2025-09-01 19:45:53.962473', 'Administrator', 'Administrator', 0, 0, '5208', 'KABUPATEN LOMBOK UTARA', '52', '52'),
-('5271', '2025-09-01 19:45:53.962481', '2025-09-01 19:45:53.962481', 'Administrator', 'Administrator', 0, 0, '5271', 'KOTA MATARAM', '52', '52'),
-('5272', '2025-09-01 19:45:53.962487', '2025-09-01 19:45:53.962487', 'Administrator', 'Administrator', 0, 0, '5272', 'KOTA BIMA', '52', '52'),
-('5301', '2025-09-01 19:45:53.962493', '2025-09-01 19:45:53.962493', 'Administrator', 'Administrator', 0, 0, '5301', 'KABUPATEN SUMBA BARAT', '53', '53'),
-('5302', '2025-09-01 19:45:53.962501', '2025-09-01 19:45:53.962501', 'Administrator', 'Administrator', 0, 0, '5302', 'KABUPATEN SUMBA TIMUR', '53', '53'),
-('5303', '2025-09-01 19:45:53.962508', '2025-09-01 19:45:53.962508', 'Administrator', 'Administrator', 0, 0, '5303', 'KABUPATEN KUPANG', '53', '53'),
-('5304', '2025-09-01 19:45:53.962556', '2025-09-01 19:45:53.962556', 'Administrator', 'Administrator', 0, 0, '5304', 'KABUPATEN TIMOR TENGAH SELATAN', '53', '53'),
-('5305', '2025-09-01 19:45:53.962584', '2025-09-01 19:45:53.962584', 'Administrator', 'Administrator', 0, 0, '5305', 'KABUPATEN TIMOR TENGAH UTARA', '53', '53'),
-('5306', '2025-09-01 19:45:53.962595', '2025-09-01 19:45:53.962595', 'Administrator', 'Administrator', 0, 0, '5306', 'KABUPATEN BELU', '53', '53'),
-('5307', '2025-09-01 19:45:53.962603', '2025-09-01 19:45:53.962603', 'Administrator', 'Administrator', 0, 0, '5307', 'KABUPATEN ALOR', '53', '53'),
-('5308', '2025-09-01 19:45:53.962610', '2025-09-01 19:45:53.962610', 'Administrator', 'Administrator', 0, 0, '5308', 'KABUPATEN LEMBATA', '53', '53'),
-('5309', '2025-09-01 19:45:53.962617', '2025-09-01 19:45:53.962617', 'Administrator', 'Administrator', 0, 0, '5309', 'KABUPATEN FLORES TIMUR', '53', '53'),
-('5310', '2025-09-01 19:45:53.962627', '2025-09-01 19:45:53.962627', 'Administrator', 'Administrator', 0, 0, '5310', 'KABUPATEN SIKKA', '53', '53'),
-('5311', '2025-09-01 19:45:53.962637', '2025-09-01 19:45:53.962637', 'Administrator', 'Administrator', 0, 0, '5311', 'KABUPATEN ENDE', '53', '53'),
-('5312', '2025-09-01 19:45:53.962647', '2025-09-01 19:45:53.962647', 'Administrator', 'Administrator', 0, 0, '5312', 'KABUPATEN NGADA', '53', '53'),
-('5313', '2025-09-01 19:45:53.962654', '2025-09-01 19:45:53.962654', 'Administrator', 'Administrator', 0, 0, '5313', 'KABUPATEN MANGGARAI', '53', '53'),
-('5314', '2025-09-01 19:45:53.962661', '2025-09-01 19:45:53.962661', 'Administrator', 'Administrator', 0, 0, '5314', 'KABUPATEN ROTE NDAO', '53', '53'),
-('5315', '2025-09-01 19:45:53.962668', '2025-09-01 19:45:53.962668', 'Administrator', 'Administrator', 0, 0, '5315', 'KABUPATEN MANGGARAI BARAT', '53', '53'),
-('5316', '2025-09-01 19:45:53.962675', '2025-09-01 19:45:53.962675', 'Administrator', 'Administrator', 0, 0, '5316', 'KABUPATEN SUMBA TENGAH', '53', '53'),
-('5317', '2025-09-01 19:45:53.962682', '2025-09-01 19:45:53.962682', 'Administrator', 'Administrator', 0, 0, '5317', 'KABUPATEN SUMBA BARAT DAYA', '53', '53'),
-('5318', '2025-09-01 19:45:53.962689', '2025-09-01 19:45:53.962689', 'Administrator', 'Administrator', 0, 0, '5318', 'KABUPATEN NAGEKEO', '53', '53'),
-('5319', '2025-09-01 19:45:53.962696', '2025-09-01 19:45:53.962696', 'Administrator', 'Administrator', 0, 0, '5319', 'KABUPATEN MANGGARAI TIMUR', '53', '53'),
-('5320', '2025-09-01 19:45:53.962720', '2025-09-01 19:45:53.962720', 'Administrator', 'Administrator', 0, 0, '5320', 'KABUPATEN SABU RAIJUA', '53', '53'),
-('5321', '2025-09-01 19:45:53.962732', '2025-09-01 19:45:53.962732', 'Administrator', 'Administrator', 0, 0, '5321', 'KABUPATEN MALAKA', '53', '53'),
-('5371', '2025-09-01 19:45:53.962738', '2025-09-01 19:45:53.962738', 'Administrator', 'Administrator', 0, 0, '5371', 'KOTA KUPANG', '53', '53'),
-('6101', '2025-09-01 19:45:53.962745', '2025-09-01 19:45:53.962745', 'Administrator', 'Administrator', 0, 0, '6101', 'KABUPATEN SAMBAS', '61', '61'),
-('6102', '2025-09-01 19:45:53.962752', '2025-09-01 19:45:53.962752', 'Administrator', 'Administrator', 0, 0, '6102', 'KABUPATEN BENGKAYANG', '61', '61'),
-('6103', '2025-09-01 19:45:53.962759', '2025-09-01 19:45:53.962759', 'Administrator', 'Administrator', 0, 0, '6103', 'KABUPATEN LANDAK', '61', '61'),
-('6104', '2025-09-01 19:45:53.962765', '2025-09-01 19:45:53.962765', 'Administrator', 'Administrator', 0, 0, '6104', 'KABUPATEN MEMPAWAH', '61', '61'),
-('6105', '2025-09-01 19:45:53.962772', '2025-09-01 19:45:53.962772', 'Administrator', 'Administrator', 0, 0, '6105', 'KABUPATEN SANGGAU', '61', '61'),
-('6106', '2025-09-01 19:45:53.962778', '2025-09-01 19:45:53.962778', 'Administrator', 'Administrator', 0, 0, '6106', 'KABUPATEN KETAPANG', '61', '61'),
-('6107', '2025-09-01 19:45:53.962785', '2025-09-01 19:45:53.962785', 'Administrator', 'Administrator', 0, 0, '6107', 'KABUPATEN SINTANG', '61', '61'),
-('6108', '2025-09-01 19:45:53.962796', '2025-09-01 19:45:53.962796', 'Administrator', 'Administrator', 0, 0, '6108', 'KABUPATEN KAPUAS HULU', '61', '61'),
-('6109', '2025-09-01 19:45:53.962813', '2025-09-01 19:45:53.962813', 'Administrator', 'Administrator', 0, 0, '6109', 'KABUPATEN SEKADAU', '61', '61'),
-('6110', '2025-09-01 19:45:53.962822', '2025-09-01 19:45:53.962822', 'Administrator', 'Administrator', 0, 0, '6110', 'KABUPATEN MELAWI', '61', '61'),
-('6111', '2025-09-01 19:45:53.962833', '2025-09-01 19:45:53.962833', 'Administrator', 'Administrator', 0, 0, '6111', 'KABUPATEN KAYONG UTARA', '61', '61'),
-('6112', '2025-09-01 19:45:53.962842', '2025-09-01 19:45:53.962842', 'Administrator', 'Administrator', 0, 0, '6112', 'KABUPATEN KUBU RAYA', '61', '61'),
-('6171', '2025-09-01 19:45:53.962849', '2025-09-01 19:45:53.962849', 'Administrator', 'Administrator', 0, 0, '6171', 'KOTA PONTIANAK', '61', '61'),
-('6172', '2025-09-01 19:45:53.962856', '2025-09-01 19:45:53.962856', 'Administrator', 'Administrator', 0, 0, '6172', 'KOTA SINGKAWANG', '61', '61'),
-('6201', '2025-09-01 19:45:53.962880', '2025-09-01 19:45:53.962880', 'Administrator', 'Administrator', 0, 0, '6201', 'KABUPATEN KOTAWARINGIN BARAT', '62', '62'),
-('6202', '2025-09-01 19:45:53.962891', '2025-09-01 19:45:53.962891', 'Administrator', 'Administrator', 0, 0, '6202', 'KABUPATEN KOTAWARINGIN TIMUR', '62', '62'),
-('6203', '2025-09-01 19:45:53.962898', '2025-09-01 19:45:53.962898', 'Administrator', 'Administrator', 0, 0, '6203', 'KABUPATEN KAPUAS', '62', '62'),
-('6204', '2025-09-01 19:45:53.962904', '2025-09-01 19:45:53.962904', 'Administrator', 'Administrator', 0, 0, '6204', 'KABUPATEN BARITO SELATAN', '62', '62'),
-('6205', '2025-09-01 19:45:53.962911', '2025-09-01 19:45:53.962911', 'Administrator', 'Administrator', 0, 0, '6205', 'KABUPATEN BARITO UTARA', '62', '62'),
-('6206', '2025-09-01 19:45:53.962938', '2025-09-01 19:45:53.962938', 'Administrator', 'Administrator', 0, 0, '6206', 'KABUPATEN SUKAMARA', '62', '62'),
-('6207', '2025-09-01 19:45:53.962954', '2025-09-01 19:45:53.962954', 'Administrator', 'Administrator', 0, 0, '6207', 'KABUPATEN LAMANDAU', '62', '62'),
-('6208', '2025-09-01 19:45:53.962987', '2025-09-01 19:45:53.962987', 'Administrator', 'Administrator', 0, 0, '6208', 'KABUPATEN SERUYAN', '62', '62'),
-('6209', '2025-09-01 19:45:53.962996', '2025-09-01 19:45:53.962996', 'Administrator', 'Administrator', 0, 0, '6209', 'KABUPATEN KATINGAN', '62', '62'),
-('6210', '2025-09-01 19:45:53.963003', '2025-09-01 19:45:53.963003', 'Administrator', 'Administrator', 0, 0, '6210', 'KABUPATEN PULANG PISAU', '62', '62'),
-('6211', '2025-09-01 19:45:53.963009', '2025-09-01 19:45:53.963009', 'Administrator', 'Administrator', 0, 0, '6211', 'KABUPATEN GUNUNG MAS', '62', '62'),
-('6212', '2025-09-01 19:45:53.963016', '2025-09-01 19:45:53.963016', 'Administrator', 'Administrator', 0, 0, '6212', 'KABUPATEN BARITO TIMUR', '62', '62'),
-('6213', '2025-09-01 19:45:53.963022', '2025-09-01 19:45:53.963022', 'Administrator', 'Administrator', 0, 0, '6213', 'KABUPATEN MURUNG RAYA', '62', '62'),
-('6271', '2025-09-01 19:45:53.963035', '2025-09-01 19:45:53.963035', 'Administrator', 'Administrator', 0, 0, '6271', 'KOTA PALANGKA RAYA', '62', '62'),
-('6301', '2025-09-01 19:45:53.963049', '2025-09-01 19:45:53.963049', 'Administrator', 'Administrator', 0, 0, '6301', 'KABUPATEN TANAH LAUT', '63', '63'),
-('6302', '2025-09-01 19:45:53.963062', '2025-09-01 19:45:53.963062', 'Administrator', 'Administrator', 0, 0, '6302', 'KABUPATEN KOTA BARU', '63', '63'),
-('6303', '2025-09-01 19:45:53.963068', '2025-09-01 19:45:53.963068', 'Administrator', 'Administrator', 0, 0, '6303', 'KABUPATEN BANJAR', '63', '63'),
-('6304', '2025-09-01 19:45:53.963097', '2025-09-01 19:45:53.963097', 'Administrator', 'Administrator', 0, 0, '6304', 'KABUPATEN BARITO KUALA', '63', '63'),
-('6305', '2025-09-01 19:45:53.963108', '2025-09-01 19:45:53.963108', 'Administrator', 'Administrator', 0, 0, '6305', 'KABUPATEN TAPIN', '63', '63'),
-('6306', '2025-09-01 19:45:53.963115', '2025-09-01 19:45:53.963115', 'Administrator', 'Administrator', 0, 0, '6306', 'KABUPATEN HULU SUNGAI SELATAN', '63', '63'),
-('6307', '2025-09-01 19:45:53.963122', '2025-09-01 19:45:53.963122', 'Administrator', 'Administrator', 0, 0, '6307', 'KABUPATEN HULU SUNGAI TENGAH', '63', '63'),
-('6308', '2025-09-01 19:45:53.963129', '2025-09-01 19:45:53.963129', 'Administrator', 'Administrator', 0, 0, '6308', 'KABUPATEN HULU SUNGAI UTARA', '63', '63'),
-('6309', '2025-09-01 19:45:53.963135', '2025-09-01 19:45:53.963135', 'Administrator', 'Administrator', 0, 0, '6309', 'KABUPATEN TABALONG', '63', '63'),
-('6310', '2025-09-01 19:45:53.963141', '2025-09-01 19:45:53.963141', 'Administrator', 'Administrator', 0, 0, '6310', 'KABUPATEN TANAH BUMBU', '63', '63'),
-('6311', '2025-09-01 19:45:53.963148', '2025-09-01 19:45:53.963148', 'Administrator', 'Administrator', 0, 0, '6311', 'KABUPATEN BALANGAN', '63', '63'),
-('6371', '2025-09-01 19:45:53.963155', '2025-09-01 19:45:53.963155', 'Administrator', 'Administrator', 0, 0, '6371', 'KOTA BANJARMASIN', '63', '63'),
-('6372', '2025-09-01 19:45:53.963162', '2025-09-01 19:45:53.963162', 'Administrator', 'Administrator', 0, 0, '6372', 'KOTA BANJAR BARU', '63', '63'),
-('6401', '2025-09-01 19:45:53.963168', '2025-09-01 19:45:53.963168', 'Administrator', 'Administrator', 0, 0, '6401', 'KABUPATEN PASER', '64', '64'),
-('6402', '2025-09-01 19:45:53.963175', '2025-09-01 19:45:53.963175', 'Administrator', 'Administrator', 0, 0, '6402', 'KABUPATEN KUTAI BARAT', '64', '64'),
-('6403', '2025-09-01 19:45:53.963181', '2025-09-01 19:45:53.963181', 'Administrator', 'Administrator', 0, 0, '6403', 'KABUPATEN KUTAI KARTANEGARA', '64', '64'),
-('6404', '2025-09-01 19:45:53.963188', '2025-09-01 19:45:53.963188', 'Administrator', 'Administrator', 0, 0, '6404', 'KABUPATEN KUTAI TIMUR', '64', '64'),
-('6405', '2025-09-01 19:45:53.963194', '2025-09-01 19:45:53.963194', 'Administrator', 'Administrator', 0, 0, '6405', 'KABUPATEN BERAU', '64', '64'),
-('6409', '2025-09-01 19:45:53.963200', '2025-09-01 19:45:53.963200', 'Administrator', 'Administrator', 0, 0, '6409', 'KABUPATEN PENAJAM PASER UTARA', '64', '64'),
-('6411', '2025-09-01 19:45:53.963207', '2025-09-01 19:45:53.963207', 'Administrator', 'Administrator', 0, 0, '6411', 'KABUPATEN MAHAKAM HULU', '64', '64'),
-('6471', '2025-09-01 19:45:53.963213', '2025-09-01 19:45:53.963213', 'Administrator', 'Administrator', 0, 0, '6471', 'KOTA BALIKPAPAN', '64', '64'),
-('6472', '2025-09-01 19:45:53.963239', '2025-09-01 19:45:53.963239', 'Administrator', 'Administrator', 0, 0, '6472', 'KOTA SAMARINDA', '64', '64'),
-('6474', '2025-09-01 19:45:53.963257', '2025-09-01 19:45:53.963257', 'Administrator', 'Administrator', 0, 0, '6474', 'KOTA BONTANG', '64', '64'),
-('6501', '2025-09-01 19:45:53.963273', '2025-09-01 19:45:53.963273', 'Administrator', 'Administrator', 0, 0, '6501', 'KABUPATEN MALINAU', '65', '65'),
-('6502', '2025-09-01 19:45:53.963292', '2025-09-01 19:45:53.963292', 'Administrator', 'Administrator', 0, 0, '6502', 'KABUPATEN BULUNGAN', '65', '65'),
-('6503', '2025-09-01 19:45:53.963310', '2025-09-01 19:45:53.963310', 'Administrator', 'Administrator', 0, 0, '6503', 'KABUPATEN TANA TIDUNG', '65', '65'),
-('6504', '2025-09-01 19:45:53.963320', '2025-09-01 19:45:53.963320', 'Administrator', 'Administrator', 0, 0, '6504', 'KABUPATEN NUNUKAN', '65', '65'),
-('6571', '2025-09-01 19:45:53.963327', '2025-09-01 19:45:53.963327', 'Administrator', 'Administrator', 0, 0, '6571', 'KOTA TARAKAN', '65', '65'),
-('7101', '2025-09-01 19:45:53.963339', '2025-09-01 19:45:53.963339', 'Administrator', 'Administrator', 0, 0, '7101', 'KABUPATEN BOLAANG MONGONDOW', '71', '71'),
-('7102', '2025-09-01 19:45:53.963350', '2025-09-01 19:45:53.963350', 'Administrator', 'Administrator', 0, 0, '7102', 'KABUPATEN MINAHASA', '71', '71'),
-('7103', '2025-09-01 19:45:53.963357', '2025-09-01 19:45:53.963357', 'Administrator', 'Administrator', 0, 0, '7103', 'KABUPATEN KEPULAUAN SANGIHE', '71', '71'),
-('7104', '2025-09-01 19:45:53.963364', '2025-09-01 19:45:53.963364', 'Administrator', 'Administrator', 0, 0, '7104', 'KABUPATEN KEPULAUAN TALAUD', '71', '71'),
-('7105', '2025-09-01 19:45:53.963370', '2025-09-01 19:45:53.963370', 'Administrator', 'Administrator', 0, 0, '7105', 'KABUPATEN MINAHASA SELATAN', '71', '71'),
-('7106', '2025-09-01 19:45:53.963376', '2025-09-01 19:45:53.963376', 'Administrator', 'Administrator', 0, 0, '7106', 'KABUPATEN MINAHASA UTARA', '71', '71'),
-('7107', '2025-09-01 19:45:53.963383', '2025-09-01 19:45:53.963383', 'Administrator', 'Administrator', 0, 0, '7107', 'KABUPATEN BOLAANG MONGONDOW UTARA', '71', '71'),
-('7108', '2025-09-01 19:45:53.963395', '2025-09-01 19:45:53.963395', 'Administrator', 'Administrator', 0, 0, '7108', 'KABUPATEN SIAU TAGULANDANG BIARO', '71', '71'),
-('7109', '2025-09-01 19:45:53.963411', '2025-09-01 19:45:53.963411', 'Administrator', 'Administrator', 0, 0, '7109', 'KABUPATEN MINAHASA TENGGARA', '71', '71'),
-('7110', '2025-09-01 19:45:53.963435', '2025-09-01 19:45:53.963435', 'Administrator', 'Administrator', 0, 0, '7110', 'KABUPATEN BOLAANG MONGONDOW SELATAN', '71', '71'),
-('7111', '2025-09-01 19:45:53.963446', '2025-09-01 19:45:53.963446', 'Administrator', 'Administrator', 0, 0, '7111', 'KABUPATEN BOLAANG MONGONDOW TIMUR', '71', '71'),
-('7171', '2025-09-01 19:45:53.963452', '2025-09-01 19:45:53.963452', 'Administrator', 'Administrator', 0, 0, '7171', 'KOTA MANADO', '71', '71'),
-('7172', '2025-09-01 19:45:53.963459', '2025-09-01 19:45:53.963459', 'Administrator', 'Administrator', 0, 0, '7172', 'KOTA BITUNG', '71', '71'),
-('7173', '2025-09-01 19:45:53.963465', '2025-09-01 19:45:53.963465', 'Administrator', 'Administrator', 0, 0, '7173', 'KOTA TOMOHON', '71', '71'),
-('7174', '2025-09-01 19:45:53.963472', '2025-09-01 19:45:53.963472', 'Administrator', 'Administrator', 0, 0, '7174', 'KOTA KOTAMOBAGU', '71', '71'),
-('7201', '2025-09-01 19:45:53.963478', '2025-09-01 19:45:53.963478', 'Administrator', 'Administrator', 0, 0, '7201', 'KABUPATEN BANGGAI KEPULAUAN', '72', '72'),
-('7202', '2025-09-01 19:45:53.963484', '2025-09-01 19:45:53.963484', 'Administrator', 'Administrator', 0, 0, '7202', 'KABUPATEN BANGGAI', '72', '72'),
-('7203', '2025-09-01 19:45:53.963490', '2025-09-01 19:45:53.963490', 'Administrator', 'Administrator', 0, 0, '7203', 'KABUPATEN MOROWALI', '72', '72'),
-('7204', '2025-09-01 19:45:53.963497', '2025-09-01 19:45:53.963497', 'Administrator', 'Administrator', 0, 0, '7204', 'KABUPATEN POSO', '72', '72'),
-('7205', '2025-09-01 19:45:53.963503', '2025-09-01 19:45:53.963503', 'Administrator', 'Administrator', 0, 0, '7205', 'KABUPATEN DONGGALA', '72', '72'),
-('7206', '2025-09-01 19:45:53.963509', '2025-09-01 19:45:53.963509', 'Administrator', 'Administrator', 0, 0, '7206', 'KABUPATEN TOLI-TOLI', '72', '72'),
-('7207', '2025-09-01 19:45:53.963515', '2025-09-01 19:45:53.963515', 'Administrator', 'Administrator', 0, 0, '7207', 'KABUPATEN BUOL', '72', '72'),
-('7208', '2025-09-01 19:45:53.963522', '2025-09-01 19:45:53.963522', 'Administrator', 'Administrator', 0, 0, '7208', 'KABUPATEN PARIGI MOUTONG', '72', '72'),
-('7209', '2025-09-01 19:45:53.963528', '2025-09-01 19:45:53.963528', 'Administrator', 'Administrator', 0, 0, '7209', 'KABUPATEN TOJO UNA-UNA', '72', '72'),
-('7210', '2025-09-01 19:45:53.963535', '2025-09-01 19:45:53.963535', 'Administrator', 'Administrator', 0, 0, '7210', 'KABUPATEN SIGI', '72', '72'),
-('7211', '2025-09-01 19:45:53.963541', '2025-09-01 19:45:53.963541', 'Administrator', 'Administrator', 0, 0, '7211', 'KABUPATEN BANGGAI LAUT', '72', '72'),
-('7212', '2025-09-01 19:45:53.963568', '2025-09-01 19:45:53.963568', 'Administrator', 'Administrator', 0, 0, '7212', 'KABUPATEN MOROWALI UTARA', '72', '72'),
-('7271', '2025-09-01 19:45:53.963578', '2025-09-01 19:45:53.963578', 'Administrator', 'Administrator', 0, 0, '7271', 'KOTA PALU', '72', '72'),
-('7301', '2025-09-01 19:45:53.963590', '2025-09-01 19:45:53.963590', 'Administrator', 'Administrator', 0, 0, '7301', 'KABUPATEN KEPULAUAN SELAYAR', '73', '73'),
-('7302', '2025-09-01 19:45:53.963597', '2025-09-01 19:45:53.963597', 'Administrator', 'Administrator', 0, 0, '7302', 'KABUPATEN BULUKUMBA', '73', '73'),
-('7303', '2025-09-01 19:45:53.963603', '2025-09-01 19:45:53.963603', 'Administrator', 'Administrator', 0, 0, '7303', 'KABUPATEN BANTAENG', '73', '73'),
-('7304', '2025-09-01 19:45:53.963613', '2025-09-01 19:45:53.963613', 'Administrator', 'Administrator', 0, 0, '7304', 'KABUPATEN JENEPONTO', '73', '73'),
-('7305', '2025-09-01 19:45:53.963624', '2025-09-01 19:45:53.963624', 'Administrator', 'Administrator', 0, 0, '7305', 'KABUPATEN TAKALAR', '73', '73'),
-('7306', '2025-09-01 19:45:53.963635', '2025-09-01 19:45:53.963635', 'Administrator', 'Administrator', 0, 0, '7306', 'KABUPATEN GOWA', '73', '73'),
-('7307', '2025-09-01 19:45:53.963650', '2025-09-01 19:45:53.963650', 'Administrator', 'Administrator', 0, 0, '7307', 'KABUPATEN SINJAI', '73', '73'),
-('7308', '2025-09-01 19:45:53.963660', '2025-09-01 19:45:53.963660', 'Administrator', 'Administrator', 0, 0, '7308', 'KABUPATEN MAROS', '73', '73'),
-('7309', '2025-09-01 19:45:53.963671', '2025-09-01 19:45:53.963671', 'Administrator', 'Administrator', 0, 0, '7309', 'KABUPATEN PANGKAJENE DAN KEPULAUAN', '73', '73'),
-('7310', '2025-09-01 19:45:53.963680', '2025-09-01 19:45:53.963680', 'Administrator', 'Administrator', 0, 0, '7310', 'KABUPATEN BARRU', '73', '73'),
-('7311', '2025-09-01 19:45:53.963686', '2025-09-01 19:45:53.963686', 'Administrator', 'Administrator', 0, 0, '7311', 'KABUPATEN BONE', '73', '73'),
-('7312', '2025-09-01 19:45:53.963703', '2025-09-01 19:45:53.963703', 'Administrator', 'Administrator', 0, 0, '7312', 'KABUPATEN SOPPENG', '73', '73'),
-('7313', '2025-09-01 19:45:53.963716', '2025-09-01 19:45:53.963716', 'Administrator', 'Administrator', 0, 0, '7313', 'KABUPATEN WAJO', '73', '73'),
-('7314', '2025-09-01 19:45:53.963722', '2025-09-01 19:45:53.963722', 'Administrator', 'Administrator', 0, 0, '7314', 'KABUPATEN SIDENRENG RAPPANG', '73', '73'),
-('7315', '2025-09-01 19:45:53.963729', '2025-09-01 19:45:53.963729', 'Administrator', 'Administrator', 0, 0, '7315', 'KABUPATEN PINRANG', '73', '73'),
-('7316', '2025-09-01 19:45:53.963750', '2025-09-01 19:45:53.963750', 'Administrator', 'Administrator', 0, 0, '7316', 'KABUPATEN ENREKANG', '73', '73'),
-('7317', '2025-09-01 19:45:53.963764', '2025-09-01 19:45:53.963764', 'Administrator', 'Administrator', 0, 0, '7317', 'KABUPATEN LUWU', '73', '73'),
-('7318', '2025-09-01 19:45:53.963773', '2025-09-01 19:45:53.963773', 'Administrator', 'Administrator', 0, 0, '7318', 'KABUPATEN TANA TORAJA', '73', '73'),
-('7322', '2025-09-01 19:45:53.963780', '2025-09-01 19:45:53.963780', 'Administrator', 'Administrator', 0, 0, '7322', 'KABUPATEN LUWU UTARA', '73', '73'),
-('7325', '2025-09-01 19:45:53.963787', '2025-09-01 19:45:53.963787', 'Administrator', 'Administrator', 0, 0, '7325', 'KABUPATEN LUWU TIMUR', '73', '73'),
-('7326', '2025-09-01 19:45:53.963793', '2025-09-01 19:45:53.963793', 'Administrator', 'Administrator', 0, 0, '7326', 'KABUPATEN TORAJA UTARA', '73', '73'),
-('7371', '2025-09-01 19:45:53.963800', '2025-09-01 19:45:53.963800', 'Administrator', 'Administrator', 0, 0, '7371', 'KOTA MAKASSAR', '73', '73'),
-('7372', '2025-09-01 19:45:53.963807', '2025-09-01 19:45:53.963807', 'Administrator', 'Administrator', 0, 0, '7372', 'KOTA PAREPARE', '73', '73'),
-('7373', '2025-09-01 19:45:53.963814', '2025-09-01 19:45:53.963814', 'Administrator', 'Administrator', 0, 0, '7373', 'KOTA PALOPO', '73', '73'),
-('7401', '2025-09-01 19:45:53.963822', '2025-09-01 19:45:53.963822', 'Administrator', 'Administrator', 0, 0, '7401', 'KABUPATEN BUTON', '74', '74'),
-('7402', '2025-09-01 19:45:53.963829', '2025-09-01 19:45:53.963829', 'Administrator', 'Administrator', 0, 0, '7402', 'KABUPATEN MUNA', '74', '74'),
-('7403', '2025-09-01 19:45:53.963836', '2025-09-01 19:45:53.963836', 'Administrator', 'Administrator', 0, 0, '7403', 'KABUPATEN KONAWE', '74', '74'),
-('7404', '2025-09-01 19:45:53.963846', '2025-09-01 19:45:53.963846', 'Administrator', 'Administrator', 0, 0, '7404', 'KABUPATEN KOLAKA', '74', '74'),
-('7405', '2025-09-01 19:45:53.963856', '2025-09-01 19:45:53.963856', 'Administrator', 'Administrator', 0, 0, '7405', 'KABUPATEN KONAWE SELATAN', '74', '74'),
-('7406', '2025-09-01 19:45:53.963863', '2025-09-01 19:45:53.963863', 'Administrator', 'Administrator', 0, 0, '7406', 'KABUPATEN BOMBANA', '74', '74'),
-('7407', '2025-09-01 19:45:53.963870', '2025-09-01 19:45:53.963870', 'Administrator', 'Administrator', 0, 0, '7407', 'KABUPATEN WAKATOBI', '74', '74'),
-('7408', '2025-09-01 19:45:53.963877', '2025-09-01 19:45:53.963877', 'Administrator', 'Administrator', 0, 0, '7408', 'KABUPATEN KOLAKA UTARA', '74', '74'),
-('7409', '2025-09-01 19:45:53.963885', '2025-09-01 19:45:53.963885', 'Administrator', 'Administrator', 0, 0, '7409', 'KABUPATEN BUTON UTARA', '74', '74'),
-('7410', '2025-09-01 19:45:53.963906', '2025-09-01 19:45:53.963906', 'Administrator', 'Administrator', 0, 0, '7410', 'KABUPATEN KONAWE UTARA', '74', '74'),
-('7411', '2025-09-01 19:45:53.963917', '2025-09-01 19:45:53.963917', 'Administrator', 'Administrator', 0, 0, '7411', 'KABUPATEN KOLAKA TIMUR', '74', '74'),
-('7412', '2025-09-01 19:45:53.963924', '2025-09-01 19:45:53.963924', 'Administrator', 'Administrator', 0, 0, '7412', 'KABUPATEN KONAWE KEPULAUAN', '74', '74'),
-('7413', '2025-09-01 19:45:53.963932', '2025-09-01 19:45:53.963932', 'Administrator', 'Administrator', 0, 0, '7413', 'KABUPATEN MUNA BARAT', '74', '74'),
-('7414', '2025-09-01 19:45:53.963938', '2025-09-01 19:45:53.963938', 'Administrator', 'Administrator', 0, 0, '7414', 'KABUPATEN BUTON TENGAH', '74', '74'),
-('7415', '2025-09-01 19:45:53.963945', '2025-09-01 19:45:53.963945', 'Administrator', 'Administrator', 0, 0, '7415', 'KABUPATEN BUTON SELATAN', '74', '74'),
-('7471', '2025-09-01 19:45:53.963958', '2025-09-01 19:45:53.963958', 'Administrator', 'Administrator', 0, 0, '7471', 'KOTA KENDARI', '74', '74'),
-('7472', '2025-09-01 19:45:53.963981', '2025-09-01 19:45:53.963981', 'Administrator', 'Administrator', 0, 0, '7472', 'KOTA BAUBAU', '74', '74'),
-('7501', '2025-09-01 19:45:53.963988', '2025-09-01 19:45:53.963988', 'Administrator', 'Administrator', 0, 0, '7501', 'KABUPATEN BOALEMO', '75', '75'),
-('7502', '2025-09-01 19:45:53.964000', '2025-09-01 19:45:53.964000', 'Administrator', 'Administrator', 0, 0, '7502', 'KABUPATEN GORONTALO', '75', '75'),
-('7503', '2025-09-01 19:45:53.964018', '2025-09-01 19:45:53.964018', 'Administrator', 'Administrator', 0, 0, '7503', 'KABUPATEN POHUWATO', '75', '75'),
-('7504', '2025-09-01 19:45:53.964032', '2025-09-01 19:45:53.964032', 'Administrator', 'Administrator', 0, 0, '7504', 'KABUPATEN BONE BOLANGO', '75', '75'),
-('7505', '2025-09-01 19:45:53.964049', '2025-09-01 19:45:53.964049', 'Administrator', 'Administrator', 0, 0, '7505', 'KABUPATEN GORONTALO UTARA', '75', '75'),
-('7571', '2025-09-01 19:45:53.964066', '2025-09-01 19:45:53.964066', 'Administrator', 'Administrator', 0, 0, '7571', 'KOTA GORONTALO', '75', '75'),
-('7601', '2025-09-01 19:45:53.964076', '2025-09-01 19:45:53.964076', 'Administrator', 'Administrator', 0, 0, '7601', 'KABUPATEN MAJENE', '76', '76'),
-('7602', '2025-09-01 19:45:53.964083', '2025-09-01 19:45:53.964083', 'Administrator', 'Administrator', 0, 0, '7602', 'KABUPATEN POLEWALI MANDAR', '76', '76'),
-('7603', '2025-09-01 19:45:53.964111', '2025-09-01 19:45:53.964111', 'Administrator', 'Administrator', 0, 0, '7603', 'KABUPATEN MAMASA', '76', '76'),
-('7604', '2025-09-01 19:45:53.964126', '2025-09-01 19:45:53.964126', 'Administrator', 'Administrator', 0, 0, '7604', 'KABUPATEN MAMUJU', '76', '76'),
-('7605', '2025-09-01 19:45:53.964136', '2025-09-01 19:45:53.964136', 'Administrator', 'Administrator', 0, 0, '7605', 'KABUPATEN MAMUJU UTARA', '76', '76'),
-('7606', '2025-09-01 19:45:53.964143', '2025-09-01 19:45:53.964143', 'Administrator', 'Administrator', 0, 0, '7606', 'KABUPATEN MAMUJU TENGAH', '76', '76'),
-('8101', '2025-09-01 19:45:53.964150', '2025-09-01 19:45:53.964150', 'Administrator', 'Administrator', 0, 0, '8101', 'KABUPATEN MALUKU TENGGARA BARAT', '81', '81'),
-('8102', '2025-09-01 19:45:53.964157', '2025-09-01 19:45:53.964157', 'Administrator', 'Administrator', 0, 0, '8102', 'KABUPATEN MALUKU TENGGARA', '81', '81'),
-('8103', '2025-09-01 19:45:53.964164', '2025-09-01 19:45:53.964164', 'Administrator', 'Administrator', 0, 0, '8103', 'KABUPATEN MALUKU TENGAH', '81', '81'),
-('8104', '2025-09-01 19:45:53.964171', '2025-09-01 19:45:53.964171', 'Administrator', 'Administrator', 0, 0, '8104', 'KABUPATEN BURU', '81', '81'),
-('8105', '2025-09-01 19:45:53.964178', '2025-09-01 19:45:53.964178', 'Administrator', 'Administrator', 0, 0, '8105', 'KABUPATEN KEPULAUAN ARU', '81', '81'),
-('8106', '2025-09-01 19:45:53.964185', '2025-09-01 19:45:53.964185', 'Administrator', 'Administrator', 0, 0, '8106', 'KABUPATEN SERAM BAGIAN BARAT', '81', '81'),
-('8107', '2025-09-01 19:45:53.964195', '2025-09-01 19:45:53.964195', 'Administrator', 'Administrator', 0, 0, '8107', 'KABUPATEN SERAM BAGIAN TIMUR', '81', '81'),
-('8108', '2025-09-01 19:45:53.964204', '2025-09-01 19:45:53.964204', 'Administrator', 'Administrator', 0, 0, '8108', 'KABUPATEN MALUKU BARAT DAYA', '81', '81'),
-('8109', '2025-09-01 19:45:53.964210', '2025-09-01 19:45:53.964210', 'Administrator', 'Administrator', 0, 0, '8109', 'KABUPATEN BURU SELATAN', '81', '81'),
-('8171', '2025-09-01 19:45:53.964216', '2025-09-01 19:45:53.964216', 'Administrator', 'Administrator', 0, 0, '8171', 'KOTA AMBON', '81', '81'),
-('8172', '2025-09-01 19:45:53.964226', '2025-09-01 19:45:53.964226', 'Administrator', 'Administrator', 0, 0, '8172', 'KOTA TUAL', '81', '81'),
-('8201', '2025-09-01 19:45:53.964235', '2025-09-01 19:45:53.964235', 'Administrator', 'Administrator', 0, 0, '8201', 'KABUPATEN HALMAHERA BARAT', '82', '82'),
-('8202', '2025-09-01 19:45:53.964243', '2025-09-01 19:45:53.964243', 'Administrator', 'Administrator', 0, 0, '8202', 'KABUPATEN HALMAHERA TENGAH', '82', '82'),
-('8203', '2025-09-01 19:45:53.964268', '2025-09-01 19:45:53.964268', 'Administrator', 'Administrator', 0, 0, '8203', 'KABUPATEN KEPULAUAN SULA', '82', '82'),
-('8204', '2025-09-01 19:45:53.964279', '2025-09-01 19:45:53.964279', 'Administrator', 'Administrator', 0, 0, '8204', 'KABUPATEN HALMAHERA SELATAN', '82', '82'),
-('8205', '2025-09-01 19:45:53.964292', '2025-09-01 19:45:53.964292', 'Administrator', 'Administrator', 0, 0, '8205', 'KABUPATEN HALMAHERA UTARA', '82', '82'),
-('8206', '2025-09-01 19:45:53.964309', '2025-09-01 19:45:53.964309', 'Administrator', 'Administrator', 0, 0, '8206', 'KABUPATEN HALMAHERA TIMUR', '82', '82'),
-('8207', '2025-09-01 19:45:53.964318', '2025-09-01 19:45:53.964318', 'Administrator', 'Administrator', 0, 0, '8207', 'KABUPATEN PULAU MOROTAI', '82', '82'),
-('8208', '2025-09-01 19:45:53.964326', '2025-09-01 19:45:53.964326', 'Administrator', 'Administrator', 0, 0, '8208', 'KABUPATEN PULAU TALIABU', '82', '82'),
-('8271', '2025-09-01 19:45:53.964336', '2025-09-01 19:45:53.964336', 'Administrator', 'Administrator', 0, 0, '8271', 'KOTA TERNATE', '82', '82'),
-('8272', '2025-09-01 19:45:53.964348', '2025-09-01 19:45:53.964348', 'Administrator', 'Administrator', 0, 0, '8272', 'KOTA TIDORE KEPULAUAN', '82', '82'),
-('9101', '2025-09-01 19:45:53.964360', '2025-09-01 19:45:53.964360', 'Administrator', 'Administrator', 0, 0, '9101', 'KABUPATEN FAKFAK', '91', '91'),
-('9102', '2025-09-01 19:45:53.964370', '2025-09-01 19:45:53.964370', 'Administrator', 'Administrator', 0, 0, '9102', 'KABUPATEN KAIMANA', '91', '91'),
-('9103', '2025-09-01 19:45:53.964377', '2025-09-01 19:45:53.964377', 'Administrator', 'Administrator', 0, 0, '9103', 'KABUPATEN TELUK WONDAMA', '91', '91'),
-('9104', '2025-09-01 19:45:53.964391', '2025-09-01 19:45:53.964391', 'Administrator', 'Administrator', 0, 0, '9104', 'KABUPATEN TELUK BINTUNI', '91', '91'),
-('9105', '2025-09-01 19:45:53.964409', '2025-09-01 19:45:53.964409', 'Administrator', 'Administrator', 0, 0, '9105', 'KABUPATEN MANOKWARI', '91', '91'),
-('9106', '2025-09-01 19:45:53.964421', '2025-09-01 19:45:53.964421', 'Administrator', 'Administrator', 0, 0, '9106', 'KABUPATEN SORONG SELATAN', '91', '91'),
-('9107', '2025-09-01 19:45:53.964434', '2025-09-01 19:45:53.964434', 'Administrator', 'Administrator', 0, 0, '9107', 'KABUPATEN SORONG', '91', '91'),
-('9108', '2025-09-01 19:45:53.964449', '2025-09-01 19:45:53.964449', 'Administrator', 'Administrator', 0, 0, '9108', 'KABUPATEN RAJA AMPAT', '91', '91'),
-('9109', '2025-09-01 19:45:53.964459', '2025-09-01 19:45:53.964459', 'Administrator', 'Administrator', 0, 0, '9109', 'KABUPATEN TAMBRAUW', '91', '91'),
-('9110', '2025-09-01 19:45:53.964482', '2025-09-01 19:45:53.964482', 'Administrator', 'Administrator', 0, 0, '9110', 'KABUPATEN MAYBRAT', '91', '91'),
-('9111', '2025-09-01 19:45:53.964494', '2025-09-01 19:45:53.964494', 'Administrator', 'Administrator', 0, 0, '9111', 'KABUPATEN MANOKWARI SELATAN', '91', '91'),
-('9112', '2025-09-01 19:45:53.964500', '2025-09-01 19:45:53.964500', 'Administrator', 'Administrator', 0, 0, '9112', 'KABUPATEN PEGUNUNGAN ARFAK', '91', '91'),
-('9171', '2025-09-01 19:45:53.964507', '2025-09-01 19:45:53.964507', 'Administrator', 'Administrator', 0, 0, '9171', 'KOTA SORONG', '91', '91'),
-('9401', '2025-09-01 19:45:53.964514', '2025-09-01 19:45:53.964514', 'Administrator', 'Administrator', 0, 0, '9401', 'KABUPATEN MERAUKE', '94', '94'),
-('9402', '2025-09-01 19:45:53.964520', '2025-09-01 19:45:53.964520', 'Administrator', 'Administrator', 0, 0, '9402', 'KABUPATEN JAYAWIJAYA', '94', '94'),
-('9403', '2025-09-01 19:45:53.964533', '2025-09-01 19:45:53.964533', 'Administrator', 'Administrator', 0, 0, '9403', 'KABUPATEN JAYAPURA', '94', '94'),
-('9404', '2025-09-01 19:45:53.964542', '2025-09-01 19:45:53.964542', 'Administrator', 'Administrator', 0, 0, '9404', 'KABUPATEN NABIRE', '94', '94'),
-('9408', '2025-09-01 19:45:53.964549', '2025-09-01 19:45:53.964549', 'Administrator', 'Administrator', 0, 0, '9408', 'KABUPATEN KEPULAUAN YAPEN', '94', '94'),
-('9409', '2025-09-01 19:45:53.964556', '2025-09-01 19:45:53.964556', 'Administrator', 'Administrator', 0, 0, '9409', 'KABUPATEN BIAK NUMFOR', '94', '94'),
-('9410', '2025-09-01 19:45:53.964562', '2025-09-01 19:45:53.964562', 'Administrator', 'Administrator', 0, 0, '9410', 'KABUPATEN PANIAI', '94', '94'),
-('9411', '2025-09-01 19:45:53.964569', '2025-09-01 19:45:53.964569', 'Administrator', 'Administrator', 0, 0, '9411', 'KABUPATEN PUNCAK JAYA', '94', '94'),
-('9412', '2025-09-01 19:45:53.964575', '2025-09-01 19:45:53.964575', 'Administrator', 'Administrator', 0, 0, '9412', 'KABUPATEN MIMIKA', '94', '94'),
-('9413', '2025-09-01 19:45:53.964581', '2025-09-01 19:45:53.964581', 'Administrator', 'Administrator', 0, 0, '9413', 'KABUPATEN BOVEN DIGOEL', '94', '94'),
-('9414', '2025-09-01 19:45:53.964587', '2025-09-01 19:45:53.964587', 'Administrator', 'Administrator', 0, 0, '9414', 'KABUPATEN MAPPI', '94', '94'),
-('9415', '2025-09-01 19:45:53.964595', '2025-09-01 19:45:53.964595', 'Administrator', 'Administrator', 0, 0, '9415', 'KABUPATEN ASMAT', '94', '94'),
-('9416', '2025-09-01 19:45:53.964611', '2025-09-01 19:45:53.964611', 'Administrator', 'Administrator', 0, 0, '9416', 'KABUPATEN YAHUKIMO', '94', '94'),
-('9417', '2025-09-01 19:45:53.964626', '2025-09-01 19:45:53.964626', 'Administrator', 'Administrator', 0, 0, '9417', 'KABUPATEN PEGUNUNGAN BINTANG', '94', '94'),
-('9418', '2025-09-01 19:45:53.964652', '2025-09-01 19:45:53.964652', 'Administrator', 'Administrator', 0, 0, '9418', 'KABUPATEN TOLIKARA', '94', '94'),
-('9419', '2025-09-01 19:45:53.964663', '2025-09-01 19:45:53.964663', 'Administrator', 'Administrator', 0, 0, '9419', 'KABUPATEN SARMI', '94', '94'),
-('9420', '2025-09-01 19:45:53.964669', '2025-09-01 19:45:53.964669', 'Administrator', 'Administrator', 0, 0, '9420', 'KABUPATEN KEEROM', '94', '94'),
-('9426', '2025-09-01 19:45:53.964676', '2025-09-01 19:45:53.964676', 'Administrator', 'Administrator', 0, 0, '9426', 'KABUPATEN WAROPEN', '94', '94'),
-('9427', '2025-09-01 19:45:53.964682', '2025-09-01 19:45:53.964682', 'Administrator', 'Administrator', 0, 0, '9427', 'KABUPATEN SUPIORI', '94', '94'),
-('9428', '2025-09-01 19:45:53.964689', '2025-09-01 19:45:53.964689', 'Administrator', 'Administrator', 0, 0, '9428', 'KABUPATEN MAMBERAMO RAYA', '94', '94'),
-('9429', '2025-09-01 19:45:53.964696', '2025-09-01 19:45:53.964696', 'Administrator', 'Administrator', 0, 0, '9429', 'KABUPATEN NDUGA', '94', '94'),
-('9430', '2025-09-01 19:45:53.964702', '2025-09-01 19:45:53.964702', 'Administrator', 'Administrator', 0, 0, '9430', 'KABUPATEN LANNY JAYA', '94', '94'),
-('9431', '2025-09-01 19:45:53.964708', '2025-09-01 19:45:53.964708', 'Administrator', 'Administrator', 0, 0, '9431', 'KABUPATEN MAMBERAMO TENGAH', '94', '94'),
-('9432', '2025-09-01 19:45:53.964716', '2025-09-01 19:45:53.964716', 'Administrator', 'Administrator', 0, 0, '9432', 'KABUPATEN YALIMO', '94', '94'),
-('9433', '2025-09-01 19:45:53.964728', '2025-09-01 19:45:53.964728', 'Administrator', 'Administrator', 0, 0, '9433', 'KABUPATEN PUNCAK', '94', '94'),
-('9434', '2025-09-01 19:45:53.964739', '2025-09-01 19:45:53.964739', 'Administrator', 'Administrator', 0, 0, '9434', 'KABUPATEN DOGIYAI', '94', '94'),
-('9435', '2025-09-01 19:45:53.964750', '2025-09-01 19:45:53.964750', 'Administrator', 'Administrator', 0, 0, '9435', 'KABUPATEN INTAN JAYA', '94', '94'),
-('9436', '2025-09-01 19:45:53.964761', '2025-09-01 19:45:53.964761', 'Administrator', 'Administrator', 0, 0, '9436', 'KABUPATEN DEIYAI', '94', '94'),
-('9471', '2025-09-01 19:45:53.964778', '2025-09-01 19:45:53.964778', 'Administrator', 'Administrator', 0, 0, '9471', 'KOTA JAYAPURA', '94', '94');
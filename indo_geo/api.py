@@ -1,16 +1,37 @@
 import frappe
 from frappe import _
+from frappe.utils import cint
+from werkzeug.wrappers import Response
+
+from indo_geo.indo_geo.utils.address_matcher import MAX_ADDRESSES
+from indo_geo.indo_geo.utils.address_matcher import match_addresses as match_address_index
+from indo_geo.indo_geo.utils.code_index import CODE_LENGTHS
+from indo_geo.indo_geo.utils.http_cache import not_modified
+from indo_geo.indo_geo.utils.import_metrics import get_metrics_text
+from indo_geo.indo_geo.utils.location_cache import (
+    LOCATION_FIELDS,
+    get_children,
+    get_page,
+    get_version,
+    validate_parent,
+)
+from indo_geo.indo_geo.utils.location_resolver import resolve_codes
+from indo_geo.indo_geo.utils.location_search import search_locations as search_location_index
+
+MAX_BULK_CODES = 100000
+
+# Rows per page of get_districts/get_villages without a parent or with `limit`
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 2000
 
 
 @frappe.whitelist()
 def get_provinces():
     """Get all provinces for autocomplete"""
     try:
-        provinces = frappe.get_all(
-            "Province",
-            fields=["name", "province_name", "province_code"],
-            order_by="province_name asc"
-        )
+        if not_modified(["Province"]):
+            return None
+        provinces = get_children("Province")
         return {"status": "success", "data": provinces}
     except Exception as e:
         frappe.log_error(f"Error fetching provinces: {e!s}")
@@ -19,17 +40,11 @@ def get_provinces():
 @frappe.whitelist()
 def get_regencies(province=None):
     """Get regencies filtered by province for autocomplete"""
+    validate_parent("Regency", province)
     try:
-        filters = {}
-        if province:
-            filters["province"] = province
-
-        regencies = frappe.get_all(
-            "Regency",
-            filters=filters,
-            fields=["name", "regency_name", "regency_code", "province"],
-            order_by="regency_name asc"
-        )
+        if not_modified(["Regency"], province):
+            return None
+        regencies = get_children("Regency", province or None)
         return {"status": "success", "data": regencies}
     except Exception as e:
         frappe.log_error(f"Error fetching regencies: {e!s}")
@@ -37,37 +52,134 @@ def get_regencies(province=None):
 
 
 @frappe.whitelist()
-def get_districts(regency=None):
-    """Get districts filtered by regency for autocomplete"""
+def get_districts(regency=None, limit=None, after=None, fields=None):
+    """Get districts filtered by regency for autocomplete, or page through them by code"""
+    page = _parse_page_args("District", regency, limit, after, fields)
     try:
-        filters = {}
-        if regency:
-            filters["regency"] = regency
-        districts = frappe.get_all(
-            "District",
-            filters=filters,
-            fields=["name", "district_name", "district_code", "regency", "province"],
-            order_by="district_name asc"
-        )
+        if not_modified(["District"], regency, page):
+            return None
+        if page:
+            return _get_page("District", regency, *page)
+        districts = get_children("District", regency or None)
         return {"status": "success", "data": districts}
     except Exception as e:
         frappe.log_error(f"Error fetching districts: {e!s}")
         return {"status": "error", "message": _("Error fetching districts")}
 
 @frappe.whitelist()
-def get_villages(district=None):
-    """Get villages filtered by district for autocomplete"""
+def get_villages(district=None, limit=None, after=None, fields=None):
+    """Get villages filtered by district for autocomplete, or page through them by code"""
+    page = _parse_page_args("Village", district, limit, after, fields)
     try:
-        filters = {}
-        if district:
-            filters["district"] = district
-        villages = frappe.get_all(
-            "Village",
-            filters=filters,
-            fields=["name", "village_name", "village_code", "district", "regency", "province"],
-            order_by="village_name asc"
-        )
+        if not_modified(["Village"], district, page):
+            return None
+        if page:
+            return _get_page("Village", district, *page)
+        villages = get_children("Village", district or None)
         return {"status": "success", "data": villages}
     except Exception as e:
         frappe.log_error(f"Error fetching villages: {e!s}")
         return {"status": "error", "message": _("Error fetching villages")}
+
+
+def _parse_page_args(doctype, parent, limit, after, fields):
+    """Validate paging arguments; return (limit, after, fields), or None for an unpaged request.
+
+    Requests without a parent are always paged, so no call returns a whole table,
+    and a parent must be a code of the level right above, so neither does one with it.
+    """
+    validate_parent(doctype, parent)
+    if parent and not (limit or after or fields):
+        return None
+
+    limit = cint(limit) or DEFAULT_PAGE_SIZE
+    if not 0 < limit <= MAX_PAGE_SIZE:
+        frappe.throw(_("Limit must be between 1 and {0}").format(MAX_PAGE_SIZE))
+
+    if after and (not after.isdigit() or len(after) != CODE_LENGTHS[doctype]):
+        frappe.throw(_("After must be a {0} code").format(doctype))
+
+    if fields:
+        if isinstance(fields, str):
+            fields = frappe.parse_json(fields) if fields.startswith("[") else fields.split(",")
+        fields = tuple(field.strip() for field in fields)
+        invalid = [field for field in fields if field not in LOCATION_FIELDS[doctype]]
+        if invalid:
+            frappe.throw(_("Unknown fields: {0}").format(", ".join(invalid)))
+    else:
+        fields = tuple(LOCATION_FIELDS[doctype])
+
+    return limit, after or None, fields
+
+
+def _get_page(doctype, parent, limit, after, fields):
+    rows, has_more = get_page(doctype, parent or None, after, limit)
+    code_field = LOCATION_FIELDS[doctype][2]
+    return {
+        "status": "success",
+        "data": [{field: row[field] for field in fields} for row in rows],
+        "next_after": rows[-1][code_field] if has_more else None,
+    }
+
+
+@frappe.whitelist()
+def get_dataset_version():
+    """Get the version of the location data, which changes whenever any location changes"""
+    return "-".join(get_version(doctype) for doctype in LOCATION_FIELDS)
+
+
+@frappe.whitelist()
+def search_locations(q, level=None, parent=None, limit=20):
+    """Typeahead search over all location names, with each hit's hierarchy path"""
+    if level and level not in LOCATION_FIELDS:
+        frappe.throw(_("Level must be one of {0}").format(", ".join(LOCATION_FIELDS)))
+
+    try:
+        if not_modified(list(LOCATION_FIELDS), q, level, parent, limit):
+            return None
+        results = search_location_index(q, level=level or None, parent=parent or None, limit=cint(limit) or 20)
+        return {"status": "success", "data": results}
+    except Exception as e:
+        frappe.log_error(f"Error searching locations: {e!s}")
+        return {"status": "error", "message": _("Error searching locations")}
+
+
+@frappe.whitelist()
+def resolve_codes_bulk(codes):
+    """Resolve a list of location codes at any level to their name path, parent codes and validity"""
+    codes = frappe.parse_json(codes) if isinstance(codes, str) else codes
+    if not isinstance(codes, list):
+        frappe.throw(_("Codes must be a list"))
+    if len(codes) > MAX_BULK_CODES:
+        frappe.throw(_("At most {0} codes can be resolved per request").format(MAX_BULK_CODES))
+
+    try:
+        return {"status": "success", "data": resolve_codes(codes)}
+    except Exception as e:
+        frappe.log_error(f"Error resolving location codes: {e!s}")
+        return {"status": "error", "message": _("Error resolving location codes")}
+
+
+@frappe.whitelist()
+def match_addresses(addresses):
+    """Match free-text address parts (province, regency, district, village) onto location codes"""
+    addresses = frappe.parse_json(addresses) if isinstance(addresses, str) else addresses
+    if not isinstance(addresses, list):
+        frappe.throw(_("Addresses must be a list"))
+    if len(addresses) > MAX_ADDRESSES:
+        frappe.throw(_("At most {0} addresses can be matched per request").format(MAX_ADDRESSES))
+
+    try:
+        return {"status": "success", "data": match_address_index(addresses)}
+    except Exception as e:
+        frappe.log_error(f"Error matching addresses: {e!s}")
+        return {"status": "error", "message": _("Error matching addresses")}
+
+
+@frappe.whitelist()
+def get_import_metrics():
+    """Metrics of the last run of each import and dump job, in the Prometheus text format"""
+    if not frappe.conf.get("indo_geo_metrics_endpoint"):
+        frappe.throw(_("The import metrics endpoint is not enabled"), frappe.PermissionError)
+    frappe.only_for("System Manager")
+    return Response(get_metrics_text(), mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,194 @@
+"""Benchmark harness for the location import engines.
+
+Every engine imports the same synthetic hierarchy at 1x, 10x and 100x the
+real village count into empty location tables, and each run records rows/s,
+the peak RSS of the process and the number of database round-trips to a JSON
+results file (one entry appended per invocation, so results can be compared
+over time).
+
+The tables are cleared before every run and reloaded with the shipped data at
+the end, so this only runs on a throwaway site that sets
+`indo_geo_benchmark_site: 1` in its site_config:
+
+    bench --site bench.localhost execute indo_geo.benchmarks.import_benchmark.run_benchmarks \\
+        --kwargs "{'scales': [1, 10], 'engines': ['chunked_sql', 'bulk_load']}"
+
+Round-trips are counted at the Frappe database layer, worker connections of
+the parallel engine included. The rows LOAD DATA LOCAL INFILE sends over its
+own connection count as one statement per table.
+"""
+
+import contextlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import frappe
+from frappe.utils import now
+
+from indo_geo.benchmarks.synthetic import get_real_counts, write_synthetic_data
+from indo_geo.indo_geo.utils.bulk_load import import_all_locations_bulk
+from indo_geo.indo_geo.utils.code_index import LEVELS
+from indo_geo.indo_geo.utils.import_locations import (
+    clear_all_locations,
+    import_all_locations_sql,
+    import_csv_bulk,
+    import_districts,
+    import_provinces,
+    import_regencies,
+    import_villages,
+)
+from indo_geo.indo_geo.utils.import_metrics import RssSampler
+from indo_geo.indo_geo.utils.infile_import import import_all_locations_infile
+
+SCALES = (1, 10, 100)
+
+# Connections used by the parallel engine
+PARALLEL_WORKERS = 4
+
+RESULTS_FILE = "indo_geo_import_benchmark.json"
+
+
+def _import_per_doc(data_path):
+    import_provinces(data_path)
+    import_regencies(data_path)
+    import_districts(data_path)
+    import_villages(data_path)
+
+
+def _import_csv_streaming(data_path):
+    for doctype, _length in LEVELS:
+        import_csv_bulk(data_path, doctype)
+
+
+# Engine name -> (import function taking the data path, largest scale it runs at)
+ENGINES = {
+    "per_doc": (_import_per_doc, 1),
+    "csv_streaming": (_import_csv_streaming, None),
+    "chunked_sql": (lambda data_path: import_all_locations_sql(data_path=data_path), None),
+    "parallel_sql": (lambda data_path: import_all_locations_sql(PARALLEL_WORKERS, data_path), None),
+    "bulk_load": (lambda data_path: import_all_locations_bulk(data_path=data_path), None),
+    "infile": (import_all_locations_infile, None),
+}
+
+
+def run_benchmarks(scales=SCALES, engines=None, results_file=None, verbose=False):
+    """Benchmark the import engines at each scale and append the results to `results_file`.
+
+    `results_file` defaults to `indo_geo_import_benchmark.json` in the site
+    directory. Engine output is swallowed unless `verbose` is set.
+    """
+    if not frappe.conf.get("indo_geo_benchmark_site"):
+        frappe.throw(
+            "The import benchmark deletes all location data. Run it on a throwaway site "
+            "with indo_geo_benchmark_site set in site_config."
+        )
+
+    engines = engines or list(ENGINES)
+    for engine in engines:
+        if engine not in ENGINES:
+            frappe.throw(f"Unknown import engine {engine}, expected one of {', '.join(ENGINES)}")
+
+    real_villages = get_real_counts()["Village"]
+    results = []
+    frappe.flags.in_location_benchmark = True
+    try:
+        for scale in scales:
+            data_path = tempfile.mkdtemp(prefix=f"indo_geo_benchmark_{scale}x_")
+            try:
+                print(f"Generating synthetic hierarchy at {scale}x ({real_villages * scale:,} villages)...")
+                with _quiet(verbose):
+                    expected = write_synthetic_data(data_path, real_villages * scale)
+
+                for engine in engines:
+                    import_locations, max_scale = ENGINES[engine]
+                    if max_scale and scale > max_scale:
+                        print(f"  {engine}: skipped above {max_scale}x")
+                        continue
+                    result = {"engine": engine, "scale": scale, **_run(import_locations, data_path, verbose)}
+                    result["complete"] = result["counts"] == expected
+                    results.append(result)
+                    print(
+                        f"  {engine}: {result['rows']:,} rows in {result['seconds']:.2f}s "
+                        f"({result['rows_per_second']:,.0f} rows/s), peak RSS {result['peak_rss_mb']:.0f} MB, "
+                        f"{result['db_round_trips']:,} round-trips"
+                        + ("" if result["complete"] else ", INCOMPLETE")
+                    )
+            finally:
+                shutil.rmtree(data_path, ignore_errors=True)
+    finally:
+        frappe.flags.in_location_benchmark = False
+        print("Restoring the shipped location data...")
+        with _quiet(verbose):
+            clear_all_locations()
+            import_all_locations_sql()
+
+    results_file = results_file or frappe.get_site_path(RESULTS_FILE)
+    _save_results(results_file, results)
+    print(f"Benchmark results appended to {results_file}")
+    return results
+
+
+def _run(import_locations, data_path, verbose):
+    """Import into empty tables and measure time, peak RSS and round-trips."""
+    with _quiet(verbose):
+        clear_all_locations()
+
+    sampler = RssSampler()
+    with _quiet(verbose), count_round_trips() as round_trips, sampler:
+        start_time = time.perf_counter()
+        import_locations(data_path)
+        seconds = time.perf_counter() - start_time
+
+    counts = {doctype: frappe.db.count(doctype) for doctype, _length in LEVELS}
+    rows = sum(counts.values())
+    return {
+        "rows": rows,
+        "counts": counts,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(rows / seconds) if seconds else 0,
+        "peak_rss_mb": round(sampler.peak / 1024 / 1024, 1),
+        "db_round_trips": round_trips["count"],
+    }
+
+
+@contextlib.contextmanager
+def count_round_trips():
+    """Count every query sent through the Frappe database class, on any connection."""
+    db_class = type(frappe.db)
+    original_sql = db_class.sql
+    lock = threading.Lock()
+    counter = {"count": 0}
+
+    def sql(self, *args, **kwargs):
+        with lock:
+            counter["count"] += 1
+        return original_sql(self, *args, **kwargs)
+
+    db_class.sql = sql
+    try:
+        yield counter
+    finally:
+        db_class.sql = original_sql
+
+
+@contextlib.contextmanager
+def _quiet(verbose):
+    if verbose:
+        yield
+        return
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def _save_results(results_file, results):
+    history = []
+    if os.path.exists(results_file):
+        with open(results_file, encoding="utf-8") as f:
+            history = json.load(f)
+    history.append({"site": frappe.local.site, "timestamp": now(), "results": results})
+    with open(results_file, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=1)
@@ -0,0 +1,126 @@
+"""Synthetic location hierarchies for the import benchmarks.
+
+A hierarchy is written as the shipped 2-column CSV files (plus the SQL dumps
+the chunked SQL engines read), with valid Kemendagri codes whose parents can
+be derived by slicing. Village codes only have three digits below their
+district, so the larger scales are not the real hierarchy repeated: provinces
+and regencies keep their real counts and the districts of every regency and
+the villages of every district grow together, both well below the limit.
+"""
+
+import csv
+import math
+import os
+import random
+
+from indo_geo.indo_geo.utils.dump_locations import (
+    convert_districts_csv_to_sql,
+    convert_provinces_csv_to_sql,
+    convert_regencies_csv_to_sql,
+    convert_villages_csv_to_sql,
+)
+from indo_geo.indo_geo.utils.location_data import CSV_FILES, find_data_file, get_data_path, open_data_file
+
+# Real counts, used when the shipped data files cannot be read
+REAL_COUNTS = {"Province": 34, "Regency": 514, "District": 7215, "Village": 80534}
+
+# Children codes available below one parent
+MAX_CHILDREN = {"Regency": 99, "District": 999, "Village": 999}
+
+SYLLABLES = [
+    "BA", "BU", "DA", "DE", "GA", "JA", "KA", "KE", "KO", "LA", "MA", "ME", "NA",
+    "NG", "PA", "RA", "RE", "SA", "SE", "SI", "TA", "TU", "WA", "WI", "YA",
+]
+
+
+def get_real_counts(data_path=None):
+    """Return the row count of each shipped CSV file."""
+    data_path = data_path or get_data_path()
+    counts = {}
+    for doctype, file_name in CSV_FILES.items():
+        try:
+            with open_data_file(find_data_file(os.path.join(data_path, file_name))) as f:
+                counts[doctype] = sum(1 for line in f if line.strip())
+        except OSError:
+            counts[doctype] = REAL_COUNTS[doctype]
+    return counts
+
+
+def get_shape(villages, provinces=REAL_COUNTS["Province"], regencies=REAL_COUNTS["Regency"]):
+    """Return the number of children per parent at each level for a target village count.
+
+    Districts per regency and villages per district are kept close to each
+    other, the way the real data is shaped.
+    """
+    regencies_per_province = math.ceil(regencies / provinces)
+    per_regency = villages / (provinces * regencies_per_province)
+    districts_per_regency = max(1, math.ceil(math.sqrt(per_regency)))
+    villages_per_district = math.ceil(per_regency / districts_per_regency)
+    shape = {
+        "Province": provinces,
+        "Regency": regencies_per_province,
+        "District": districts_per_regency,
+        "Village": villages_per_district,
+    }
+    for doctype, limit in MAX_CHILDREN.items():
+        if shape[doctype] > limit:
+            raise ValueError(f"{villages} villages need {shape[doctype]} {doctype} codes per parent")
+    return shape
+
+
+def iter_synthetic_locations(villages, seed=0):
+    """Yield (doctype, code, name) for a hierarchy of exactly `villages` villages.
+
+    Parents are always yielded before their children. Generation stops at the
+    last village, so the last province may be smaller than the others.
+    """
+    shape = get_shape(villages)
+    rng = random.Random(seed)
+    remaining = villages
+    for p in range(shape["Province"]):
+        province = f"{11 + p:02d}"
+        yield "Province", province, _name(rng)
+        for r in range(shape["Regency"]):
+            regency = f"{province}{1 + r:02d}"
+            yield "Regency", regency, _name(rng)
+            for d in range(shape["District"]):
+                district = f"{regency}{1 + d:03d}"
+                yield "District", district, _name(rng)
+                for v in range(min(shape["Village"], remaining)):
+                    yield "Village", f"{district}{1 + v:03d}", _name(rng)
+                remaining -= min(shape["Village"], remaining)
+                if not remaining:
+                    return
+
+
+def write_synthetic_data(data_path, villages, seed=0, sql=True):
+    """Write the CSV files (and, with `sql`, the SQL dumps) of a synthetic hierarchy.
+
+    Returns the number of rows written per doctype.
+    """
+    os.makedirs(data_path, exist_ok=True)
+    files = {doctype: open(os.path.join(data_path, name), "w", encoding="utf-8", newline="")
+        for doctype, name in CSV_FILES.items()}
+    counts = dict.fromkeys(CSV_FILES, 0)
+    try:
+        writers = {doctype: csv.writer(f) for doctype, f in files.items()}
+        for doctype, code, name in iter_synthetic_locations(villages, seed):
+            writers[doctype].writerow((code, name))
+            counts[doctype] += 1
+    finally:
+        for f in files.values():
+            f.close()
+
+    if sql:
+        sql_path = os.path.join(data_path, "sql")
+        os.makedirs(sql_path, exist_ok=True)
+        convert_provinces_csv_to_sql(data_path, sql_path)
+        convert_regencies_csv_to_sql(data_path, sql_path)
+        convert_districts_csv_to_sql(data_path, sql_path)
+        convert_villages_csv_to_sql(data_path, sql_path)
+
+    return counts
+
+
+def _name(rng):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
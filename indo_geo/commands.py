@@ -0,0 +1,22 @@
+import click
+import frappe
+from frappe.commands import get_site, pass_context
+
+
+@click.command("build-location-bundle")
+@pass_context
+def build_location_bundle(context):
+    """Write the static JSON shards of the location hierarchy into the site's public files"""
+    from indo_geo.indo_geo.utils.static_bundle import build_location_bundle
+
+    frappe.init(site=get_site(context))
+    try:
+        frappe.connect()
+        # Run from a terminal, so say what was written
+        frappe.flags.indo_geo_verbose = True
+        build_location_bundle()
+    finally:
+        frappe.destroy()
+
+
+commands = [build_location_bundle]
@@ -27,10 +27,15 @@ app_license = "unlicense"
 # include js, css files in header of desk.html
 # app_include_css = "/assets/indo_geo/css/indo_geo.css"
 # app_include_js = "/assets/indo_geo/js/indo_geo.js"
+app_include_js = [
+	"/assets/indo_geo/js/location_bundle.js",
+	"/assets/indo_geo/js/location_picker.js",
+]
 
 # include js, css files in header of web template
 # web_include_css = "/assets/indo_geo/css/indo_geo.css"
 # web_include_js = "/assets/indo_geo/js/indo_geo.js"
+web_include_js = "/assets/indo_geo/js/location_bundle.js"
 
 # include custom scss in every website theme (without file extension ".scss")
 # website_theme_scss = "indo_geo/public/scss/website"
@@ -148,23 +153,11 @@ after_install = "indo_geo.install.after_install"
 # Scheduled Tasks
 # ---------------
 
-# scheduler_events = {
-# 	"all": [
-# 		"indo_geo.tasks.all"
-# 	],
-# 	"daily": [
-# 		"indo_geo.tasks.daily"
-# 	],
-# 	"hourly": [
-# 		"indo_geo.tasks.hourly"
-# 	],
-# 	"weekly": [
-# 		"indo_geo.tasks.weekly"
-# 	],
-# 	"monthly": [
-# 		"indo_geo.tasks.monthly"
-# 	],
-# }
+scheduler_events = {
+	"all": [
+		"indo_geo.indo_geo.utils.import_job.resume_location_import"
+	],
+}
 
 # Testing
 # -------
@@ -4,6 +4,11 @@
 import frappe
 from frappe.model.document import Document
 
+from indo_geo.indo_geo.utils.code_index import parent_code
+from indo_geo.indo_geo.utils.location_cache import clear_location_cache
+from indo_geo.indo_geo.utils.location_indexes import add_location_indexes
+from indo_geo.indo_geo.utils.location_validation import validate_location
+
 
 class District(Document):
     """
@@ -33,21 +38,15 @@ class District(Document):
 
     def validate(self):
         """Called during document validation."""
-        # Validate district code is exactly 7 digits
-        if not self.district_code or not self.district_code.isdigit() or len(self.district_code) != 7:
-            frappe.throw("District Code must be exactly 7 digits")
+        # Validate district code is exactly 7 digits and matches the linked regency
+        validate_location("District", self.district_code, self.regency)
 
         # Extract regency code from district code (first 4 digits)
-        self.regency_code = self.district_code[:4]
+        self.regency_code = parent_code(self.district_code)
 
-        # Validate regency code matches linked regency
+        # Set province from regency
         if self.regency:
-            regency_doc = frappe.get_doc("Regency", self.regency)
-            if regency_doc.regency_code != self.regency_code:
-                frappe.throw(f"Regency code mismatch. District code {self.district_code} should belong to regency {self.regency_code}, not {regency_doc.regency_code}")
-
-            # Set province from regency
-            self.province = regency_doc.province
+            self.province = parent_code(self.regency_code)
 
         # Set title for display
         self.title = self.district_name
@@ -62,8 +61,13 @@ class District(Document):
 
     def on_update(self):
         """Called after updating the document."""
-        pass
+        clear_location_cache(self)
 
     def on_trash(self):
         """Called when the document is being deleted."""
-        pass
+        clear_location_cache(self)
+
+
+def on_doctype_update():
+    # Empty tables get their indexes after the bulk import instead
+    add_location_indexes("District", only_if_populated=True)
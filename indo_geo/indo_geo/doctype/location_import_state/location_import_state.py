@@ -0,0 +1,30 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# For license information, please see license.txt
+
+from frappe.model.document import Document
+
+
+class LocationImportState(Document):
+    """
+    Location Import State DocType Controller
+
+    Checkpoint of the background location import for one location doctype,
+    written by indo_geo.indo_geo.utils.import_job in the same transaction as
+    the rows it describes.
+    """
+    # begin: auto-generated types
+    # This code is auto-generated. Do not modify anything in this block.
+
+    from typing import TYPE_CHECKING
+
+    if TYPE_CHECKING:
+        from frappe.types import DF
+
+        error: DF.SmallText | None
+        last_code: DF.Data | None
+        location_doctype: DF.Literal["Province", "Regency", "District", "Village"]
+        rows_imported: DF.Int
+        rows_processed: DF.Int
+        status: DF.Literal["Pending", "Running", "Completed", "Failed"]
+        total_rows: DF.Int
+    # end: auto-generated types
@@ -5,6 +5,9 @@ import frappe
 from frappe import _
 from frappe.model.document import Document
 
+from indo_geo.indo_geo.utils.location_cache import clear_location_cache
+from indo_geo.indo_geo.utils.location_validation import validate_location
+
 
 class Province(Document):
     """
@@ -32,8 +35,7 @@ class Province(Document):
     def validate(self):
         """Called during document validation."""
         # Validate province code is exactly 2 digits
-        if not self.province_code or not self.province_code.isdigit() or len(self.province_code) != 2:
-            frappe.throw("Province Code must be exactly 2 digits")
+        validate_location("Province", self.province_code)
 
         # Set title for display
         self.title = self.province_name
@@ -48,10 +50,10 @@ class Province(Document):
 
     def on_update(self):
         """Called after updating the document."""
-        pass
+        clear_location_cache(self)
 
     def on_trash(self):
         """Called when the document is being deleted."""
-        pass
+        clear_location_cache(self)
 
 
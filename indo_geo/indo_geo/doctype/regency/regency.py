@@ -5,6 +5,11 @@ import frappe
 from frappe import _
 from frappe.model.document import Document
 
+from indo_geo.indo_geo.utils.code_index import parent_code
+from indo_geo.indo_geo.utils.location_cache import clear_location_cache
+from indo_geo.indo_geo.utils.location_indexes import add_location_indexes
+from indo_geo.indo_geo.utils.location_validation import validate_location
+
 
 class Regency(Document):
     """
@@ -33,18 +38,11 @@ class Regency(Document):
 
     def validate(self):
         """Called during document validation."""
-        # Validate regency code is exactly 4 digits
-        if not self.regency_code or not self.regency_code.isdigit() or len(self.regency_code) != 4:
-            frappe.throw("Regency Code must be exactly 4 digits")
+        # Validate regency code is exactly 4 digits and matches the linked province
+        validate_location("Regency", self.regency_code, self.province)
 
         # Extract province code from regency code (first 2 digits)
-        self.province_code = self.regency_code[:2]
-
-        # Validate province code matches linked province
-        if self.province:
-            province_doc = frappe.get_doc("Province", self.province)
-            if province_doc.province_code != self.province_code:
-                frappe.throw(f"Province code mismatch. Regency code {self.regency_code} should belong to province {self.province_code}, not {province_doc.province_code}")
+        self.province_code = parent_code(self.regency_code)
 
         # Set title for display
         self.title = self.regency_name
@@ -59,11 +57,13 @@ class Regency(Document):
 
     def on_update(self):
         """Called after updating the document."""
-        pass
+        clear_location_cache(self)
 
     def on_trash(self):
         """Called when the document is being deleted."""
-        pass
-
+        clear_location_cache(self)
 
 
+def on_doctype_update():
+    # Empty tables get their indexes after the bulk import instead
+    add_location_indexes("Regency", only_if_populated=True)
@@ -1,6 +1,12 @@
 // Copyright (c) 2025, core_banking
 // For license information, please see license.txt
 
+// Pick the parent from a locally filtered list scoped by the code being entered
+indo_geo.location_picker.setup('Village', {
+    fields: { District: "district" },
+    code_field: "village_code",
+});
+
 frappe.ui.form.on('Village', {
     refresh: function(frm) {
         // Called when the form is loaded or refreshed
@@ -4,6 +4,11 @@
 import frappe
 from frappe.model.document import Document
 
+from indo_geo.indo_geo.utils.code_index import ancestor_codes
+from indo_geo.indo_geo.utils.location_cache import clear_location_cache
+from indo_geo.indo_geo.utils.location_indexes import add_location_indexes
+from indo_geo.indo_geo.utils.location_validation import validate_location
+
 
 class Village(Document):
     """
@@ -33,9 +38,12 @@ class Village(Document):
 
     def validate(self):
         """Called during document validation."""
-        # Validate village code is exactly 10 digits
-        if not self.village_code or not self.village_code.isdigit() or len(self.village_code) != 10:
-            frappe.throw("Village Code must be exactly 10 digits")
+        # Validate village code is exactly 10 digits and matches the linked district
+        validate_location("Village", self.village_code, self.district)
+
+        # Set regency and province from district
+        if self.district:
+            self.province, self.regency = ancestor_codes(self.district)
 
         # Set title for display
         self.title = self.village_name
@@ -50,8 +58,13 @@ class Village(Document):
 
     def on_update(self):
         """Called after updating the document."""
-        pass
+        clear_location_cache(self)
 
     def on_trash(self):
         """Called when the document is being deleted."""
-        pass
+        clear_location_cache(self)
+
+
+def on_doctype_update():
+    # Empty tables get their indexes after the bulk import instead
+    add_location_indexes("Village", only_if_populated=True)
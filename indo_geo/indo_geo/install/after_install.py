@@ -6,14 +6,31 @@ when the indo_geo app is installed using HIGH-PERFORMANCE SQL bulk import.
 
 import os
 import time
+from itertools import islice
 
 import frappe
-from frappe import _
-
-
+from frappe.utils import now_datetime
+
+from indo_geo.indo_geo.utils.code_index import LEVELS, PARENT_DOCTYPES
+from indo_geo.indo_geo.utils.import_job import build_valid_rows
+from indo_geo.indo_geo.utils.import_metrics import current_job, report, timed_commit, tracked, warn
+from indo_geo.indo_geo.utils.location_cache import bump_version
+from indo_geo.indo_geo.utils.location_data import (
+    CSV_FILES,
+    TABLE_COLUMNS,
+    TIMESTAMP_FORMAT,
+    find_data_file,
+    get_data_path,
+    iter_csv_locations,
+)
+from indo_geo.indo_geo.utils.location_indexes import add_location_indexes
+from indo_geo.indo_geo.utils.static_bundle import rebuild_after_import
+
+
+@tracked
 def after_install():
     """Main installation function that imports all location data using SQL bulk import"""
-    print("🚀 Starting Indo Geo HIGH-PERFORMANCE installation...")
+    report("Starting Indo Geo installation...")
     start_time = time.time()
 
     try:
@@ -26,235 +43,104 @@ def after_install():
         # convert_csv_to_sql()
 
         # Import using lightning-fast SQL bulk method
-        print("⚡ Executing SQL bulk import...")
+        report("Executing SQL bulk import...")
         import_all_locations_sql()
 
         frappe.db.commit()
 
         end_time = time.time()
         total_time = end_time - start_time
-        print(f"🎉 Indo Geo installation completed successfully in {total_time:.2f} seconds!")
-        print("📊 Performance Achievement: ~2,700x faster than traditional import!")
+        report(f"Indo Geo installation completed successfully in {total_time:.2f} seconds!")
 
     except Exception as e:
         frappe.db.rollback()
         frappe.log_error(frappe.get_traceback(), "Indo Geo Installation Failed")
-        print(f"❌ Installation failed: {e!s}")
+        warn(f"Installation failed: {e!s}")
 
         # Fallback to traditional import if SQL method fails
-        print("🔄 Attempting fallback to traditional import method...")
+        warn("Attempting fallback to batched CSV import method...")
         try:
             fallback_import()
             frappe.db.commit()
             end_time = time.time()
             total_time = end_time - start_time
-            print(f"✅ Indo Geo installation completed using fallback method in {total_time:.2f} seconds")
+            report(f"Indo Geo installation completed using fallback method in {total_time:.2f} seconds")
         except Exception as fallback_error:
             frappe.db.rollback()
-            print(f"❌ Fallback import also failed: {fallback_error!s}")
+            warn(f"Fallback import also failed: {fallback_error!s}")
             raise
 
 
+@tracked
 def fallback_import():
-    """Fallback to traditional CSV import method if SQL bulk import fails"""
-    print("📋 Using traditional CSV import as fallback...")
+    """Fallback to a batched CSV import if SQL bulk import fails"""
+    report("Using batched CSV import as fallback...")
+
+    existing = {}
+    for doctype, _length in LEVELS:
+        existing[doctype] = set(frappe.db.sql_list(f"SELECT `name` FROM `tab{doctype}`"))
+        import_locations_batched(doctype, existing)
 
-    # Import the original functions
-    import_provinces()
-    import_regencies()
-    import_districts()
-    import_villages()
+    # Rows are written without document hooks, so invalidate cached hierarchies here
+    bump_version()
+    add_location_indexes()
+    rebuild_after_import()
 
 
 # ===============================================
-# FALLBACK FUNCTIONS (Traditional CSV Import)
+# FALLBACK FUNCTIONS (Batched CSV Import)
 # ===============================================
-# These functions are kept as fallback in case SQL bulk import fails
-
-def get_data_file_path(filename):
-    """Get absolute path to data file"""
-    app_path = frappe.get_app_path("indo_geo")
-    return os.path.join(app_path, "..", "data", filename)
-
-
-def import_provinces():
-    """Import provinces data from CSV"""
-    print("📍 Importing provinces...")
-
-    file_path = get_data_file_path("provinces.csv")
-    if not os.path.exists(file_path):
-        print(f"⚠️  Province data file not found: {file_path}")
-        return
-
-    count = 0
-    with open(file_path, encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
-
-        for row in reader:
-            if len(row) >= 2:
-                province_code = row[0]
-                province_name = row[1]
+# Used in case SQL bulk import fails. Rows get the same checks as the
+# location controllers, but parents are checked against in-memory code sets
+# and rows are written FALLBACK_BATCH_SIZE at a time instead of one insert()
+# each.
 
-                # Check if province already exists
-                if not frappe.db.exists("Province", province_code):
-                    doc = frappe.get_doc({
-                        "doctype": "Province",
-                        "province_code": province_code,
-                        "province_name": province_name
-                    })
-                    doc.insert()
-                    count += 1
+# Rows validated and inserted per batch
+FALLBACK_BATCH_SIZE = 2000
 
-    print(f"   ✓ Imported {count} provinces")
 
+def import_locations_batched(doctype, existing):
+    """Import one location doctype from its CSV file in validated batches.
 
-def import_regencies():
-    """Import regencies data from CSV"""
-    print("🏘️  Importing regencies...")
+    `existing` maps each doctype to the set of codes already in the database
+    and is updated with the inserted codes, so the parents of the next level
+    never have to be queried. As with the per-document import, locations that
+    already exist and locations whose parent is missing are skipped; any other
+    invalid row stops the import.
+    """
+    report(f"Importing {doctype} records...")
 
-    file_path = get_data_file_path("regencies.csv")
+    data_path = get_data_path()
+    file_path = find_data_file(os.path.join(data_path, CSV_FILES[doctype]))
     if not os.path.exists(file_path):
-        print(f"⚠️  Regency data file not found: {file_path}")
-        return
+        warn(f"{doctype} data file not found: {file_path}")
+        return 0
 
-    count = 0
-    with open(file_path, encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
-
-        for row in reader:
-            if len(row) >= 2:
-                regency_code = row[0]
-                regency_name = row[1]
-                province_code = regency_code[:2]  # First 2 digits for province
-
-                # Get province name
-                province = frappe.db.get_value("Province", province_code, "name")
-                if not province:
-                    print(f"⚠️  Province {province_code} not found for regency {regency_code}")
-                    continue
-
-                # Check if regency already exists
-                if not frappe.db.exists("Regency", regency_code):
-                    doc = frappe.get_doc({
-                        "doctype": "Regency",
-                        "regency_code": regency_code,
-                        "regency_name": regency_name,
-                        "province": province,
-                        "province_code": province_code
-                    })
-                    doc.insert()
-                    count += 1
-
-    print(f"   ✓ Imported {count} regencies")
-
-
-def import_districts():
-    """Import districts data from CSV"""
-    print("🌆 Importing districts...")
-
-    file_path = get_data_file_path("districts.csv")
-    if not os.path.exists(file_path):
-        print(f"⚠️  District data file not found: {file_path}")
-        return
+    codes = existing[doctype]
+    parent_doctype = PARENT_DOCTYPES.get(doctype)
+    parent_codes = existing[parent_doctype] if parent_doctype else None
+    timestamp = now_datetime().strftime(TIMESTAMP_FORMAT)
+    owner = frappe.session.user
 
+    job = current_job()
+    job.add_bytes(os.path.getsize(file_path))
     count = 0
-    batch_size = 1000  # Process in batches to avoid memory issues
-    batch_count = 0
-
-    with open(file_path, encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
-
-        for row in reader:
-            if len(row) >= 2:
-                district_code = row[0]
-                district_name = row[1]
-                regency_code = district_code[:4]  # First 4 digits for regency
-                province_code = district_code[:2]  # First 2 digits for province
-
-                # Get regency and province
-                regency = frappe.db.get_value("Regency", regency_code, "name")
-                province = frappe.db.get_value("Province", province_code, "name")
-
-                if not regency:
-                    print(f"⚠️  Regency {regency_code} not found for district {district_code}")
-                    continue
-
-                # Check if district already exists
-                if not frappe.db.exists("District", district_code):
-                    doc = frappe.get_doc({
-                        "doctype": "District",
-                        "district_code": district_code,
-                        "district_name": district_name,
-                        "regency": regency,
-                        "province": province,
-                        "regency_code": regency_code
-                    })
-                    doc.insert()
-                    count += 1
-                    batch_count += 1
-
-                    # Commit every batch_size records
-                    if batch_count >= batch_size:
-                        frappe.db.commit()
-                        batch_count = 0
-                        print(f"   📦 Processed {count} districts...")
-
-    print(f"   ✓ Imported {count} districts")
-
-
-def import_villages():
-    """Import villages data from CSV (FALLBACK METHOD - slow but reliable)"""
-    print("🏡 Importing villages using traditional method (this may take a while)...")
-
-    file_path = get_data_file_path("villages.csv")
-    if not os.path.exists(file_path):
-        print(f"⚠️  Village data file not found: {file_path}")
-        return
-
-    count = 0
-    batch_size = 2000  # Process in larger batches for villages
-    batch_count = 0
-
-    with open(file_path, encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
-
-        for row in reader:
-            if len(row) >= 2:
-                village_code = row[0]
-                village_name = row[1]
-                district_code = village_code[:7]  # First 7 digits for district
-                regency_code = village_code[:4]   # First 4 digits for regency
-                province_code = village_code[:2]  # First 2 digits for province
-
-                # Get parent locations
-                district = frappe.db.get_value("District", district_code, "name")
-                regency = frappe.db.get_value("Regency", regency_code, "name")
-                province = frappe.db.get_value("Province", province_code, "name")
-
-                if not district:
-                    print(f"⚠️  District {district_code} not found for village {village_code}")
-                    continue
-
-                # Check if village already exists
-                if not frappe.db.exists("Village", village_code):
-                    doc = frappe.get_doc({
-                        "doctype": "Village",
-                        "village_code": village_code,
-                        "village_name": village_name,
-                        "district": district,
-                        "regency": regency,
-                        "province": province,
-                        "district_code": district_code
-                    })
-                    doc.insert()
-                    count += 1
-                    batch_count += 1
-
-                    # Commit every batch_size records
-                    if batch_count >= batch_size:
-                        frappe.db.commit()
-                        batch_count = 0
-                        print(f"   📦 Processed {count} villages...")
-
-    print(f"   ✓ Imported {count} villages")
-
+    locations = iter_csv_locations(data_path, doctype)
+    while True:
+        with job.span("read"):
+            batch = list(islice(locations, FALLBACK_BATCH_SIZE))
+        if not batch:
+            break
+
+        with job.span("transform"):
+            rows = build_valid_rows(doctype, batch, parent_codes, codes, timestamp, owner)
+        with job.span("execute"):
+            frappe.db.bulk_insert(doctype, TABLE_COLUMNS[doctype], rows, chunk_size=FALLBACK_BATCH_SIZE)
+        timed_commit()
+        count += len(rows)
+        if len(batch) == FALLBACK_BATCH_SIZE:
+            report(f"  Processed {count} {doctype} records...")
+
+    job.add_rows(count)
+    report(f"Imported {count} {doctype} records")
+    return count
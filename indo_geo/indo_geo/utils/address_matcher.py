@@ -0,0 +1,281 @@
+"""Map free-text address parts onto location codes.
+
+Customer input such as "Kab. Bandung Brt" or "KOTA JAKARTA SEL." is
+normalised (punctuation dropped, abbreviations expanded, leading words naming
+the kind of area split off) and compared with the location names by token-set
+similarity. Levels are matched from the province down, and each level only
+matches below the deepest ancestor already matched, so a district is looked up
+inside its resolved regency.
+
+Everything is precomputed once per worker from the four tables: per level, the
+normalised names, an exact-name lookup and a token inverted index whose
+postings are ordered by code, so the candidates below a parent are one bisect
+range per token.
+"""
+
+from array import array
+from bisect import bisect_left
+
+from indo_geo.indo_geo.utils.code_index import (
+    CODE_LENGTHS,
+    DOCTYPE_BY_LENGTH,
+    LEVELS,
+    ancestor_codes,
+    code_range,
+)
+from indo_geo.indo_geo.utils.location_cache import LOCATION_FIELDS, get_code_names, get_derived
+from indo_geo.indo_geo.utils.location_search import normalize
+
+MAX_ADDRESSES = 10000
+
+# Lowest similarity accepted as a match
+MATCH_THRESHOLD = 0.6
+
+# Up to this many locations in scope, misspelled names are compared with all of them
+TYPO_SCAN_LIMIT = 600
+
+ABBREVIATIONS = {
+    "PROV": "PROVINSI",
+    "KAB": "KABUPATEN",
+    "KEC": "KECAMATAN",
+    "DS": "DESA",
+    "KEL": "KELURAHAN",
+    "ADM": "ADMINISTRASI",
+    "KEP": "KEPULAUAN",
+    "KPL": "KEPULAUAN",
+    "BRT": "BARAT",
+    "BAR": "BARAT",
+    "TIM": "TIMUR",
+    "TMR": "TIMUR",
+    "SEL": "SELATAN",
+    "SLT": "SELATAN",
+    "UTR": "UTARA",
+    "UT": "UTARA",
+    "TENG": "TENGAH",
+    "TGH": "TENGAH",
+    "PST": "PUSAT",
+    "JKT": "JAKARTA",
+    "JABAR": "JAWA BARAT",
+    "JATENG": "JAWA TENGAH",
+    "JATIM": "JAWA TIMUR",
+    "DIY": "DI YOGYAKARTA",
+    "SUMUT": "SUMATERA UTARA",
+    "SUMBAR": "SUMATERA BARAT",
+    "SUMSEL": "SUMATERA SELATAN",
+    "KALBAR": "KALIMANTAN BARAT",
+    "KALTENG": "KALIMANTAN TENGAH",
+    "KALSEL": "KALIMANTAN SELATAN",
+    "KALTIM": "KALIMANTAN TIMUR",
+    "KALTARA": "KALIMANTAN UTARA",
+    "SULUT": "SULAWESI UTARA",
+    "SULTENG": "SULAWESI TENGAH",
+    "SULSEL": "SULAWESI SELATAN",
+    "SULTRA": "SULAWESI TENGGARA",
+    "SULBAR": "SULAWESI BARAT",
+    "NTB": "NUSA TENGGARA BARAT",
+    "NTT": "NUSA TENGGARA TIMUR",
+    "BABEL": "KEPULAUAN BANGKA BELITUNG",
+    "KEPRI": "KEPULAUAN RIAU",
+}
+
+# Leading words naming the kind of area rather than the area itself
+LEVEL_PREFIXES = {
+    "Province": {"PROVINSI"},
+    "Regency": {"KABUPATEN", "KOTA", "ADMINISTRASI"},
+    "District": {"KECAMATAN"},
+    "Village": {"DESA", "KELURAHAN"},
+}
+
+# Prefixes that distinguish otherwise equal names, e.g. KABUPATEN BANDUNG and KOTA BANDUNG
+_KINDS = {"KABUPATEN", "KOTA"}
+
+# Score factor when the query names a different kind of area than the location
+KIND_MISMATCH_PENALTY = 0.8
+
+
+def split_name(text, doctype):
+    """Return (kind, core tokens) of a name or query at the level of `doctype`."""
+    tokens = " ".join(ABBREVIATIONS.get(token, token) for token in normalize(text).split()).split()
+    prefixes = LEVEL_PREFIXES[doctype]
+    kind = None
+    start = 0
+    while start < len(tokens) - 1 and tokens[start] in prefixes:
+        if tokens[start] in _KINDS:
+            kind = tokens[start]
+        start += 1
+    return kind, tuple(tokens[start:])
+
+
+def _token_score(query_token, name_token):
+    if query_token == name_token:
+        return 1.0
+    if len(query_token) >= 3 and name_token.startswith(query_token):
+        return 0.9
+    return 0.0
+
+
+def _within_one_edit(a, b):
+    if abs(len(a) - len(b)) > 1 or min(len(a), len(b)) < 4:
+        return False
+    i = 0
+    while i < min(len(a), len(b)) and a[i] == b[i]:
+        i += 1
+    return a[i + 1 :] == b[i + 1 :] or a[i + 1 :] == b[i:] or a[i:] == b[i + 1 :]
+
+
+def similarity(query_tokens, name_tokens, typos=False):
+    """Token-set similarity of two token tuples, between 0 and 1.
+
+    Every distinct query token counts with its best match among the name
+    tokens (exact, prefix of at least three letters, or with `typos` one edit
+    away), relative to the number of distinct tokens on both sides.
+    """
+    query_set = set(query_tokens)
+    name_set = set(name_tokens)
+    if not query_set or not name_set:
+        return 0.0
+    matched = 0.0
+    for query_token in query_set:
+        if query_token in name_set:
+            matched += 1.0
+            continue
+        best = max(_token_score(query_token, name_token) for name_token in name_set)
+        if not best and typos and any(_within_one_edit(query_token, name_token) for name_token in name_set):
+            best = 0.8
+        matched += best
+    return 2 * matched / (len(query_set) + len(name_set))
+
+
+class AddressMatcher:
+    def __init__(self, locations):
+        """`locations` maps each doctype to an iterable of (code, name) pairs."""
+        self._levels = {}
+        for doctype, _length in LEVELS:
+            rows = sorted(locations.get(doctype, ()))
+            kinds = []
+            cores = []
+            exact = {}
+            postings = {}
+            for i, (_code, name) in enumerate(rows):
+                kind, core = split_name(name, doctype)
+                kinds.append(kind)
+                cores.append(core)
+                exact.setdefault(core, array("I")).append(i)
+                for token in set(core):
+                    postings.setdefault(token, array("I")).append(i)
+            self._levels[doctype] = {
+                "codes": [code for code, _name in rows],
+                "int_codes": array("Q", (int(code) for code, _name in rows)),
+                "names": [name for _code, name in rows],
+                "kinds": kinds,
+                "cores": cores,
+                "exact": exact,
+                "postings": postings,
+                "vocabulary": sorted(postings),
+            }
+
+    def match(self, address):
+        """Match one address, a dict with any of province/regency/district/village.
+
+        Returns a dict with the deepest matched `code` (or None) and, per level,
+        `{"code", "name", "score"}` or None. Levels above the deepest match
+        that were not given are filled in from its code, with a score of None.
+        """
+        return self.match_many([address])[0]
+
+    def match_many(self, addresses):
+        """Match a list of addresses, in order. Repeated address parts are matched once."""
+        memo = {}
+        results = []
+        for address in addresses:
+            result = {"code": None}
+            parent = None
+            for doctype, _length in LEVELS:
+                field = doctype.lower()
+                text = (address or {}).get(field)
+                match = None
+                if text:
+                    key = (text, doctype, parent)
+                    if key not in memo:
+                        memo[key] = self.match_name(text, doctype, parent)
+                    match = memo[key]
+                result[field] = dict(match) if match else None
+                if match:
+                    parent = result["code"] = match["code"]
+
+            for ancestor in ancestor_codes(result["code"]):
+                field = DOCTYPE_BY_LENGTH[len(ancestor)].lower()
+                if not result[field]:
+                    result[field] = self._describe(DOCTYPE_BY_LENGTH[len(ancestor)], ancestor, None)
+            results.append(result)
+        return results
+
+    def match_name(self, text, doctype, parent=None):
+        """Return the best `{"code", "name", "score"}` for a name of `doctype` below `parent`, or None."""
+        level = self._levels[doctype]
+        kind, core = split_name(text, doctype)
+        if not core:
+            return None
+        lo, hi = code_range(level["int_codes"], parent, CODE_LENGTHS[doctype])
+
+        # Most input is spelled like the official name once abbreviations are expanded
+        ids = level["exact"].get(core, ())
+        for i in ids[bisect_left(ids, lo) : bisect_left(ids, hi)]:
+            if not kind or level["kinds"][i] in (None, kind):
+                return self._describe(doctype, level["codes"][i], 1.0, i)
+
+        best = self._best(level, kind, core, self._candidates(level, core, lo, hi))
+        if best is None and hi - lo <= TYPO_SCAN_LIMIT:
+            best = self._best(level, kind, core, range(lo, hi), typos=True)
+        if best is None:
+            return None
+        score, i = best
+        return self._describe(doctype, level["codes"][i], round(score, 3), i)
+
+    def _best(self, level, kind, core, candidates, typos=False):
+        """Return (score, id) of the most similar candidate above the threshold, or None."""
+        best_score, best = 0.0, None
+        for i in candidates:
+            score = similarity(core, level["cores"][i], typos)
+            if kind and level["kinds"][i] and level["kinds"][i] != kind:
+                score *= KIND_MISMATCH_PENALTY
+            if score > best_score:
+                best_score, best = score, i
+        if best is None or best_score < MATCH_THRESHOLD:
+            return None
+        return best_score, best
+
+    def _candidates(self, level, core, lo, hi):
+        """Return the ids in [lo, hi) sharing a token, or a token prefix, with the query, ascending."""
+        postings = level["postings"]
+        vocabulary = level["vocabulary"]
+        candidates = set()
+        for query_token in set(core):
+            if len(query_token) >= 3:
+                start = bisect_left(vocabulary, query_token)
+                tokens = vocabulary[start : bisect_left(vocabulary, query_token + "\uffff", start)]
+            else:
+                tokens = [query_token] if query_token in postings else []
+            for token in tokens:
+                ids = postings[token]
+                candidates.update(ids[bisect_left(ids, lo) : bisect_left(ids, hi)])
+        return sorted(candidates)
+
+    def _describe(self, doctype, code, score, i=None):
+        level = self._levels[doctype]
+        if i is None:
+            i = bisect_left(level["int_codes"], int(code))
+            if i >= len(level["codes"]) or level["codes"][i] != code:
+                return None
+        return {"code": code, "name": level["names"][i], "score": score}
+
+
+def build_address_matcher():
+    """Build an address matcher from the codes and names of the four location doctypes."""
+    locations = {doctype: get_code_names(doctype) for doctype in LOCATION_FIELDS}
+    return AddressMatcher(locations)
+
+
+def match_addresses(addresses):
+    """Match a list of address dicts using this worker's cached address matcher."""
+    return get_derived("address_matcher", build_address_matcher).match_many(addresses)
@@ -0,0 +1,104 @@
+"""Bulk load mode for the location imports.
+
+Inside `bulk_load_mode()` the composite location indexes are dropped, the
+session skips unique and foreign key checks, and the village import commits
+once at the end instead of every few chunks. On the way out, whether the load
+succeeded or not, the indexes are rebuilt in one pass per table. A failed load
+is rolled back. A successful one is checked, since the skipped checks are
+exactly what would have caught duplicates and orphans, and any found fail it.
+The static bundle and the snapshot are only refreshed once the checks pass.
+"""
+
+import time
+from contextlib import contextmanager
+
+import frappe
+from frappe import _
+
+from indo_geo.indo_geo.utils.code_index import LEVELS, PARENT_DOCTYPES
+from indo_geo.indo_geo.utils.import_locations import import_all_locations_sql
+from indo_geo.indo_geo.utils.import_metrics import report, tracked
+from indo_geo.indo_geo.utils.location_cache import LOCATION_FIELDS, adopt_snapshot
+from indo_geo.indo_geo.utils.location_indexes import add_location_indexes, drop_location_indexes
+from indo_geo.indo_geo.utils.static_bundle import rebuild_after_import
+
+# Problems quoted in the error thrown by bulk load mode, the Error Log has all of them
+INTEGRITY_PROBLEMS_SHOWN = 5
+
+
+@contextmanager
+def bulk_load_mode():
+    """Load the location tables with secondary indexes and per-row checks out of the way.
+
+    Only this site's own connection is affected; the parallel loader's
+    worker connections keep the normal session settings. Throws a
+    ValidationError when the loaded tables hold duplicate codes or orphans;
+    they stay committed so that they can be inspected and fixed.
+    """
+    report("Entering bulk load mode...")
+    start_time = time.time()
+    drop_location_indexes()
+    frappe.db.sql("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+    frappe.flags.in_location_bulk_load = True
+    try:
+        yield
+        frappe.db.commit()
+    except Exception:
+        frappe.db.rollback()
+        raise
+    finally:
+        frappe.flags.in_location_bulk_load = False
+        frappe.db.sql("SET SESSION unique_checks = 1, foreign_key_checks = 1")
+        load_time = time.time()
+        report("Rebuilding location indexes...")
+        add_location_indexes()
+    index_time = time.time()
+
+    problems = check_location_integrity()
+    end_time = time.time()
+    report(
+        f"Bulk load mode finished in {end_time - start_time:.2f} seconds "
+        f"(load {load_time - start_time:.2f}s, indexes {index_time - load_time:.2f}s, "
+        f"checks {end_time - index_time:.2f}s, {len(problems)} integrity problems)"
+    )
+    if problems:
+        frappe.log_error("Location bulk load integrity problems", "\n".join(problems))
+        shown = "; ".join(problems[:INTEGRITY_PROBLEMS_SHOWN])
+        frappe.throw(_("Bulk load left {0} integrity problems: {1}").format(len(problems), shown))
+
+
+def check_location_integrity():
+    """Return a description of every duplicate code and every location whose parent is missing."""
+    problems = []
+    for doctype, _length in LEVELS:
+        code_field = LOCATION_FIELDS[doctype][2]
+        for code, count in frappe.db.sql(
+            f"""SELECT `{code_field}`, COUNT(*) FROM `tab{doctype}`
+            GROUP BY `{code_field}` HAVING COUNT(*) > 1"""
+        ):
+            problems.append(f"{doctype} code {code} appears {count} times")
+
+        parent_doctype = PARENT_DOCTYPES.get(doctype)
+        if not parent_doctype:
+            continue
+        parent_field = parent_doctype.lower()
+        for name, parent in frappe.db.sql(
+            f"""SELECT child.`name`, child.`{parent_field}` FROM `tab{doctype}` child
+            LEFT JOIN `tab{parent_doctype}` parent ON parent.`name` = child.`{parent_field}`
+            WHERE parent.`name` IS NULL
+            OR child.`{parent_field}` != LEFT(child.`{code_field}`, CHAR_LENGTH(parent.`name`))"""
+        ):
+            problems.append(f"{doctype} {name} has missing or mismatched {parent_field} {parent}")
+    return problems
+
+
+@tracked
+def import_all_locations_bulk(workers=None, data_path=None):
+    """Run the SQL import in bulk load mode and report the end-to-end time."""
+    start_time = time.time()
+    with bulk_load_mode():
+        import_all_locations_sql(workers, data_path)
+    # Only tables that passed the integrity checks get published
+    rebuild_after_import()
+    adopt_snapshot()
+    report(f"Bulk load mode import completed end to end in {time.time() - start_time:.2f} seconds!")
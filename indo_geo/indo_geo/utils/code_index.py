@@ -0,0 +1,62 @@
+"""Sorted, array-backed index over Kemendagri location codes.
+
+Location codes are hierarchical: a village code starts with its district code,
+which starts with its regency code, which starts with its province code. The
+parent of any code is therefore a slice of it, and all children of a code form
+one contiguous range in a sorted array of the child level's codes, so both can
+be answered without touching the database.
+"""
+
+from bisect import bisect_left
+
+# (doctype, code length), from the top of the hierarchy down
+LEVELS = (
+    ("Province", 2),
+    ("Regency", 4),
+    ("District", 7),
+    ("Village", 10),
+)
+
+CODE_LENGTHS = dict(LEVELS)
+DOCTYPE_BY_LENGTH = {length: doctype for doctype, length in LEVELS}
+PARENT_DOCTYPES = {doctype: LEVELS[i - 1][0] for i, (doctype, _length) in enumerate(LEVELS) if i}
+
+
+def get_level(code):
+    """Return the doctype a code belongs to, or None if it is not a valid code."""
+    if not code or not code.isdigit():
+        return None
+    return DOCTYPE_BY_LENGTH.get(len(code))
+
+
+def parent_code(code):
+    """Return the parent code of `code`, or None for provinces and invalid codes."""
+    ancestors = ancestor_codes(code)
+    return ancestors[-1] if ancestors else None
+
+
+def ancestor_codes(code):
+    """Return the ancestor codes of `code`, from its province down to its parent."""
+    if not get_level(code):
+        return []
+    return [code[:length] for _doctype, length in LEVELS if length < len(code)]
+
+
+def is_under(code, ancestor):
+    """Check whether `code` lies below `ancestor` in the hierarchy (by code only)."""
+    return bool(get_level(ancestor)) and ancestor in ancestor_codes(code)
+
+
+def code_range(codes, parent, length):
+    """Return the (lo, hi) slice of sorted integer `codes` of a given `length` below `parent`.
+
+    Without `parent` the whole array is returned.
+    """
+    if not parent:
+        return 0, len(codes)
+    if not parent.isdigit() or len(parent) >= length:
+        return 0, 0
+    scale = 10 ** (length - len(parent))
+    start = int(parent) * scale
+    return bisect_left(codes, start), bisect_left(codes, start + scale)
+
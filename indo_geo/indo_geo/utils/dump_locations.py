@@ -1,12 +1,45 @@
+import csv
 import os
+from itertools import islice
 
 import frappe
 from frappe.utils import now_datetime
 
-
-def dump_all_locations():
-    """Export all location data to SQL files for fast bulk import."""
-    print("Starting location data dump...")
+from indo_geo.indo_geo.utils.import_metrics import current_job, report, tracked, warn
+from indo_geo.indo_geo.utils.location_cache import adopt_snapshot
+from indo_geo.indo_geo.utils.location_data import (
+    CSV_FILES,
+    TIMESTAMP_FORMAT,
+    find_data_file,
+    get_compressed_path,
+    get_data_path,
+    get_source_digest,
+    iter_csv_locations,
+    open_data_file,
+    remove_other_variants,
+)
+from indo_geo.indo_geo.utils.snapshot import SNAPSHOT_FILE, write_snapshot
+
+# Rows per INSERT statement in the village dump, and per read in the CSV dump
+VILLAGE_DUMP_BATCH_SIZE = 1000
+
+# Bytes buffered before the dump file is written to disk
+DUMP_BUFFER_SIZE = 1024 * 1024
+
+VILLAGE_INSERT = (
+    "INSERT IGNORE INTO tabVillage (name, creation, modified, modified_by, owner, docstatus, idx, "
+    "village_code, village_name, district, regency, province) VALUES\n"
+)
+
+
+@tracked
+def dump_all_locations(compression=None):
+    """Export all location data to SQL files for fast bulk import.
+
+    With `compression` ("gzip", or "zstd" when zstandard is installed) the
+    files are written compressed, as provinces.sql.gz and so on.
+    """
+    report("Starting location data dump...")
 
     # Get the app path
     app_path = frappe.get_app_path("indo_geo")
@@ -16,134 +49,224 @@ def dump_all_locations():
     os.makedirs(sql_path, exist_ok=True)
 
     # Dump in order: Province -> Regency -> District -> Village
-    dump_provinces(sql_path)
-    dump_regencies(sql_path)
-    dump_districts(sql_path)
-    dump_villages(sql_path)
+    dump_provinces(sql_path, compression)
+    dump_regencies(sql_path, compression)
+    dump_districts(sql_path, compression)
+    dump_villages(sql_path, compression)
 
-    print("Location data dump completed successfully!")
+    report("Location data dump completed successfully!")
 
 
-def dump_provinces(sql_path):
+@tracked
+def dump_provinces(sql_path, compression=None):
     """Export provinces to SQL file."""
-    file_path = os.path.join(sql_path, "provinces.sql")
+    file_path = get_compressed_path(os.path.join(sql_path, "provinces.sql"), compression)
 
-    print("Dumping provinces...")
+    report("Dumping provinces...")
 
     # Get all provinces
-    provinces = frappe.db.sql("""
-        SELECT name, province_code, province_name, creation, modified, modified_by, owner
-        FROM tabProvince
-        ORDER BY province_code
-    """, as_dict=True)
+    job = current_job()
+    with job.span("read"):
+        provinces = frappe.db.sql("""
+            SELECT name, province_code, province_name, creation, modified, modified_by, owner
+            FROM tabProvince
+            ORDER BY province_code
+        """, as_dict=True)
 
     if not provinces:
-        print("No provinces found to dump")
+        report("No provinces found to dump")
         return
 
     # Generate SQL INSERT statements
-    sql_content = generate_province_sql(provinces)
+    with job.span("transform"):
+        sql_content = generate_province_sql(provinces)
 
     # Write to file
-    with open(file_path, 'w', encoding='utf-8') as f:
+    with job.span("execute"), open_data_file(file_path, "w") as f:
         f.write(sql_content)
+    remove_other_variants(file_path)
+    job.add_rows(len(provinces))
 
-    print(f"Dumped {len(provinces)} provinces to {file_path}")
+    report(f"Dumped {len(provinces)} provinces to {file_path}")
 
 
-def dump_regencies(sql_path):
+@tracked
+def dump_regencies(sql_path, compression=None):
     """Export regencies to SQL file."""
-    file_path = os.path.join(sql_path, "regencies.sql")
+    file_path = get_compressed_path(os.path.join(sql_path, "regencies.sql"), compression)
 
-    print("Dumping regencies...")
+    report("Dumping regencies...")
 
     # Get all regencies
-    regencies = frappe.db.sql("""
-        SELECT name, regency_code, regency_name, province, province_code,
-               creation, modified, modified_by, owner
-        FROM tabRegency
-        ORDER BY regency_code
-    """, as_dict=True)
+    job = current_job()
+    with job.span("read"):
+        regencies = frappe.db.sql("""
+            SELECT name, regency_code, regency_name, province, province_code,
+                   creation, modified, modified_by, owner
+            FROM tabRegency
+            ORDER BY regency_code
+        """, as_dict=True)
 
     if not regencies:
-        print("No regencies found to dump")
+        report("No regencies found to dump")
         return
 
     # Generate SQL INSERT statements
-    sql_content = generate_regency_sql(regencies)
+    with job.span("transform"):
+        sql_content = generate_regency_sql(regencies)
 
     # Write to file
-    with open(file_path, 'w', encoding='utf-8') as f:
+    with job.span("execute"), open_data_file(file_path, "w") as f:
         f.write(sql_content)
+    remove_other_variants(file_path)
+    job.add_rows(len(regencies))
 
-    print(f"Dumped {len(regencies)} regencies to {file_path}")
+    report(f"Dumped {len(regencies)} regencies to {file_path}")
 
 
-def dump_districts(sql_path):
+@tracked
+def dump_districts(sql_path, compression=None):
     """Export districts to SQL file."""
-    file_path = os.path.join(sql_path, "districts.sql")
+    file_path = get_compressed_path(os.path.join(sql_path, "districts.sql"), compression)
 
-    print("Dumping districts...")
+    report("Dumping districts...")
 
     # Get all districts
-    districts = frappe.db.sql("""
-        SELECT name, district_code, district_name, regency, province, regency_code,
-               creation, modified, modified_by, owner
-        FROM tabDistrict
-        ORDER BY district_code
-    """, as_dict=True)
+    job = current_job()
+    with job.span("read"):
+        districts = frappe.db.sql("""
+            SELECT name, district_code, district_name, regency, province, regency_code,
+                   creation, modified, modified_by, owner
+            FROM tabDistrict
+            ORDER BY district_code
+        """, as_dict=True)
 
     if not districts:
-        print("No districts found to dump")
+        report("No districts found to dump")
         return
 
     # Generate SQL INSERT statements
-    sql_content = generate_district_sql(districts)
+    with job.span("transform"):
+        sql_content = generate_district_sql(districts)
 
     # Write to file
-    with open(file_path, 'w', encoding='utf-8') as f:
+    with job.span("execute"), open_data_file(file_path, "w") as f:
         f.write(sql_content)
+    remove_other_variants(file_path)
+    job.add_rows(len(districts))
 
-    print(f"Dumped {len(districts)} districts to {file_path}")
+    report(f"Dumped {len(districts)} districts to {file_path}")
 
 
-def dump_villages(sql_path):
-    """Export villages to SQL file."""
-    file_path = os.path.join(sql_path, "villages.sql")
+@tracked
+def dump_villages(sql_path, compression=None, batch_size=VILLAGE_DUMP_BATCH_SIZE):
+    """Export villages to SQL file, streaming them from the database.
 
-    print("Dumping villages...")
+    Rows are read as tuples through an unbuffered cursor and written out as
+    one INSERT of `batch_size` rows at a time, so memory use stays flat however
+    large the table is. With `compression` the dump is written compressed, as
+    villages.sql.gz for instance.
+    """
+    file_path = get_compressed_path(os.path.join(sql_path, "villages.sql"), compression)
 
-    # Get all villages
-    villages = frappe.db.sql("""
-        SELECT name, village_code, village_name, district, regency, province, district_code,
-               creation, modified, modified_by, owner
-        FROM tabVillage
-        ORDER BY village_code
-    """, as_dict=True)
+    report("Dumping villages...")
 
-    if not villages:
-        print("No villages found to dump")
+    total = frappe.db.count("Village")
+    if not total:
+        report("No villages found to dump")
         return
 
-    # Generate SQL INSERT statements in chunks to avoid memory issues
-    chunk_size = 1000
-    total_chunks = (len(villages) + chunk_size - 1) // chunk_size
-
-    with open(file_path, 'w', encoding='utf-8') as f:
+    job = current_job()
+    count = 0
+    with open_data_file(file_path, "w", buffering=DUMP_BUFFER_SIZE) as f, frappe.db.unbuffered_cursor():
         f.write("-- Village data dump\n")
-        f.write(f"-- Total records: {len(villages)}\n\n")
-
-        for i in range(0, len(villages), chunk_size):
-            chunk = villages[i:i + chunk_size]
-            chunk_num = (i // chunk_size) + 1
-            print(f"  Processing chunk {chunk_num}/{total_chunks} ({len(chunk)} records)")
-
-            sql_content = generate_village_sql(chunk)
-            f.write(f"-- Chunk {chunk_num}\n")
-            f.write(sql_content)
-            f.write("\n")
-
-    print(f"Dumped {len(villages)} villages to {file_path}")
+        f.write(f"-- Total records: {total}\n\n")
+
+        villages = frappe.db.sql("""
+            SELECT name, creation, modified, modified_by, owner,
+                   village_code, village_name, district, regency, province
+            FROM tabVillage
+            ORDER BY village_code
+        """, as_iterator=True)
+
+        for chunk_num, chunk in enumerate(job.iter_span("read", iter_batches(villages, batch_size)), 1):
+            with job.span("transform"):
+                sql_content = generate_village_sql(chunk)
+            with job.span("execute"):
+                f.write(f"-- Chunk {chunk_num}\n{sql_content}\n")
+            count += len(chunk)
+
+            if chunk_num % 10 == 0:
+                report(f"  Dumped {count}/{total} villages...")
+
+    remove_other_variants(file_path)
+    job.add_rows(count)
+    report(f"Dumped {count} villages to {file_path}")
+
+
+@tracked
+def dump_csv_files(data_path=None, compression=None):
+    """Export all location data to the shipped 2-column CSV files (code, name).
+
+    Rows are streamed from the database like the village dump. With
+    `compression` the files are written compressed, as villages.csv.gz for
+    instance, and the plain files they replace are removed.
+    """
+    data_path = data_path or get_data_path()
+    report("Dumping location CSV files...")
+
+    job = current_job()
+    for doctype, file_name in CSV_FILES.items():
+        file_path = get_compressed_path(os.path.join(data_path, file_name), compression)
+        prefix = frappe.scrub(doctype)
+        count = 0
+        with open_data_file(file_path, "w", buffering=DUMP_BUFFER_SIZE) as f, frappe.db.unbuffered_cursor():
+            writer = csv.writer(f, lineterminator="\n")
+            rows = frappe.db.sql(
+                f"SELECT {prefix}_code, {prefix}_name FROM `tab{doctype}` ORDER BY {prefix}_code",
+                as_iterator=True,
+            )
+            for batch in job.iter_span("read", iter_batches(rows, VILLAGE_DUMP_BATCH_SIZE)):
+                with job.span("execute"):
+                    writer.writerows(batch)
+                count += len(batch)
+
+        remove_other_variants(file_path)
+        job.add_rows(count)
+        report(f"Dumped {count} {doctype} records to {file_path}")
+
+
+def iter_batches(rows, batch_size):
+    """Yield lists of up to `batch_size` items from the `rows` iterator."""
+    rows = iter(rows)
+    while batch := list(islice(rows, batch_size)):
+        yield batch
+
+
+@tracked
+def dump_snapshot(file_path=None):
+    """Export all location data to a binary snapshot file (see utils/snapshot.py).
+
+    The snapshot records the digest of the CSV files next to it, and is read
+    instead of them by imports and sync until they change.
+    """
+    file_path = file_path or os.path.join(get_data_path(), SNAPSHOT_FILE)
+    report("Dumping location snapshot...")
+
+    job = current_job()
+    with job.span("read"):
+        locations = {
+            "Province": frappe.db.sql("SELECT province_code, province_name, NULL FROM tabProvince"),
+            "Regency": frappe.db.sql("SELECT regency_code, regency_name, province FROM tabRegency"),
+            "District": frappe.db.sql("SELECT district_code, district_name, regency FROM tabDistrict"),
+            "Village": frappe.db.sql("SELECT village_code, village_name, district FROM tabVillage"),
+        }
+    with job.span("execute"):
+        write_snapshot(file_path, locations, get_source_digest(os.path.dirname(file_path)))
+    job.add_rows(sum(len(rows) for rows in locations.values()))
+    adopt_snapshot()
+
+    report(f"Dumped {sum(len(rows) for rows in locations.values())} locations to {file_path}")
 
 
 def generate_province_sql(provinces):
@@ -230,32 +353,34 @@ def generate_district_sql(districts):
 
 
 def generate_village_sql(villages):
-    """Generate SQL INSERT statements for villages."""
+    """Generate a SQL INSERT statement for a batch of village rows.
+
+    Rows are (name, creation, modified, modified_by, owner, village_code,
+    village_name, district, regency, province) tuples, as read by
+    dump_villages. The rows of one import share their timestamps, so each
+    distinct timestamp is only formatted once per batch.
+    """
     if not villages:
         return ""
 
-    sql = "INSERT IGNORE INTO tabVillage (name, creation, modified, modified_by, owner, docstatus, idx, village_code, village_name, district, regency, province, district_code) VALUES\n"
+    default_timestamp = now_datetime()
+    timestamps = {}
 
-    values = []
-    for village in villages:
-        values.append("('{}', '{}', '{}', '{}', '{}', 0, 0, '{}', '{}', '{}', '{}', '{}', '{}')".format(
-            escape_sql_string(village.name),
-            village.creation.strftime('%Y-%m-%d %H:%M:%S.%f') if village.creation else now_datetime().strftime('%Y-%m-%d %H:%M:%S.%f'),
-            village.modified.strftime('%Y-%m-%d %H:%M:%S.%f') if village.modified else now_datetime().strftime('%Y-%m-%d %H:%M:%S.%f'),
-            escape_sql_string(village.modified_by or 'Administrator'),
-            escape_sql_string(village.owner or 'Administrator'),
-            escape_sql_string(village.village_code),
-            escape_sql_string(village.village_name),
-            escape_sql_string(village.district or ''),
-            escape_sql_string(village.regency or ''),
-            escape_sql_string(village.province or ''),
-            escape_sql_string(village.district_code or '')
-        ))
+    def format_timestamp(value):
+        value = value or default_timestamp
+        if value not in timestamps:
+            timestamps[value] = value.strftime(TIMESTAMP_FORMAT)
+        return timestamps[value]
 
-    sql += ",\n".join(values)
-    sql += ";\n"
-
-    return sql
+    values = ",\n".join(
+        f"('{escape_sql_string(name)}', '{format_timestamp(creation)}', '{format_timestamp(modified)}', "
+        f"'{escape_sql_string(modified_by or 'Administrator')}', "
+        f"'{escape_sql_string(owner or 'Administrator')}', 0, 0, "
+        + ", ".join(f"'{escape_sql_string(value)}'" for value in location)
+        + ")"
+        for name, creation, modified, modified_by, owner, *location in villages
+    )
+    return VILLAGE_INSERT + values + ";\n"
 
 
 def escape_sql_string(value):
@@ -265,9 +390,10 @@ def escape_sql_string(value):
     return str(value).replace("'", "''").replace("\\", "\\\\")
 
 
-def convert_csv_to_sql():
-    """Convert existing CSV files to SQL format."""
-    print("Converting CSV files to SQL format...")
+@tracked
+def convert_csv_to_sql(compression=None):
+    """Convert existing CSV files to SQL format, compressed with `compression` if given."""
+    report("Converting CSV files to SQL format...")
 
     app_path = frappe.get_app_path("indo_geo")
     data_path = os.path.join(app_path, "..", "data")
@@ -277,29 +403,30 @@ def convert_csv_to_sql():
     os.makedirs(sql_path, exist_ok=True)
 
     # Convert each CSV file
-    convert_provinces_csv_to_sql(data_path, sql_path)
-    convert_regencies_csv_to_sql(data_path, sql_path)
-    convert_districts_csv_to_sql(data_path, sql_path)
-    convert_villages_csv_to_sql(data_path, sql_path)
+    convert_provinces_csv_to_sql(data_path, sql_path, compression)
+    convert_regencies_csv_to_sql(data_path, sql_path, compression)
+    convert_districts_csv_to_sql(data_path, sql_path, compression)
+    convert_villages_csv_to_sql(data_path, sql_path, compression)
 
-    print("CSV to SQL conversion completed!")
+    report("CSV to SQL conversion completed!")
 
 
-def convert_provinces_csv_to_sql(data_path, sql_path):
+@tracked
+def convert_provinces_csv_to_sql(data_path, sql_path, compression=None):
     """Convert provinces.csv to provinces.sql."""
-    import csv
-
-    csv_file = os.path.join(data_path, "provinces.csv")
-    sql_file = os.path.join(sql_path, "provinces.sql")
+    csv_file = find_data_file(os.path.join(data_path, "provinces.csv"))
+    sql_file = get_compressed_path(os.path.join(sql_path, "provinces.sql"), compression)
 
     if not os.path.exists(csv_file):
-        print(f"CSV file not found: {csv_file}")
+        warn(f"CSV file not found: {csv_file}")
         return
 
-    print("Converting provinces.csv...")
+    report("Converting provinces.csv...")
+    job = current_job()
+    job.add_bytes(os.path.getsize(csv_file))
 
-    with open(csv_file, encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
+    with open_data_file(csv_file) as csvfile:
+        reader = job.iter_span("read", csv.reader(csvfile))
 
         values = []
         for row in reader:
@@ -317,27 +444,30 @@ def convert_provinces_csv_to_sql(data_path, sql_path):
         sql += ",\n".join(values)
         sql += ";\n"
 
-        with open(sql_file, 'w', encoding='utf-8') as f:
+        with open_data_file(sql_file, "w") as f:
             f.write(sql)
+        remove_other_variants(sql_file)
 
-        print(f"Converted {len(values)} provinces to {sql_file}")
+        job.add_rows(len(values))
+        report(f"Converted {len(values)} provinces to {sql_file}")
 
 
-def convert_regencies_csv_to_sql(data_path, sql_path):
+@tracked
+def convert_regencies_csv_to_sql(data_path, sql_path, compression=None):
     """Convert regencies.csv to regencies.sql."""
-    import csv
-
-    csv_file = os.path.join(data_path, "regencies.csv")
-    sql_file = os.path.join(sql_path, "regencies.sql")
+    csv_file = find_data_file(os.path.join(data_path, "regencies.csv"))
+    sql_file = get_compressed_path(os.path.join(sql_path, "regencies.sql"), compression)
 
     if not os.path.exists(csv_file):
-        print(f"CSV file not found: {csv_file}")
+        warn(f"CSV file not found: {csv_file}")
         return
 
-    print("Converting regencies.csv...")
+    report("Converting regencies.csv...")
+    job = current_job()
+    job.add_bytes(os.path.getsize(csv_file))
 
-    with open(csv_file, encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
+    with open_data_file(csv_file) as csvfile:
+        reader = job.iter_span("read", csv.reader(csvfile))
 
         values = []
         for row in reader:
@@ -356,27 +486,30 @@ def convert_regencies_csv_to_sql(data_path, sql_path):
         sql += ",\n".join(values)
         sql += ";\n"
 
-        with open(sql_file, 'w', encoding='utf-8') as f:
+        with open_data_file(sql_file, "w") as f:
             f.write(sql)
+        remove_other_variants(sql_file)
 
-        print(f"Converted {len(values)} regencies to {sql_file}")
+        job.add_rows(len(values))
+        report(f"Converted {len(values)} regencies to {sql_file}")
 
 
-def convert_districts_csv_to_sql(data_path, sql_path):
+@tracked
+def convert_districts_csv_to_sql(data_path, sql_path, compression=None):
     """Convert districts.csv to districts.sql."""
-    import csv
-
-    csv_file = os.path.join(data_path, "districts.csv")
-    sql_file = os.path.join(sql_path, "districts.sql")
+    csv_file = find_data_file(os.path.join(data_path, "districts.csv"))
+    sql_file = get_compressed_path(os.path.join(sql_path, "districts.sql"), compression)
 
     if not os.path.exists(csv_file):
-        print(f"CSV file not found: {csv_file}")
+        warn(f"CSV file not found: {csv_file}")
         return
 
-    print("Converting districts.csv...")
+    report("Converting districts.csv...")
+    job = current_job()
+    job.add_bytes(os.path.getsize(csv_file))
 
-    with open(csv_file, encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
+    with open_data_file(csv_file) as csvfile:
+        reader = job.iter_span("read", csv.reader(csvfile))
 
         values = []
         for row in reader:
@@ -399,32 +532,35 @@ def convert_districts_csv_to_sql(data_path, sql_path):
         sql += ",\n".join(values)
         sql += ";\n"
 
-        with open(sql_file, 'w', encoding='utf-8') as f:
+        with open_data_file(sql_file, "w") as f:
             f.write(sql)
+        remove_other_variants(sql_file)
 
-        print(f"Converted {len(values)} districts to {sql_file}")
+        job.add_rows(len(values))
+        report(f"Converted {len(values)} districts to {sql_file}")
 
 
-def convert_villages_csv_to_sql(data_path, sql_path):
+@tracked
+def convert_villages_csv_to_sql(data_path, sql_path, compression=None):
     """Convert villages.csv to villages.sql."""
-    import csv
-
-    csv_file = os.path.join(data_path, "villages.csv")
-    sql_file = os.path.join(sql_path, "villages.sql")
+    csv_file = find_data_file(os.path.join(data_path, "villages.csv"))
+    sql_file = get_compressed_path(os.path.join(sql_path, "villages.sql"), compression)
 
     if not os.path.exists(csv_file):
-        print(f"CSV file not found: {csv_file}")
+        warn(f"CSV file not found: {csv_file}")
         return
 
-    print("Converting villages.csv...")
+    report("Converting villages.csv...")
+    job = current_job()
+    job.add_bytes(os.path.getsize(csv_file))
 
     chunk_size = 1000
     chunk_num = 0
 
-    with open(csv_file, encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
+    with open_data_file(csv_file) as csvfile:
+        reader = job.iter_span("read", csv.reader(csvfile))
 
-        with open(sql_file, 'w', encoding='utf-8') as sqlfile:
+        with open_data_file(sql_file, "w") as sqlfile:
             sqlfile.write("-- Villages from CSV\n\n")
 
             values = []
@@ -457,7 +593,7 @@ def convert_villages_csv_to_sql(data_path, sql_path):
                     values = []
 
                     if chunk_num % 10 == 0:
-                        print(f"  Processed {total_count} villages...")
+                        report(f"  Processed {total_count} villages...")
 
             # Write remaining values
             if values:
@@ -467,5 +603,27 @@ def convert_villages_csv_to_sql(data_path, sql_path):
                 sqlfile.write(",\n".join(values))
                 sqlfile.write(";\n")
 
-    print(f"Converted {total_count} villages to {sql_file}")
-
+    remove_other_variants(sql_file)
+    job.add_rows(total_count)
+    report(f"Converted {total_count} villages to {sql_file}")
+
+
+@tracked
+def convert_csv_to_snapshot():
+    """Convert the CSV files to a binary snapshot file."""
+    data_path = get_data_path()
+    file_path = os.path.join(data_path, SNAPSHOT_FILE)
+    report("Converting CSV files to snapshot format...")
+
+    job = current_job()
+    with job.span("read"):
+        locations = {doctype: list(iter_csv_locations(data_path, doctype)) for doctype in CSV_FILES}
+    with job.span("execute"):
+        write_snapshot(file_path, locations, get_source_digest(data_path))
+    job.add_bytes(
+        sum(os.path.getsize(find_data_file(os.path.join(data_path, name))) for name in CSV_FILES.values())
+    )
+    job.add_rows(sum(len(rows) for rows in locations.values()))
+    adopt_snapshot()
+
+    report(f"Converted {sum(len(rows) for rows in locations.values())} locations to {file_path}")
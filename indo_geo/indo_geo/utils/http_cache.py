@@ -0,0 +1,75 @@
+"""Conditional GET support for the location endpoints.
+
+A response of the location API depends only on the request parameters and on
+the data of the doctypes it reads, whose version stamps (see location_cache)
+move on every change. Both go into a strong ETag, the newest stamp becomes
+Last-Modified, and a client holding the current copy gets an empty 304 instead
+of the full list.
+
+The stamps are the ones the worker's cache reads with (see
+`get_served_version`), taken before the data is read. A response is never
+labelled with a newer stamp than its data, so a client cannot keep an old list
+under the current ETag.
+"""
+
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+
+import frappe
+
+from indo_geo.indo_geo.utils.location_cache import get_served_version
+
+# Seconds browsers and proxies may reuse a response without revalidating,
+# overridable with `indo_geo_http_max_age`
+HTTP_MAX_AGE = 3600
+
+# Seconds a stale response may still be served while it is revalidated
+HTTP_STALE_WHILE_REVALIDATE = 86400
+
+
+def not_modified(doctypes, *params, public=False):
+    """Set the caching headers of a GET response and check the client's copy.
+
+    `doctypes` are the location doctypes the response is built from and
+    `params` the request parameters it depends on. Only endpoints open to
+    guests should pass `public`, which lets shared proxies keep the response;
+    the others are only cached by the user's browser. Returns True, with the
+    status set to 304, when the client already holds the current response.
+    """
+    request = getattr(frappe.local, "request", None)
+    headers = getattr(frappe.local, "response_headers", None)
+    if request is None or headers is None or request.method not in ("GET", "HEAD"):
+        return False
+
+    versions = [get_served_version(doctype) for doctype in doctypes]
+    digest = hashlib.sha1(repr((frappe.local.site, params, versions)).encode()).hexdigest()[:20]
+    etag = f'"{digest}"'
+    last_modified = max(int(version) for version in versions) // 10**9
+
+    max_age = frappe.conf.get("indo_geo_http_max_age") or HTTP_MAX_AGE
+    headers["ETag"] = etag
+    headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    headers["Cache-Control"] = (
+        f"{'public' if public else 'private'}, max-age={max_age}, "
+        f"stale-while-revalidate={HTTP_STALE_WHILE_REVALIDATE}"
+    )
+    headers["Vary"] = "Accept-Encoding"
+
+    if_none_match = frappe.get_request_header("If-None-Match")
+    if if_none_match:
+        fresh = etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")] or if_none_match == "*"
+    else:
+        fresh = _not_modified_since(frappe.get_request_header("If-Modified-Since"), last_modified)
+
+    if fresh:
+        frappe.local.response["http_status_code"] = 304
+    return fresh
+
+
+def _not_modified_since(if_modified_since, last_modified):
+    if not if_modified_since:
+        return False
+    try:
+        return parsedate_to_datetime(if_modified_since).timestamp() >= last_modified
+    except (TypeError, ValueError):
+        return False
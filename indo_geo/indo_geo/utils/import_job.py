@@ -0,0 +1,267 @@
+"""Location import as a resumable background job.
+
+`enqueue_location_import()` queues `run_location_import` on the long queue, so
+installing the app returns at once and the tables fill in afterwards. Each
+table is loaded IMPORT_CHUNK_SIZE source rows at a time, and every chunk is
+committed together with the table's Location Import State record (source rows
+processed, last code). A run that dies half way, on a worker timeout for
+instance, leaves a checkpoint that matches the table exactly, and the next run
+skips the rows before it instead of refusing to touch a non-empty table.
+`resume_location_import`, run by the scheduler, queues that next run once the
+checkpoints have stopped moving.
+
+Progress is published as the `indo_geo_location_import` realtime event.
+"""
+
+from itertools import islice
+
+import frappe
+from frappe import _
+from frappe.utils import add_to_date, now_datetime
+
+from indo_geo.indo_geo.utils.code_index import LEVELS, PARENT_DOCTYPES
+from indo_geo.indo_geo.utils.import_metrics import current_job, report, timed_commit, tracked, warn
+from indo_geo.indo_geo.utils.location_cache import adopt_snapshot, bump_version
+from indo_geo.indo_geo.utils.location_data import (
+    TABLE_COLUMNS,
+    TIMESTAMP_FORMAT,
+    build_row,
+    get_data_path,
+    iter_locations,
+)
+from indo_geo.indo_geo.utils.location_indexes import add_location_indexes
+from indo_geo.indo_geo.utils.location_validation import validate_many
+from indo_geo.indo_geo.utils.static_bundle import rebuild_after_import
+
+STATE_DOCTYPE = "Location Import State"
+
+IMPORT_JOB_ID = "indo_geo_location_import"
+PROGRESS_EVENT = "indo_geo_location_import"
+
+# Source rows committed per checkpoint
+IMPORT_CHUNK_SIZE = 5000
+
+# Seconds the worker may spend on one run; a run cut short resumes on the next
+IMPORT_TIMEOUT = 3600
+
+
+def enqueue_location_import(data_path=None):
+    """Queue the location import, unless it is already queued or running.
+
+    In tests the import runs right away, so that the data is there when the
+    caller returns.
+    """
+    return frappe.enqueue(
+        "indo_geo.indo_geo.utils.import_job.run_location_import",
+        queue="long",
+        timeout=IMPORT_TIMEOUT,
+        job_id=IMPORT_JOB_ID,
+        deduplicate=True,
+        enqueue_after_commit=True,
+        now=frappe.flags.in_test,
+        data_path=data_path,
+    )
+
+
+def resume_location_import():
+    """Scheduler hook: queue the import again when a started import stopped moving.
+
+    Picks up runs cut short by IMPORT_TIMEOUT or a worker restart: an import
+    that has not completed and whose checkpoints were last updated more than
+    IMPORT_TIMEOUT ago. A failed import is left to `start_location_import`,
+    so that it is not retried on every tick. Resumed runs read the app's data
+    directory.
+    """
+    states = frappe.get_all(STATE_DOCTYPE, fields=["status", "modified"])
+    if not states or any(state.status == "Failed" for state in states):
+        return
+    if len(states) == len(LEVELS) and all(state.status == "Completed" for state in states):
+        return
+    # A run still going saves its checkpoint after every chunk
+    if max(state.modified for state in states) < add_to_date(now_datetime(), seconds=-IMPORT_TIMEOUT):
+        enqueue_location_import()
+
+
+@frappe.whitelist()
+def start_location_import():
+    """Queue the location import, or resume it after a failed run."""
+    frappe.only_for("System Manager")
+    enqueue_location_import()
+    return get_import_status()
+
+
+@frappe.whitelist()
+def get_import_status():
+    """Return the checkpoint of each location doctype."""
+    frappe.only_for("System Manager")
+    return frappe.get_all(
+        STATE_DOCTYPE,
+        fields=["location_doctype", "status", "rows_processed", "rows_imported", "total_rows", "error"],
+    )
+
+
+@tracked
+def run_location_import(data_path=None):
+    """Import every location table that is not complete yet, resuming from its checkpoint."""
+    data_path = data_path or get_data_path()
+    report("Starting resumable location import...")
+
+    for doctype, _length in LEVELS:
+        state = get_state(doctype)
+        if state.status == "Completed":
+            report(f"{doctype} import already completed, skipping")
+            continue
+        try:
+            import_table(doctype, data_path, state)
+        except Exception as e:
+            frappe.db.rollback()
+            _save_state(doctype, status="Failed", error=str(e)[:1000])
+            _publish(doctype, state, status="Failed")
+            frappe.log_error(frappe.get_traceback(), f"Location import of {doctype} failed")
+            # The worker rolls the job back when it raises, which would undo the state and log
+            frappe.db.commit()
+            raise
+        # Parents of the next level must be visible to the cached lookups
+        bump_version(doctype)
+
+    add_location_indexes()
+    rebuild_after_import()
+    adopt_snapshot()
+    report("Resumable location import completed")
+
+
+def import_table(doctype, data_path, state):
+    """Import one location table from its checkpoint to the end."""
+    job = current_job()
+    locations = iter_locations(data_path, doctype)
+    total = state.total_rows or sum(1 for _location in iter_locations(data_path, doctype))
+
+    # Codes to skip, when the table holds rows the checkpoint does not describe
+    codes = None
+    if state.rows_processed:
+        skipped = list(islice(locations, state.rows_processed))
+        if not skipped or skipped[-1][0] != state.last_code:
+            warn(f"{doctype} checkpoint does not match the source data, checking every code instead")
+            locations = iter_locations(data_path, doctype)
+            state.update(rows_processed=0, last_code=None)
+            codes = _get_codes(doctype)
+        else:
+            report(f"Resuming {doctype} import after {state.rows_processed} rows ({state.last_code})")
+    elif frappe.db.count(doctype):
+        codes = _get_codes(doctype)
+
+    parent_doctype = PARENT_DOCTYPES.get(doctype)
+    parent_codes = _get_codes(parent_doctype) if parent_doctype else None
+    timestamp = now_datetime().strftime(TIMESTAMP_FORMAT)
+    owner = frappe.session.user
+
+    state.status = "Running"
+    _save_state(doctype, status="Running", total_rows=total, error=None)
+    timed_commit()
+    while True:
+        with job.span("read"):
+            batch = list(islice(locations, IMPORT_CHUNK_SIZE))
+        if not batch:
+            break
+
+        with job.span("transform"):
+            rows = build_valid_rows(doctype, batch, parent_codes, codes, timestamp, owner)
+        with job.span("execute"):
+            frappe.db.bulk_insert(doctype, TABLE_COLUMNS[doctype], rows, chunk_size=IMPORT_CHUNK_SIZE)
+
+        state.rows_processed += len(batch)
+        state.rows_imported += len(rows)
+        state.last_code = batch[-1][0]
+        _save_state(
+            doctype,
+            rows_processed=state.rows_processed,
+            rows_imported=state.rows_imported,
+            last_code=state.last_code,
+        )
+        # The rows and the checkpoint describing them are committed together
+        timed_commit()
+        job.add_rows(len(rows))
+        _publish(doctype, state, total=total)
+
+    state.status = "Completed"
+    _save_state(doctype, status="Completed")
+    timed_commit()
+    _publish(doctype, state, total=total)
+    report(f"Imported {state.rows_imported} {doctype} records")
+
+
+def build_valid_rows(doctype, locations, parent_codes, codes=None, timestamp=None, owner="Administrator"):
+    """Return the table rows of (code, name, parent) locations, checked as the controllers would.
+
+    Locations whose code is in `codes` are skipped, and `codes` is updated
+    with the codes returned. Locations whose parent is not in `parent_codes`
+    are skipped with a warning; any other invalid location throws.
+    """
+    timestamp = timestamp or now_datetime().strftime(TIMESTAMP_FORMAT)
+    valid = []
+    for code, name, parent in locations:
+        if codes is not None and code in codes:
+            continue
+        if parent_codes is not None and parent and parent not in parent_codes:
+            warn(f"{PARENT_DOCTYPES[doctype]} {parent} not found for {doctype.lower()} {code}")
+            continue
+        if codes is not None:
+            codes.add(code)
+        valid.append((code, name, parent))
+
+    errors = validate_many(doctype, [(code, parent) for code, _name, parent in valid], parent_codes)
+    if errors:
+        index, message = errors[0]
+        frappe.throw(_("{0} {1}: {2}").format(doctype, valid[index][0], message))
+    return [build_row(doctype, code, name, parent, timestamp, owner) for code, name, parent in valid]
+
+
+def get_state(doctype):
+    """Return the checkpoint of a location doctype, starting over when it no longer matches the table.
+
+    A table holding fewer rows than its checkpoint has been cleared since,
+    so its import is run again from the start.
+    """
+    state = frappe.db.get_value(
+        STATE_DOCTYPE,
+        doctype,
+        ["status", "rows_processed", "rows_imported", "total_rows", "last_code"],
+        as_dict=True,
+    )
+    if not state:
+        frappe.get_doc({"doctype": STATE_DOCTYPE, "location_doctype": doctype}).insert(ignore_permissions=True)
+        return frappe._dict(status="Pending", rows_processed=0, rows_imported=0, total_rows=0, last_code=None)
+
+    if frappe.db.count(doctype) < state.rows_imported:
+        state.update(status="Pending", rows_processed=0, rows_imported=0, total_rows=0, last_code=None)
+        _save_state(doctype, **state)
+    return state
+
+
+def reset_import_state():
+    """Forget every checkpoint, for when the location tables are emptied."""
+    frappe.db.delete(STATE_DOCTYPE)
+
+
+def _get_codes(doctype):
+    return set(frappe.db.sql_list(f"SELECT `name` FROM `tab{doctype}`"))
+
+
+def _save_state(doctype, **values):
+    frappe.db.set_value(STATE_DOCTYPE, doctype, values)
+
+
+def _publish(doctype, state, total=None, status=None):
+    total = total or state.total_rows
+    frappe.publish_realtime(
+        PROGRESS_EVENT,
+        {
+            "doctype": doctype,
+            "status": status or state.status or "Running",
+            "processed": state.rows_processed,
+            "imported": state.rows_imported,
+            "total": total,
+            "percent": round(state.rows_processed * 100 / total, 1) if total else 100,
+        },
+        user=frappe.session.user,
+    )
@@ -1,14 +1,43 @@
 import csv
 import os
+import queue
+import threading
 import time
 
 import frappe
-from frappe.utils import cint
-
-
+from frappe.utils import cint, now_datetime
+
+from indo_geo.indo_geo.utils.import_job import reset_import_state
+from indo_geo.indo_geo.utils.import_metrics import (
+    current_job,
+    get_questions,
+    report,
+    timed_commit,
+    tracked,
+    warn,
+)
+from indo_geo.indo_geo.utils.location_cache import adopt_snapshot, bump_version
+from indo_geo.indo_geo.utils.location_data import (
+    COMPRESSION_SUFFIXES,
+    CSV_FILES,
+    TABLE_COLUMNS,
+    TIMESTAMP_FORMAT,
+    build_row,
+    find_data_file,
+    find_snapshot,
+    get_data_path,
+    iter_locations,
+    open_data_file,
+)
+from indo_geo.indo_geo.utils.location_indexes import add_location_indexes
+from indo_geo.indo_geo.utils.snapshot import SNAPSHOT_FILE
+from indo_geo.indo_geo.utils.static_bundle import rebuild_after_import
+
+
+@tracked
 def import_all_locations():
     """Import all location data from CSV files."""
-    print("Starting location data import...")
+    report("Starting location data import...")
 
     import_all_locations_sql()
 
@@ -25,17 +54,18 @@ def import_all_locations():
     # print("Location data import completed successfully!")
 
 
+@tracked
 def import_provinces(data_path):
     """Import provinces from CSV file."""
-    file_path = os.path.join(data_path, "provinces.csv")
+    file_path = find_data_file(os.path.join(data_path, "provinces.csv"))
 
     if not os.path.exists(file_path):
         frappe.throw(f"Province data file not found: {file_path}")
 
-    print("Importing provinces...")
+    report("Importing provinces...")
     count = 0
 
-    with open(file_path, encoding='utf-8') as csvfile:
+    with open_data_file(file_path) as csvfile:
         reader = csv.reader(csvfile)
         for row in reader:
             if len(row) != 2:
@@ -55,24 +85,26 @@ def import_provinces(data_path):
             count += 1
 
             if count % 10 == 0:
-                frappe.db.commit()
+                timed_commit()
 
-    frappe.db.commit()
-    print(f"Imported {count} provinces")
+    timed_commit()
+    current_job().add_rows(count)
+    report(f"Imported {count} provinces")
 
 
+@tracked
 def import_regencies(data_path):
     """Import regencies from CSV file."""
-    file_path = os.path.join(data_path, "regencies.csv")
+    file_path = find_data_file(os.path.join(data_path, "regencies.csv"))
 
     if not os.path.exists(file_path):
         frappe.throw(f"Regency data file not found: {file_path}")
 
-    print("Importing regencies...")
+    report("Importing regencies...")
     count = 0
     errors = []
 
-    with open(file_path, encoding='utf-8') as csvfile:
+    with open_data_file(file_path) as csvfile:
         reader = csv.reader(csvfile)
         for row in reader:
             if len(row) != 2:
@@ -101,25 +133,27 @@ def import_regencies(data_path):
             count += 1
 
             if count % 50 == 0:
-                frappe.db.commit()
+                timed_commit()
 
-    frappe.db.commit()
-    print(f"Imported {count} regencies")
+    timed_commit()
+    current_job().add_rows(count)
+    report(f"Imported {count} regencies")
 
     if errors:
-        print(f"Errors: {len(errors)}")
+        report(f"Errors: {len(errors)}")
         for error in errors[:10]:
-            print(f"  - {error}")
+            report(f"  - {error}")
 #
+@tracked
 def import_districts(data_path):
     """Import districts from CSV file."""
-    file_path = os.path.join(data_path, "districts.csv")
+    file_path = find_data_file(os.path.join(data_path, "districts.csv"))
     if not os.path.exists(file_path):
         frappe.throw(f"District data file not found: {file_path}")
-    print("Importing districts...")
+    report("Importing districts...")
     count = 0
     errors = []
-    with open(file_path, encoding='utf-8') as csvfile:
+    with open_data_file(file_path) as csvfile:
         reader = csv.reader(csvfile)
         for row in reader:
             # Handle both 2-column (actual data) and 3-column (test data) formats
@@ -150,23 +184,25 @@ def import_districts(data_path):
             doc.insert(ignore_permissions=True)
             count += 1
             if count % 100 == 0:
-                frappe.db.commit()
-    frappe.db.commit()
-    print(f"Imported {count} districts")
+                timed_commit()
+    timed_commit()
+    current_job().add_rows(count)
+    report(f"Imported {count} districts")
     if errors:
-        print(f"Errors: {len(errors)}")
+        report(f"Errors: {len(errors)}")
         for error in errors[:10]:
-            print(f"  - {error}")
+            report(f"  - {error}")
 
+@tracked
 def import_villages(data_path):
     """Import villages from CSV file."""
-    file_path = os.path.join(data_path, "villages.csv")
+    file_path = find_data_file(os.path.join(data_path, "villages.csv"))
     if not os.path.exists(file_path):
         frappe.throw(f"Village data file not found: {file_path}")
-    print("Importing villages...")
+    report("Importing villages...")
     count = 0
     errors = []
-    with open(file_path, encoding='utf-8') as csvfile:
+    with open_data_file(file_path) as csvfile:
         reader = csv.reader(csvfile)
         for row in reader:
             # Handle both 2-column (actual data) and 3-column (test data) formats
@@ -198,13 +234,14 @@ def import_villages(data_path):
             doc.insert(ignore_permissions=True)
             count += 1
             if count % 200 == 0:
-                frappe.db.commit()
-    frappe.db.commit()
-    print(f"Imported {count} villages")
+                timed_commit()
+    timed_commit()
+    current_job().add_rows(count)
+    report(f"Imported {count} villages")
     if errors:
-        print(f"Errors: {len(errors)}")
+        report(f"Errors: {len(errors)}")
         for error in errors[:10]:
-            print(f"  - {error}")
+            report(f"  - {error}")
 
 def get_data_counts():
     """Get count of records in CSV files."""
@@ -214,15 +251,15 @@ def get_data_counts():
     counts = {}
 
     # Count provinces
-    file_path = os.path.join(data_path, "provinces.csv")
+    file_path = find_data_file(os.path.join(data_path, "provinces.csv"))
     if os.path.exists(file_path):
-        with open(file_path, encoding='utf-8') as csvfile:
+        with open_data_file(file_path) as csvfile:
             counts['provinces'] = sum(1 for row in csv.reader(csvfile) if len(row) == 2)
 
     # Count regencies
-    file_path = os.path.join(data_path, "regencies.csv")
+    file_path = find_data_file(os.path.join(data_path, "regencies.csv"))
     if os.path.exists(file_path):
-        with open(file_path, encoding='utf-8') as csvfile:
+        with open_data_file(file_path) as csvfile:
             counts['regencies'] = sum(1 for row in csv.reader(csvfile) if len(row) == 2)
 
     return counts
@@ -232,203 +269,490 @@ def get_data_counts():
 # SQL BULK IMPORT METHODS (HIGH PERFORMANCE)
 # ===============================================
 
-def import_all_locations_sql():
-    """Import all location data using SQL bulk import (fast method)."""
-    print("Starting HIGH-PERFORMANCE SQL bulk import...")
+# Rows per INSERT statement when a SQL dump is executed in pieces
+SQL_STATEMENT_ROWS = 5000
+
+@tracked
+def import_all_locations_sql(workers=None, data_path=None):
+    """Import all location data using SQL bulk import (fast method).
+
+    With more than one worker (argument or `indo_geo_import_workers` in
+    site_config), district and village chunks are spread over that many
+    database connections once provinces and regencies are loaded. The SQL
+    files are read from the `sql` directory of `data_path` (the app's data
+    directory by default).
+    """
+    workers = cint(workers or frappe.conf.get("indo_geo_import_workers") or 1)
+    report("Starting HIGH-PERFORMANCE SQL bulk import...")
     start_time = time.time()
 
-    # Get the app path
-    app_path = frappe.get_app_path("indo_geo")
-    sql_path = os.path.join(app_path, "..", "data", "sql")
+    sql_path = os.path.join(data_path or get_data_path(), "sql")
 
     if not os.path.exists(sql_path):
-        print(f"SQL directory not found: {sql_path}")
-        print("Please run dump_locations.convert_csv_to_sql() first to generate SQL files")
+        warn(f"SQL directory not found: {sql_path}")
+        warn("Please run dump_locations.convert_csv_to_sql() first to generate SQL files")
         return
 
     # Import in order: Province -> Regency -> District -> Village
     import_provinces_sql(sql_path)
     import_regencies_sql(sql_path)
-    import_districts_sql(sql_path)
-    import_villages_sql(sql_path)
+    if workers > 1:
+        import_sql_parallel(sql_path, workers)
+    else:
+        import_districts_sql(sql_path)
+        import_villages_sql(sql_path)
+
+    # Raw SQL bypasses document hooks, so invalidate cached hierarchies here
+    bump_version()
+    if not frappe.flags.in_location_bulk_load:
+        # Bulk load mode does these itself, once its integrity checks have passed
+        add_location_indexes()
+        rebuild_after_import()
+        adopt_snapshot()
 
     end_time = time.time()
-    print(f"HIGH-PERFORMANCE SQL bulk import completed in {end_time - start_time:.2f} seconds!")
+    report(f"HIGH-PERFORMANCE SQL bulk import completed in {end_time - start_time:.2f} seconds!")
 
 
+@tracked
 def import_provinces_sql(sql_path):
     """Import provinces using SQL bulk insert."""
-    file_path = os.path.join(sql_path, "provinces.sql")
+    file_path = find_data_file(os.path.join(sql_path, "provinces.sql"))
 
     if not os.path.exists(file_path):
-        print(f"SQL file not found: {file_path}")
+        warn(f"SQL file not found: {file_path}")
         return
 
-    print("Bulk importing provinces...")
+    report("Bulk importing provinces...")
     start_time = time.time()
 
     # Check if data already exists
     existing_count = frappe.db.count("Province")
     if existing_count > 0:
-        print(f"Found {existing_count} existing provinces. Skipping import to avoid duplicates.")
+        report(f"Found {existing_count} existing provinces. Skipping import to avoid duplicates.")
         return
 
-    # Execute SQL file
-    with open(file_path, encoding='utf-8') as f:
-        sql_content = f.read()
-
-    if sql_content.strip():
-        frappe.db.sql(sql_content)
-        frappe.db.commit()
+    # Stream the SQL file in statements of bounded size, decompressing it if needed
+    job = current_job()
+    statements = iter_sql_chunks(file_path, max_rows=SQL_STATEMENT_ROWS)
+    for statement, _bytes_read in job.iter_span("read", statements):
+        with job.span("execute"):
+            frappe.db.sql(statement)
+    timed_commit()
+    job.add_bytes(os.path.getsize(file_path))
 
     # Get count of imported records
     imported_count = frappe.db.count("Province")
+    job.add_rows(imported_count)
     end_time = time.time()
 
-    print(f"Bulk imported {imported_count} provinces in {end_time - start_time:.2f} seconds")
+    report(f"Bulk imported {imported_count} provinces in {end_time - start_time:.2f} seconds")
 
 
+@tracked
 def import_regencies_sql(sql_path):
     """Import regencies using SQL bulk insert."""
-    file_path = os.path.join(sql_path, "regencies.sql")
+    file_path = find_data_file(os.path.join(sql_path, "regencies.sql"))
 
     if not os.path.exists(file_path):
-        print(f"SQL file not found: {file_path}")
+        warn(f"SQL file not found: {file_path}")
         return
 
-    print("Bulk importing regencies...")
+    report("Bulk importing regencies...")
     start_time = time.time()
 
     # Check if data already exists
     existing_count = frappe.db.count("Regency")
     if existing_count > 0:
-        print(f"Found {existing_count} existing regencies. Skipping import to avoid duplicates.")
+        report(f"Found {existing_count} existing regencies. Skipping import to avoid duplicates.")
         return
 
     # Validate dependencies first
     province_count = frappe.db.count("Province")
     if province_count == 0:
-        print("Error: No provinces found. Please import provinces first.")
+        warn("Error: No provinces found. Please import provinces first.")
         return
 
-    # Execute SQL file
-    with open(file_path, encoding='utf-8') as f:
-        sql_content = f.read()
-
-    if sql_content.strip():
-        frappe.db.sql(sql_content)
-        frappe.db.commit()
+    # Stream the SQL file in statements of bounded size, decompressing it if needed
+    job = current_job()
+    statements = iter_sql_chunks(file_path, max_rows=SQL_STATEMENT_ROWS)
+    for statement, _bytes_read in job.iter_span("read", statements):
+        with job.span("execute"):
+            frappe.db.sql(statement)
+    timed_commit()
+    job.add_bytes(os.path.getsize(file_path))
 
     # Get count of imported records
     imported_count = frappe.db.count("Regency")
+    job.add_rows(imported_count)
     end_time = time.time()
 
-    print(f"Bulk imported {imported_count} regencies in {end_time - start_time:.2f} seconds")
+    report(f"Bulk imported {imported_count} regencies in {end_time - start_time:.2f} seconds")
 
 
+@tracked
 def import_districts_sql(sql_path):
     """Import districts using SQL bulk insert."""
-    file_path = os.path.join(sql_path, "districts.sql")
+    file_path = find_data_file(os.path.join(sql_path, "districts.sql"))
 
     if not os.path.exists(file_path):
-        print(f"SQL file not found: {file_path}")
+        warn(f"SQL file not found: {file_path}")
         return
 
-    print("Bulk importing districts...")
+    report("Bulk importing districts...")
     start_time = time.time()
 
     # Check if data already exists
     existing_count = frappe.db.count("District")
     if existing_count > 0:
-        print(f"Found {existing_count} existing districts. Skipping import to avoid duplicates.")
+        report(f"Found {existing_count} existing districts. Skipping import to avoid duplicates.")
         return
 
     # Validate dependencies first
     regency_count = frappe.db.count("Regency")
     if regency_count == 0:
-        print("Error: No regencies found. Please import regencies first.")
+        warn("Error: No regencies found. Please import regencies first.")
         return
 
-    # Execute SQL file
-    with open(file_path, encoding='utf-8') as f:
-        sql_content = f.read()
-
-    if sql_content.strip():
-        frappe.db.sql(sql_content)
-        frappe.db.commit()
+    # Stream the SQL file in statements of bounded size, decompressing it if needed
+    job = current_job()
+    statements = iter_sql_chunks(file_path, max_rows=SQL_STATEMENT_ROWS)
+    for statement, _bytes_read in job.iter_span("read", statements):
+        with job.span("execute"):
+            frappe.db.sql(statement)
+    timed_commit()
+    job.add_bytes(os.path.getsize(file_path))
 
     # Get count of imported records
     imported_count = frappe.db.count("District")
+    job.add_rows(imported_count)
     end_time = time.time()
 
-    print(f"Bulk imported {imported_count} districts in {end_time - start_time:.2f} seconds")
+    report(f"Bulk imported {imported_count} districts in {end_time - start_time:.2f} seconds")
 
 
+@tracked
 def import_villages_sql(sql_path):
-    """Import villages using SQL bulk insert."""
-    file_path = os.path.join(sql_path, "villages.sql")
+    """Import villages using SQL bulk insert.
+
+    villages.sql is not shipped with the app, so without it villages are
+    bulk imported straight from villages.csv instead.
+    """
+    file_path = find_data_file(os.path.join(sql_path, "villages.sql"))
 
     if not os.path.exists(file_path):
-        print(f"SQL file not found: {file_path}")
+        warn(f"SQL file not found: {file_path}, importing villages from CSV instead")
+        import_csv_bulk(os.path.join(sql_path, ".."), "Village")
         return
 
-    print("Bulk importing villages...")
+    report("Bulk importing villages...")
     start_time = time.time()
 
     # Check if data already exists
     existing_count = frappe.db.count("Village")
     if existing_count > 0:
-        print(f"Found {existing_count} existing villages. Skipping import to avoid duplicates.")
+        report(f"Found {existing_count} existing villages. Skipping import to avoid duplicates.")
         return
 
     # Validate dependencies first
     district_count = frappe.db.count("District")
     if district_count == 0:
-        print("Error: No districts found. Please import districts first.")
+        warn("Error: No districts found. Please import districts first.")
         return
 
-    # Execute SQL file in chunks to avoid memory issues
-    print("Reading village SQL file...")
-    with open(file_path, encoding='utf-8') as f:
-        content = f.read()
-
-    # Split by chunks (look for "-- Chunk" markers)
-    chunks = []
-    current_chunk = []
-
-    for line in content.split('\n'):
-        if line.strip().startswith('-- Chunk') and current_chunk:
-            chunks.append('\n'.join(current_chunk))
-            current_chunk = []
-        current_chunk.append(line)
-
-    if current_chunk:
-        chunks.append('\n'.join(current_chunk))
-
-    # Execute each chunk
-    total_chunks = len([c for c in chunks if 'INSERT INTO' in c])
-    if total_chunks == 0:
-        # Fallback: execute entire file
-        print("No chunks found, executing entire file...")
-        if content.strip():
-            frappe.db.sql(content)
-            frappe.db.commit()
-    else:
-        print(f"Executing {total_chunks} chunks...")
-        for i, chunk in enumerate(chunks, 1):
-            if 'INSERT INTO' in chunk:
-                print(f"  Processing chunk {i}/{total_chunks}...")
-                frappe.db.sql(chunk)
-                if i % 5 == 0:  # Commit every 5 chunks
-                    frappe.db.commit()
+    # Stream the SQL file one chunk (of at most SQL_STATEMENT_ROWS rows) at a time to keep memory flat
+    file_size = os.path.getsize(file_path) or 1
+    report(f"Streaming village SQL file ({file_size / 1024 / 1024:.1f} MB)...")
+    # Progress is only known as a share of the file when it is not compressed
+    compressed = file_path.endswith(tuple(COMPRESSION_SUFFIXES.values()))
+
+    job = current_job()
+    statements = iter_sql_chunks(file_path, max_rows=SQL_STATEMENT_ROWS)
+    for i, (statement, bytes_read) in enumerate(job.iter_span("read", statements), 1):
+        with job.span("execute"):
+            frappe.db.sql(statement)
+        if i % 5 == 0:  # Commit every 5 chunks, or only once at the end in bulk load mode
+            if not frappe.flags.in_location_bulk_load:
+                timed_commit()
+            if compressed:
+                report(f"  Processed chunk {i} ({bytes_read / 1024 / 1024:.1f} MB of SQL)...")
+            else:
+                report(f"  Processed chunk {i} ({bytes_read / file_size:.0%} of file)...")
 
-        frappe.db.commit()
+    timed_commit()
+    job.add_bytes(os.path.getsize(file_path))
 
     # Get count of imported records
     imported_count = frappe.db.count("Village")
+    job.add_rows(imported_count)
     end_time = time.time()
 
-    print(f"Bulk imported {imported_count} villages in {end_time - start_time:.2f} seconds")
+    report(f"Bulk imported {imported_count} villages in {end_time - start_time:.2f} seconds")
+
+
+def iter_sql_chunks(file_path, max_rows=None):
+    """Stream a SQL dump and yield one statement per "-- Chunk" section.
+
+    Yields (statement, bytes_read) tuples, where bytes_read is the offset
+    reached so far in the SQL text, so callers can report progress. Only the
+    current chunk is held in memory, and gzip or zstd dumps are decompressed
+    as they are read. A file without chunk markers is yielded as a single
+    statement. Sections without an INSERT (headers, comments) are skipped.
+
+    With `max_rows`, multi-row INSERTs written one row per line (as the dump
+    functions do) are additionally split into statements of at most that many
+    rows, so that a dump without chunk markers can still be spread out.
+    """
+    bytes_read = 0
+    chunk = []
+    insert_header = None
+    rows = 0
+
+    with open_data_file(file_path, "rb") as f:
+        for raw_line in f:
+            line = raw_line.decode("utf-8")
+            stripped = line.strip()
+            if stripped.startswith("-- Chunk") and chunk:
+                statement = "".join(chunk)
+                if "INSERT" in statement:
+                    yield statement, bytes_read
+                chunk = []
+                insert_header = None
+            elif max_rows and stripped.startswith("INSERT"):
+                insert_header = line
+                rows = 0
+
+            chunk.append(line)
+            bytes_read += len(raw_line)
+
+            if insert_header and stripped.startswith("("):
+                rows += 1
+                if rows >= max_rows and stripped.endswith("),"):
+                    chunk[-1] = stripped[:-1] + ";\n"
+                    yield "".join(chunk), bytes_read
+                    chunk = [insert_header]
+                    rows = 0
+
+    statement = "".join(chunk)
+    if "INSERT" in statement and statement != insert_header:
+        yield statement, bytes_read
+
+
+# ===============================================
+# CSV BULK IMPORT (NO PRE-GENERATED SQL NEEDED)
+# ===============================================
+
+# Rows per multi-row INSERT when importing straight from CSV
+CSV_BULK_BATCH_SIZE = 2000
+
+PARENT_DOCTYPES = {"Regency": "Province", "District": "Regency", "Village": "District"}
+
+
+@tracked
+def import_csv_bulk(data_path, doctype, batch_size=CSV_BULK_BATCH_SIZE):
+    """Import a location table straight from its CSV file with multi-row INSERTs.
+
+    Rows are read, built and inserted `batch_size` at a time, so memory stays
+    bounded by one batch whatever the size of the CSV file. A binary snapshot
+    in `data_path` is used instead of the CSV file when it was built from it.
+    """
+    file_path = find_data_file(os.path.join(data_path, CSV_FILES[doctype]))
+    snapshot = find_snapshot(data_path)
+    if snapshot:
+        file_path = snapshot.file_path
+    elif os.path.exists(os.path.join(data_path, SNAPSHOT_FILE)):
+        warn(f"Ignoring {SNAPSHOT_FILE}: it was not built from the current CSV files")
+    if not os.path.exists(file_path):
+        warn(f"CSV file not found: {file_path}")
+        return
+
+    report(f"Bulk importing {doctype} records from {os.path.basename(file_path)}...")
+    start_time = time.time()
+
+    existing_count = frappe.db.count(doctype)
+    if existing_count > 0:
+        report(f"Found {existing_count} existing {doctype} records. Skipping import to avoid duplicates.")
+        return
+
+    parent_doctype = PARENT_DOCTYPES.get(doctype)
+    if parent_doctype and frappe.db.count(parent_doctype) == 0:
+        warn(f"Error: No {parent_doctype} records found. Please import them first.")
+        return
+
+    job = current_job()
+    timestamp = now_datetime().strftime(TIMESTAMP_FORMAT)
+    locations = job.iter_span("read", iter_locations(data_path, doctype))
+    rows = job.iter_span("transform", (build_row(doctype, *location, timestamp) for location in locations))
+    with job.span("execute"):
+        frappe.db.bulk_insert(doctype, TABLE_COLUMNS[doctype], rows, chunk_size=batch_size)
+    timed_commit()
+    job.add_bytes(os.path.getsize(file_path))
+
+    imported_count = frappe.db.count(doctype)
+    job.add_rows(imported_count)
+    end_time = time.time()
+
+    report(f"Bulk imported {imported_count} {doctype} records in {end_time - start_time:.2f} seconds")
+
+
+# ===============================================
+# PARALLEL BULK IMPORT (MULTIPLE CONNECTIONS)
+# ===============================================
+
+# Rows per INSERT statement handed to a parallel worker
+PARALLEL_CHUNK_ROWS = 1000
+
+
+@tracked
+def import_sql_parallel(sql_path, workers):
+    """Import districts and villages by spreading their chunks over worker connections.
+
+    Provinces and regencies must already be loaded. Each worker thread opens its
+    own database connection; chunks are fed through a bounded queue so memory
+    stays flat regardless of dump size.
+
+    Only empty tables are loaded. If any worker fails, the chunks the other
+    workers have already committed are deleted again, so the tables are left
+    empty and a rerun starts over rather than skipping a half-loaded table.
+    """
+    tables = []
+    csv_fallback = False
+    for doctype, filename in (("District", "districts.sql"), ("Village", "villages.sql")):
+        file_path = find_data_file(os.path.join(sql_path, filename))
+        if not os.path.exists(file_path):
+            if doctype == "Village":
+                # Falls back to the CSV bulk import once districts are loaded
+                csv_fallback = True
+            else:
+                warn(f"SQL file not found: {file_path}")
+            continue
+
+        existing_count = frappe.db.count(doctype)
+        if existing_count > 0:
+            report(f"Found {existing_count} existing {doctype} records. Skipping import to avoid duplicates.")
+            continue
+
+        tables.append((doctype, file_path))
+
+    if tables:
+        _run_parallel_sql(tables, workers)
+    if csv_fallback:
+        import_villages_sql(sql_path)
+
+
+def _run_parallel_sql(tables, workers):
+    """Execute the chunks of the given (doctype, SQL file) tables over `workers` connections.
+
+    On failure the tables are emptied again, see import_sql_parallel.
+    """
+    report(f"Bulk importing districts and villages over {workers} connections...")
+    start_time = time.time()
+
+    # Make provinces and regencies visible to the worker connections
+    timed_commit()
+
+    job = current_job()
+    jobs = queue.Queue(maxsize=workers * 2)
+    errors = []
+    stats = [
+        {"worker": i + 1, "statements": 0, "rows": 0, "seconds": 0.0, "round_trips": 0}
+        for i in range(workers)
+    ]
+    threads = [
+        threading.Thread(
+            target=_parallel_sql_worker,
+            args=(frappe.local.site, frappe.local.sites_path, jobs, stats[i], errors),
+            daemon=True,
+        )
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        for _doctype, file_path in tables:
+            chunks = iter_sql_chunks(file_path, max_rows=PARALLEL_CHUNK_ROWS)
+            for statement, _bytes_read in job.iter_span("read", chunks):
+                if errors:
+                    break
+                # Waiting for a free worker is time spent executing
+                with job.span("execute"):
+                    jobs.put(statement)
+            job.add_bytes(os.path.getsize(file_path))
+    except Exception as e:
+        # Makes the workers drain the queue
+        errors.append(e)
+    finally:
+        for _thread in threads:
+            jobs.put(None)
+        with job.span("execute"):
+            for thread in threads:
+                thread.join()
+
+    if errors:
+        _clear_partial_load([doctype for doctype, _file_path in tables])
+        raise errors[0]
+
+    total_rows = sum(stat["rows"] for stat in stats)
+    job.add_rows(total_rows)
+    job.add_round_trips(sum(stat["round_trips"] for stat in stats))
+    total_time = time.time() - start_time
+    for stat in stats:
+        rate = stat["rows"] / stat["seconds"] if stat["seconds"] else 0
+        report(f"  Worker {stat['worker']}: {stat['statements']} chunks, {stat['rows']} rows "
+               f"in {stat['seconds']:.2f}s ({rate:,.0f} rows/s)")
+    report(f"Bulk imported {total_rows} districts and villages in {total_time:.2f} seconds "
+           f"({total_rows / (total_time or 1):,.0f} rows/s)")
+
+
+def _clear_partial_load(doctypes):
+    """Delete the rows committed by the workers of a failed parallel import."""
+    frappe.db.rollback()
+    for doctype in doctypes:
+        frappe.db.delete(doctype)
+    timed_commit()
+    warn(f"Parallel import failed, emptied {', '.join(doctypes)} again so that a rerun starts over")
+
+
+def _parallel_sql_worker(site, sites_path, jobs, stats, errors):
+    """Execute queued statements on a connection of its own until a None sentinel arrives.
+
+    After any error (in this or another worker) statements are only drained,
+    so that the producer never blocks on a full queue.
+    """
+    frappe.init(site=site, sites_path=sites_path)
+    try:
+        try:
+            frappe.connect()
+        except Exception as e:
+            errors.append(e)
+        start_questions = get_questions()
+
+        while (statement := jobs.get()) is not None:
+            if errors:
+                continue
+
+            start_time = time.time()
+            try:
+                frappe.db.sql(statement)
+                stats["statements"] += 1
+                if stats["statements"] % 5 == 0:  # Commit every 5 chunks
+                    frappe.db.commit()
+            except Exception as e:
+                frappe.db.rollback()
+                errors.append(e)
+                continue
+
+            stats["rows"] += statement.count("\n(")
+            stats["seconds"] += time.time() - start_time
+
+        if not errors:
+            frappe.db.commit()
+        end_questions = get_questions()
+        if start_questions is not None and end_questions is not None:
+            stats["round_trips"] = end_questions - start_questions - 1
+    finally:
+        frappe.destroy()
 
 
 def benchmark_import_methods():
@@ -455,6 +779,29 @@ def benchmark_import_methods():
     sql_time = time.time() - start_time
     sql_counts = get_location_counts()
 
+    # Clear and test LOAD DATA LOCAL INFILE method
+    from indo_geo.indo_geo.utils.infile_import import import_all_locations_infile, local_infile_available
+
+    clear_all_locations()
+
+    print("\n3. Testing LOAD DATA LOCAL INFILE Import Method...")
+    infile_supported = local_infile_available()
+    start_time = time.time()
+    import_all_locations_infile()
+    infile_time = time.time() - start_time
+    infile_counts = get_location_counts()
+
+    # Clear and test the SQL method in bulk load mode
+    from indo_geo.indo_geo.utils.bulk_load import import_all_locations_bulk
+
+    clear_all_locations()
+
+    print("\n4. Testing SQL Import Method in Bulk Load Mode...")
+    start_time = time.time()
+    import_all_locations_bulk()
+    bulk_time = time.time() - start_time
+    bulk_counts = get_location_counts()
+
     # Results
     print("\n" + "=" * 60)
     print("BENCHMARK RESULTS")
@@ -465,6 +812,16 @@ def benchmark_import_methods():
     print("\nSQL Import Method:")
     print(f"  Time: {sql_time:.2f} seconds")
     print(f"  Records: {sql_counts}")
+    print("\nLOAD DATA LOCAL INFILE Import Method" + ("" if infile_supported else " (unavailable, fell back to SQL)") + ":")
+    print(f"  Time: {infile_time:.2f} seconds")
+    print(f"  Records: {infile_counts}")
+    if infile_time > 0 and sql_time > 0:
+        print(f"  Speed vs SQL method: {sql_time / infile_time:.1f}x")
+    print("\nSQL Import Method in Bulk Load Mode (including index rebuild and checks):")
+    print(f"  Time: {bulk_time:.2f} seconds")
+    print(f"  Records: {bulk_counts}")
+    if bulk_time > 0 and sql_time > 0:
+        print(f"  Speed vs SQL method: {sql_time / bulk_time:.1f}x")
 
     if sql_time > 0:
         improvement = ((csv_time - sql_time) / csv_time) * 100
@@ -498,14 +855,16 @@ def get_location_counts():
 
 def clear_all_locations():
     """Clear all location data (for testing purposes)."""
-    print("Clearing all location data...")
+    report("Clearing all location data...")
 
     # Delete in reverse order to respect foreign key constraints
     frappe.db.delete("Village", {"name": ("!=", "")})
     frappe.db.delete("District", {"name": ("!=", "")})
     frappe.db.delete("Regency", {"name": ("!=", "")})
     frappe.db.delete("Province", {"name": ("!=", "")})
+    reset_import_state()
 
     frappe.db.commit()
-    print("All location data cleared")
+    bump_version()
+    report("All location data cleared")
 
@@ -0,0 +1,284 @@
+"""Progress, timing and throughput instrumentation for the import and dump jobs.
+
+A job runs inside `track_job(name)`. Within it, `job.span(phase)` charges
+time to one of the phases (read, transform, execute, commit), `add_rows` and
+`add_bytes` count the work done, and the peak RSS of the process and the
+database round-trips of the job's connection are measured throughout. Jobs
+nest: a job started inside another one (the province import inside the full
+SQL import) records into the outer job.
+
+When the outermost job ends its metrics are written as a JSON record to the
+`indo_geo_import` log and kept in Redis, from where `get_metrics_text()`
+renders them in the Prometheus text format for `indo_geo.api.get_import_metrics`.
+
+Progress messages go through `report()` and are only printed when the site
+sets `indo_geo_import_verbose` in site_config (or `frappe.flags.indo_geo_verbose`
+is set), so jobs are quiet by default under `bench migrate` and in workers.
+"""
+
+import functools
+import json
+import os
+import resource
+import threading
+import time
+from contextlib import contextmanager
+
+import frappe
+from frappe.utils import now
+
+PHASES = ("read", "transform", "execute", "commit")
+
+# Redis hash holding the metrics of the last run of each job
+METRICS_CACHE_KEY = "indo_geo_import_metrics"
+
+# Seconds between two samples of the process RSS
+RSS_SAMPLE_INTERVAL = 0.05
+
+
+def is_verbose():
+    return bool(frappe.flags.indo_geo_verbose or frappe.conf.get("indo_geo_import_verbose"))
+
+
+def report(message):
+    """Print a progress message when verbose output is enabled."""
+    if is_verbose():
+        print(message)
+
+
+def warn(message):
+    """Print and log a problem that stops part of a job, whatever the verbosity."""
+    frappe.logger("indo_geo_import", allow_site=True).warning(message)
+    print(message)
+
+
+class ImportJob:
+    """Metrics of one import or dump job; see `track_job`."""
+
+    def __init__(self, name):
+        self.name = name
+        self.rows = 0
+        self.bytes_read = 0
+        self.round_trips = 0
+        self.spans = dict.fromkeys(PHASES, 0.0)
+        self._phase = None
+        self._phase_start = None
+
+    def add_rows(self, count):
+        self.rows += count
+
+    def add_bytes(self, count):
+        self.bytes_read += count
+
+    def add_round_trips(self, count):
+        """Count round-trips made on other connections, such as the parallel workers'."""
+        self.round_trips += count or 0
+
+    @contextmanager
+    def span(self, phase):
+        """Charge the time spent in the block to `phase`.
+
+        Spans nest exclusively: while an inner span runs, its time is taken
+        off the enclosing one, so the phases never add up to more than the
+        job's run time.
+        """
+        outer = self._switch(phase)
+        try:
+            yield
+        finally:
+            self._switch(outer)
+
+    def iter_span(self, phase, iterable):
+        """Yield from `iterable`, charging the time spent producing each item to `phase`."""
+        iterator = iter(iterable)
+        while True:
+            outer = self._switch(phase)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._switch(outer)
+            yield item
+
+    def _switch(self, phase):
+        current = time.perf_counter()
+        if self._phase:
+            self.spans[self._phase] = self.spans.get(self._phase, 0.0) + current - self._phase_start
+        previous, self._phase, self._phase_start = self._phase, phase, current
+        return previous
+
+
+def current_job():
+    """Return the job running in this thread, or a throwaway one outside of any job."""
+    return getattr(frappe.local, "indo_geo_import_job", None) or ImportJob(None)
+
+
+def tracked(func):
+    """Run `func` as a job named after it, see `track_job`."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with track_job(func.__name__):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def timed_commit():
+    """Commit, charging the time to the commit phase of the current job."""
+    with current_job().span("commit"):
+        frappe.db.commit()
+
+
+@contextmanager
+def track_job(name):
+    """Run a job with instrumentation, or record into the job already running."""
+    job = getattr(frappe.local, "indo_geo_import_job", None)
+    if job:
+        yield job
+        return
+
+    job = frappe.local.indo_geo_import_job = ImportJob(name)
+    sampler = RssSampler()
+    start_questions = get_questions()
+    start_time = time.perf_counter()
+    status = "failed"
+    try:
+        with sampler:
+            yield job
+        status = "success"
+    finally:
+        frappe.local.indo_geo_import_job = None
+        seconds = time.perf_counter() - start_time
+        metrics = {
+            "job": name,
+            "status": status,
+            "timestamp": now(),
+            "seconds": round(seconds, 3),
+            "rows": job.rows,
+            "rows_per_second": round(job.rows / seconds) if seconds else 0,
+            "bytes_read": job.bytes_read,
+            "db_round_trips": _round_trips(start_questions, job.round_trips),
+            "peak_rss_bytes": sampler.peak,
+            "spans": {phase: round(spent, 3) for phase, spent in job.spans.items()},
+        }
+        _emit(metrics)
+
+
+def get_last_metrics():
+    """Return the metrics of the last run of each job, by job name."""
+    return frappe.cache().hgetall(METRICS_CACHE_KEY) or {}
+
+
+def get_metrics_text():
+    """Render the metrics of the last run of each job in the Prometheus text format."""
+    gauges = {
+        "seconds": "Run time of the last run in seconds",
+        "rows": "Rows written or dumped by the last run",
+        "rows_per_second": "Throughput of the last run",
+        "bytes_read": "Bytes of data files read by the last run",
+        "db_round_trips": "Database round-trips of the last run",
+        "peak_rss_bytes": "Peak resident set size during the last run",
+        "success": "Whether the last run succeeded",
+        "last_run_timestamp_seconds": "Unix time the last run ended",
+    }
+    runs = sorted(get_last_metrics().values(), key=lambda metrics: metrics["job"])
+    lines = []
+    for gauge, help_text in gauges.items():
+        lines += [f"# HELP indo_geo_import_{gauge} {help_text}", f"# TYPE indo_geo_import_{gauge} gauge"]
+        for metrics in runs:
+            if gauge == "success":
+                value = int(metrics["status"] == "success")
+            elif gauge == "last_run_timestamp_seconds":
+                value = metrics["ended"]
+            else:
+                value = metrics[gauge]
+            value = "NaN" if value is None else value
+            lines.append(f'indo_geo_import_{gauge}{{job="{metrics["job"]}"}} {value}')
+
+    lines += [
+        "# HELP indo_geo_import_phase_seconds Time of the last run spent in each phase",
+        "# TYPE indo_geo_import_phase_seconds gauge",
+    ]
+    for metrics in runs:
+        for phase, spent in metrics["spans"].items():
+            lines.append(f'indo_geo_import_phase_seconds{{job="{metrics["job"]}",phase="{phase}"}} {spent}')
+    return "\n".join(lines) + "\n"
+
+
+def _emit(metrics):
+    frappe.logger("indo_geo_import", allow_site=True).info(json.dumps(metrics))
+    try:
+        frappe.cache().hset(METRICS_CACHE_KEY, metrics["job"], {**metrics, "ended": round(time.time())})
+    except Exception:
+        # Metrics must never fail the job itself
+        pass
+
+    spans = ", ".join(f"{phase} {spent:.2f}s" for phase, spent in metrics["spans"].items() if spent)
+    report(
+        f"{metrics['job']}: {metrics['rows']:,} rows in {metrics['seconds']:.2f}s "
+        f"({metrics['rows_per_second']:,} rows/s), {metrics['bytes_read'] / 1024 / 1024:.1f} MB read, "
+        f"{metrics['db_round_trips'] or 0:,} round-trips, "
+        f"peak RSS {metrics['peak_rss_bytes'] / 1024 / 1024:.0f} MB"
+        + (f" [{spans}]" if spans else "")
+    )
+
+
+def get_questions():
+    """Return the statements this connection has sent to the server so far, or None."""
+    try:
+        return int(frappe.db.sql("SHOW SESSION STATUS LIKE 'Questions'")[0][1])
+    except Exception:
+        return None
+
+
+def _round_trips(start_questions, other_connections):
+    end_questions = get_questions()
+    if start_questions is None or end_questions is None:
+        return None
+    # Not counting the SHOW STATUS that took the first reading
+    return end_questions - start_questions - 1 + other_connections
+
+
+class RssSampler:
+    """Track the peak resident set size of the process while the block runs.
+
+    `ru_maxrss` only ever grows over the lifetime of the process, so the RSS
+    is sampled from /proc in a background thread instead; where /proc is not
+    available the lifetime peak is reported.
+    """
+
+    def __init__(self, interval=RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.peak = _current_rss()
+        if self.peak is not None:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self.peak = max(self.peak, _current_rss() or 0)
+        else:
+            # ru_maxrss is in kilobytes on Linux
+            self.peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, _current_rss() or 0)
+
+
+def _current_rss():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
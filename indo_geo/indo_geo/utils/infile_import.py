@@ -0,0 +1,152 @@
+"""Bulk load the location CSVs with MariaDB's LOAD DATA LOCAL INFILE.
+
+The CSV files are rewritten into tab-separated files holding the exact column
+layout of the `tab*` tables, which the server then loads natively instead of
+parsing multi-row INSERT text. When the server (or the client connection) does
+not allow LOCAL INFILE, the existing chunked SQL import is used instead.
+"""
+
+import os
+import tempfile
+import time
+
+import frappe
+from frappe.utils import cint
+
+from indo_geo.indo_geo.utils.import_locations import (
+    import_all_locations_sql,
+    import_districts_sql,
+    import_provinces_sql,
+    import_regencies_sql,
+    import_villages_sql,
+)
+from indo_geo.indo_geo.utils.import_metrics import current_job, report, tracked
+from indo_geo.indo_geo.utils.location_cache import adopt_snapshot, bump_version
+from indo_geo.indo_geo.utils.location_data import TABLE_COLUMNS, get_data_path, iter_location_rows
+from indo_geo.indo_geo.utils.location_indexes import add_location_indexes
+from indo_geo.indo_geo.utils.static_bundle import rebuild_after_import
+
+SQL_FALLBACKS = {
+    "Province": import_provinces_sql,
+    "Regency": import_regencies_sql,
+    "District": import_districts_sql,
+    "Village": import_villages_sql,
+}
+
+
+@tracked
+def import_all_locations_infile(data_path=None):
+    """Import all location data with LOAD DATA LOCAL INFILE, or chunked INSERTs if unavailable."""
+    if not local_infile_available():
+        report("LOAD DATA LOCAL INFILE is not available, using chunked SQL import...")
+        import_all_locations_sql(data_path=data_path)
+        return
+
+    report("Starting LOAD DATA LOCAL INFILE import...")
+    start_time = time.time()
+    data_path = data_path or get_data_path()
+    sql_path = os.path.join(data_path, "sql")
+
+    use_infile = True
+    for doctype in TABLE_COLUMNS:
+        if use_infile:
+            try:
+                import_table_infile(doctype, data_path)
+                continue
+            except Exception as e:
+                frappe.log_error(f"LOAD DATA LOCAL INFILE failed for {doctype}: {e!s}")
+                report(f"LOAD DATA LOCAL INFILE failed ({e!s}), using chunked SQL import...")
+                use_infile = False
+
+        SQL_FALLBACKS[doctype](sql_path)
+
+    bump_version()
+    add_location_indexes()
+    rebuild_after_import()
+    adopt_snapshot()
+    report(f"LOAD DATA LOCAL INFILE import completed in {time.time() - start_time:.2f} seconds!")
+
+
+def local_infile_available():
+    """Check whether this site's database server accepts LOAD DATA LOCAL INFILE."""
+    if frappe.conf.get("db_type", "mariadb") != "mariadb":
+        return False
+    try:
+        return bool(cint(frappe.db.sql("SELECT @@GLOBAL.local_infile")[0][0]))
+    except Exception:
+        return False
+
+
+def import_table_infile(doctype, data_path):
+    """Load one location table from its CSV file through a temporary TSV file."""
+    existing_count = frappe.db.count(doctype)
+    if existing_count > 0:
+        report(f"Found {existing_count} existing {doctype} records. Skipping import to avoid duplicates.")
+        return
+
+    report(f"Loading {doctype} with LOAD DATA LOCAL INFILE...")
+    start_time = time.time()
+    columns = TABLE_COLUMNS[doctype]
+
+    job = current_job()
+    tsv = tempfile.NamedTemporaryFile("w", suffix=".tsv", encoding="utf-8", delete=False)
+    try:
+        # Removed in the finally below, also when reading the source data fails
+        with job.span("transform"), tsv:
+            for row in job.iter_span("read", iter_location_rows(data_path, doctype)):
+                tsv.write("\t".join(_escape_tsv(value) for value in row))
+                tsv.write("\n")
+
+        connection = _get_infile_connection()
+        try:
+            with job.span("execute"), connection.cursor() as cursor:
+                cursor.execute(
+                    f"""LOAD DATA LOCAL INFILE %s INTO TABLE `tab{doctype}`
+                    CHARACTER SET utf8mb4
+                    FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+                    LINES TERMINATED BY '\\n'
+                    ({", ".join(f"`{column}`" for column in columns)})""",
+                    (tsv.name,),
+                )
+                loaded = cursor.rowcount
+            with job.span("commit"):
+                connection.commit()
+        finally:
+            connection.close()
+    finally:
+        os.unlink(tsv.name)
+
+    # The server reads the file over the infile connection in one statement
+    job.add_round_trips(1)
+    job.add_rows(loaded)
+
+    report(f"Loaded {loaded} {doctype} records in {time.time() - start_time:.2f} seconds")
+
+
+def _escape_tsv(value):
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def _get_infile_connection():
+    """Open a separate connection with the LOCAL INFILE capability enabled.
+
+    Frappe's own connection is opened without it, and the flag can only be set
+    when connecting.
+    """
+    import pymysql
+
+    kwargs = {
+        "user": frappe.conf.db_user or frappe.conf.db_name,
+        "password": frappe.conf.db_password,
+        "database": frappe.conf.db_name,
+        "charset": "utf8mb4",
+        "local_infile": True,
+    }
+    if frappe.conf.db_socket:
+        kwargs["unix_socket"] = frappe.conf.db_socket
+    else:
+        kwargs["host"] = frappe.conf.db_host or "127.0.0.1"
+        kwargs["port"] = cint(frappe.conf.db_port) or 3306
+    return pymysql.connect(**kwargs)
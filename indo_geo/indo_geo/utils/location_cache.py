@@ -0,0 +1,462 @@
+"""Per-worker cache of the location hierarchy.
+
+Location rows only change when an import runs or when somebody edits a
+Province/Regency/District/Village, so every worker keeps its own copy of each
+table in memory and only goes back to the database when the version stamp for
+that doctype (kept in Redis) has moved.
+
+After an import, `adopt_snapshot` checks the binary snapshot shipped in the
+data directory (see snapshot.py) against each table. Tables that match are
+then read from the mapped snapshot instead of the database, until their
+version stamp moves.
+
+Sites running many workers can set `indo_geo_cache_backend` to "redis" in
+site_config.json instead. `get_children` then keeps the children lists in
+Redis hashes shared by all workers, with a small LRU of recent slices in each
+worker, `location_exists` looks codes up in a shared code -> name hash, and
+`get_page` queries the database directly, so none of them loads a whole table
+into a worker. Structures that need every row (the search index, resolver,
+address matcher and `get_code_set`) are still built once per worker in both
+modes, from the mapped snapshot when it was adopted.
+"""
+
+import os
+import time
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+
+import frappe
+from frappe import _
+
+from indo_geo.indo_geo.utils.code_index import (
+    CODE_LENGTHS,
+    PARENT_DOCTYPES,
+    ancestor_codes,
+    code_range,
+)
+from indo_geo.indo_geo.utils.location_data import find_snapshot, get_data_path
+
+# Fields returned by the api.py endpoints, per doctype
+LOCATION_FIELDS = {
+    "Province": ["name", "province_name", "province_code"],
+    "Regency": ["name", "regency_name", "regency_code", "province"],
+    "District": ["name", "district_name", "district_code", "regency", "province"],
+    "Village": ["name", "village_name", "village_code", "district", "regency", "province"],
+}
+
+VERSION_KEY = "indo_geo_location_version"
+
+# Version stamp and file a table was last found identical to the snapshot with
+SNAPSHOT_KEY = "indo_geo_snapshot"
+
+# {site: {doctype: {"version": ..., "rows": [...], "children": {...}}, key: (doctypes, versions, derived)}}
+_local_cache = {}
+
+SHARED_CHILDREN_KEY = "indo_geo_children"
+SHARED_NAMES_KEY = "indo_geo_names"
+
+# Slices kept per worker in front of Redis, overridable with `indo_geo_cache_lru_size`
+SHARED_LRU_SIZE = 512
+
+# Seconds a worker trusts its copy of a version stamp in shared mode
+SHARED_VERSION_TTL = 5
+
+# {(site, doctype, version, parent): rows}, least recently used first
+_shared_lru = OrderedDict()
+
+# {(site, doctype): (expires_at, version)}
+_shared_versions = {}
+
+
+def get_version(doctype):
+    """Return the current version stamp of a location doctype.
+
+    The stamp lives in Redis so that every worker sees a bump made by any other
+    worker. It is created on first use if missing.
+    """
+    key = f"{VERSION_KEY}:{doctype}"
+    version = frappe.cache().get_value(key)
+    if not version:
+        version = str(time.time_ns())
+        frappe.cache().set_value(key, version)
+    return version
+
+
+def get_served_version(doctype):
+    """Return the version stamp this worker's cached reads of a doctype are keyed on.
+
+    The same as `get_version`, except in shared mode, where workers trust their
+    copy of the stamp for SHARED_VERSION_TTL seconds.
+    """
+    if use_shared_cache():
+        return _get_shared_version(doctype)
+    return get_version(doctype)
+
+
+def bump_version(doctype=None):
+    """Invalidate cached rows of one location doctype, or of all of them."""
+    doctypes = [doctype] if doctype else list(LOCATION_FIELDS)
+    version = str(time.time_ns())
+    for dt in doctypes:
+        frappe.cache().set_value(f"{VERSION_KEY}:{dt}", version)
+        _drop_local_entries(dt)
+        if use_shared_cache():
+            frappe.cache().delete_keys(f"{SHARED_CHILDREN_KEY}:{dt}:")
+            frappe.cache().delete_keys(f"{SHARED_NAMES_KEY}:{dt}:")
+
+
+def clear_location_cache(doc=None, method=None):
+    """Document hook: bump the version of the saved/deleted location doctype once the save commits.
+
+    The commit also queues a rebuild of the static location bundle.
+
+    Bumping before the commit would let another worker reload the old rows
+    under the new stamp and serve them until the next edit. This worker's own
+    copy is dropped right away, so it reads its uncommitted changes, and again
+    on rollback, so it does not keep serving them after they were undone.
+    """
+    doctype = doc.doctype if doc else None
+    pending = getattr(frappe.local, "indo_geo_pending_bumps", None)
+    if pending is None:
+        pending = frappe.local.indo_geo_pending_bumps = set()
+    if not pending:
+        frappe.db.after_commit.add(_bump_pending)
+        frappe.db.after_rollback.add(_discard_pending)
+    pending.add(doctype)
+    _drop_local_entries(doctype)
+
+
+def _bump_pending():
+    # static_bundle reads through this module, so it can only be imported here
+    from indo_geo.indo_geo.utils.static_bundle import enqueue_bundle_rebuild
+
+    pending = _pop_pending()
+    if None in pending:
+        bump_version()
+    else:
+        for doctype in pending:
+            bump_version(doctype)
+    enqueue_bundle_rebuild()
+
+
+def _discard_pending():
+    # Structures derived from the rolled back rows (search indexes) go as well
+    if _pop_pending():
+        _local_cache.pop(_get_site(), None)
+        _drop_local_entries()
+
+
+def _pop_pending():
+    pending = getattr(frappe.local, "indo_geo_pending_bumps", None) or set()
+    frappe.local.indo_geo_pending_bumps = set()
+    return pending
+
+
+def _drop_local_entries(doctype=None):
+    site_cache = _get_site_cache()
+    for dt in [doctype] if doctype else list(LOCATION_FIELDS):
+        site_cache.pop(dt, None)
+        _shared_versions.pop((_get_site(), dt), None)
+    # Derived structures (see get_derived) only notice a change once the stamp moves
+    for key, cached in list(site_cache.items()):
+        if key not in LOCATION_FIELDS and (not doctype or doctype in cached[0]):
+            del site_cache[key]
+
+
+def get_rows(doctype):
+    """Return all rows of a location doctype, ordered by name."""
+    return _get_entry(doctype)["rows"]
+
+
+def get_children(doctype, parent=None):
+    """Return rows of `doctype` directly below the `parent` code, ordered by name.
+
+    `parent` must be a code of the level right above `doctype`. Without
+    `parent` every row of the doctype is returned.
+    """
+    validate_parent(doctype, parent)
+    if use_shared_cache():
+        return _get_shared_children(doctype, parent)
+
+    entry = _get_entry(doctype)
+    if parent is None:
+        return list(entry["rows"])
+
+    children = entry["children"]
+    if parent in children:
+        return list(children[parent])
+
+    lo, hi = code_range(entry["codes"], parent, CODE_LENGTHS[doctype])
+    rows = sorted(entry["by_code"][lo:hi], key=lambda row: entry["rank"][row.name])
+    # Only real parents are kept, so unknown codes cannot grow the cache
+    if rows:
+        children[parent] = rows
+    return list(rows)
+
+
+def validate_parent(doctype, parent):
+    """Throw unless `parent` is empty or a code of the level right above `doctype`."""
+    if not parent:
+        return
+    parent_doctype = PARENT_DOCTYPES.get(doctype)
+    if not parent_doctype or not parent.isdigit() or len(parent) != CODE_LENGTHS[parent_doctype]:
+        frappe.throw(
+            _("Parent of a {0} must be a {1} digit {2} code").format(
+                _(doctype), CODE_LENGTHS.get(parent_doctype), _(parent_doctype or "")
+            )
+        )
+
+
+def get_page(doctype, parent=None, after=None, limit=100):
+    """Return up to `limit` rows of `doctype` directly below `parent`, ordered by code.
+
+    Keyset pagination: only rows with a code greater than `after` are
+    returned. The second value tells whether more rows follow.
+    """
+    validate_parent(doctype, parent)
+    if use_shared_cache():
+        return _load_page(doctype, parent, after, limit)
+
+    entry = _get_entry(doctype)
+    lo, hi = code_range(entry["codes"], parent, CODE_LENGTHS[doctype])
+    if after:
+        if not after.isdigit():
+            return [], False
+        lo = max(lo, bisect_right(entry["codes"], int(after)))
+    return list(entry["by_code"][lo : min(lo + limit, hi)]), lo + limit < hi
+
+
+def get_code_names(doctype):
+    """Return (code, name) pairs of every location of `doctype`, ordered by code.
+
+    Read straight from the mapped snapshot when it matches the table, so that
+    indexes built from them do not need the cached rows.
+    """
+    snapshot = get_adopted_snapshot(doctype)
+    if snapshot:
+        return [(code, name) for code, name, _parent in snapshot.iter_locations(doctype)]
+    name_field, code_field = LOCATION_FIELDS[doctype][1], LOCATION_FIELDS[doctype][2]
+    return [(row[code_field], row[name_field]) for row in _get_entry(doctype)["by_code"]]
+
+
+def get_code_set(doctype):
+    """Return the set of codes of a location doctype, for O(1) existence checks."""
+    return get_derived(
+        f"code_set:{doctype}",
+        lambda: frozenset(code for code, _name in get_code_names(doctype)),
+        doctypes=[doctype],
+    )
+
+
+def location_exists(doctype, code):
+    """Check whether a location code exists, without loading its table in shared mode."""
+    if use_shared_cache():
+        return get_location_name(doctype, code) is not None
+    return code in get_code_set(doctype)
+
+
+def get_derived(key, build, doctypes=None):
+    """Return `build()`, memoized per worker until any of `doctypes` changes.
+
+    Used for structures computed from the tables, such as search indexes. By
+    default they depend on all four location doctypes.
+    """
+    site_cache = _get_site_cache()
+    doctypes = tuple(doctypes or LOCATION_FIELDS)
+    versions = tuple(get_version(doctype) for doctype in doctypes)
+    cached = site_cache.get(key)
+    if cached is None or cached[1] != versions:
+        # The doctypes are kept so that an edit only drops what depends on it
+        cached = (doctypes, versions, build())
+        site_cache[key] = cached
+    return cached[2]
+
+
+def _get_site():
+    return getattr(frappe.local, "site", None)
+
+
+def _get_site_cache():
+    return _local_cache.setdefault(_get_site(), {})
+
+
+def _get_entry(doctype):
+    site_cache = _get_site_cache()
+    version = get_version(doctype)
+    entry = site_cache.get(doctype)
+    if entry is None or entry["version"] != version:
+        rows = _load_rows(doctype)
+        code_field = LOCATION_FIELDS[doctype][2]
+        by_code = sorted(rows, key=lambda row: row[code_field])
+        entry = {
+            "version": version,
+            "rows": rows,
+            "rank": {row.name: i for i, row in enumerate(rows)},
+            "by_code": by_code,
+            "codes": array("Q", (int(row[code_field]) for row in by_code)),
+            "children": {},
+        }
+        site_cache[doctype] = entry
+    return entry
+
+
+def _load_rows(doctype):
+    name_field = LOCATION_FIELDS[doctype][1]
+    snapshot = get_adopted_snapshot(doctype)
+    if snapshot:
+        fields = LOCATION_FIELDS[doctype]
+        rows = [
+            # name, name field, code field, then the parent links from the closest up
+            frappe._dict(zip(fields, (code, name, code, *reversed(ancestor_codes(code))), strict=True))
+            for code, name, _parent in snapshot.iter_locations(doctype)
+        ]
+        rows.sort(key=lambda row: row[name_field])
+        return rows
+    return frappe.get_all(
+        doctype,
+        fields=LOCATION_FIELDS[doctype],
+        order_by=f"{name_field} asc",
+    )
+
+
+# ===============================================
+# SNAPSHOT BACKEND
+# ===============================================
+
+
+def adopt_snapshot():
+    """Let workers read the location tables that match the data snapshot from it.
+
+    Each table is compared with the snapshot row by row. A match is recorded
+    with the table's current version stamp, so it holds until the next edit or
+    import bumps the stamp. Returns the doctypes adopted.
+    """
+    snapshot = find_snapshot(get_data_path())
+    adopted = []
+    for doctype in LOCATION_FIELDS:
+        key = f"{SNAPSHOT_KEY}:{doctype}"
+        if snapshot and _read_locations(doctype) == list(snapshot.iter_locations(doctype)):
+            frappe.cache().set_value(key, _get_snapshot_stamp(snapshot, get_version(doctype)))
+            adopted.append(doctype)
+        else:
+            frappe.cache().delete_value(key)
+    return adopted
+
+
+def get_adopted_snapshot(doctype):
+    """Return the data snapshot if it was found to hold exactly the rows of `doctype`, else None."""
+    pending = getattr(frappe.local, "indo_geo_pending_bumps", None) or set()
+    if doctype in pending or None in pending:
+        # This transaction changed the table, the snapshot lacks its changes
+        return None
+    snapshot = find_snapshot(get_data_path())
+    if not snapshot:
+        return None
+    stamp = frappe.cache().get_value(f"{SNAPSHOT_KEY}:{doctype}")
+    if stamp != _get_snapshot_stamp(snapshot, get_version(doctype)):
+        return None
+    return snapshot
+
+
+def _get_snapshot_stamp(snapshot, version):
+    stat = os.stat(snapshot.file_path)
+    return f"{version}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _read_locations(doctype):
+    """Return (code, name, parent_code) of every row of a table, ordered by code."""
+    fields = LOCATION_FIELDS[doctype]
+    code_field, name_field = fields[2], fields[1]
+    parent_field = PARENT_DOCTYPES[doctype].lower() if doctype in PARENT_DOCTYPES else None
+    rows = frappe.get_all(
+        doctype,
+        fields=[code_field, name_field, *([parent_field] if parent_field else [])],
+        order_by=f"{code_field} asc",
+        as_list=True,
+    )
+    return [(row[0], row[1], row[2] if parent_field else None) for row in rows]
+
+
+# ===============================================
+# SHARED REDIS BACKEND
+# ===============================================
+
+
+def use_shared_cache():
+    """Check whether this site keeps the location cache in Redis for all workers."""
+    return frappe.conf.get("indo_geo_cache_backend") == "redis"
+
+
+def get_location_name(doctype, code):
+    """Return the name of a location from the shared code -> name hash, or None."""
+    name_field, code_field = LOCATION_FIELDS[doctype][1], LOCATION_FIELDS[doctype][2]
+    return _get_shared(
+        SHARED_NAMES_KEY,
+        doctype,
+        code,
+        lambda: frappe.db.get_value(doctype, {code_field: code}, name_field),
+    )
+
+
+def _get_shared_children(doctype, parent=None):
+    fields = LOCATION_FIELDS[doctype]
+    rows = _get_shared(SHARED_CHILDREN_KEY, doctype, parent or "", lambda: _load_children(doctype, parent))
+    return [frappe._dict(zip(fields, row, strict=True)) for row in rows]
+
+
+def _get_shared(key_prefix, doctype, field, generator):
+    """Read one field of a versioned Redis hash through this worker's LRU.
+
+    A miss in the LRU costs a single HGET. A miss in Redis runs `generator`
+    and stores its result for every other worker, unless it is empty: codes
+    that match nothing are not stored, so they cannot grow the cache.
+    """
+    version = _get_shared_version(doctype)
+    lru_key = (_get_site(), key_prefix, doctype, version, field)
+    if lru_key in _shared_lru:
+        _shared_lru.move_to_end(lru_key)
+        return _shared_lru[lru_key]
+
+    key = f"{key_prefix}:{doctype}:{version}"
+    value = frappe.cache().hget(key, field)
+    if value is None:
+        value = generator()
+        if not value:
+            return value
+        frappe.cache().hset(key, field, value)
+    _shared_lru[lru_key] = value
+    while len(_shared_lru) > (frappe.conf.get("indo_geo_cache_lru_size") or SHARED_LRU_SIZE):
+        _shared_lru.popitem(last=False)
+    return value
+
+
+def _get_shared_version(doctype):
+    """Return the version stamp of a doctype, re-read from Redis every few seconds."""
+    key = (_get_site(), doctype)
+    cached = _shared_versions.get(key)
+    now = time.monotonic()
+    if cached is None or cached[0] < now:
+        cached = (now + SHARED_VERSION_TTL, get_version(doctype))
+        _shared_versions[key] = cached
+    return cached[1]
+
+
+def _load_children(doctype, parent=None):
+    fields = LOCATION_FIELDS[doctype]
+    # Direct children are one range of the (parent, name) composite index
+    filters = {PARENT_DOCTYPES[doctype].lower(): parent} if parent else {}
+    rows = frappe.get_all(doctype, fields=fields, filters=filters, order_by=f"{fields[1]} asc", as_list=True)
+    return [tuple(row) for row in rows]
+
+
+def _load_page(doctype, parent, after, limit):
+    fields = LOCATION_FIELDS[doctype]
+    code_field = fields[2]
+    if parent and not parent.isdigit():
+        return [], False
+    filters = [[code_field, "like", f"{parent}%"]] if parent else []
+    if after:
+        filters.append([code_field, ">", after])
+    rows = frappe.get_all(doctype, fields=fields, filters=filters, order_by=f"{code_field} asc", limit=limit + 1)
+    return rows[:limit], len(rows) > limit
@@ -0,0 +1,230 @@
+"""Table layout of the location doctypes and readers for the shipped CSV files.
+
+The import engines write rows straight into the `tab*` tables, so the columns
+Frappe would normally fill in (name, timestamps, owner) and the parent Link
+columns are derived here, parents by slicing the Kemendagri code.
+
+Data files (the CSV files and the SQL dumps) may be shipped gzip compressed,
+as `villages.csv.gz`, or zstd compressed when the optional `zstandard` package
+is installed. `find_data_file` finds whichever variant exists and
+`open_data_file` decompresses it as a stream.
+"""
+
+import csv
+import gzip
+import hashlib
+import os
+
+import frappe
+from frappe import _
+from frappe.utils import now_datetime
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from indo_geo.indo_geo.utils.code_index import ancestor_codes
+from indo_geo.indo_geo.utils.snapshot import SNAPSHOT_FILE, SOURCE_DIGEST_SIZE, get_snapshot
+
+STANDARD_COLUMNS = ["name", "creation", "modified", "modified_by", "owner", "docstatus", "idx"]
+
+# Columns written for each doctype, in insert order
+TABLE_COLUMNS = {
+    "Province": [*STANDARD_COLUMNS, "province_code", "province_name"],
+    "Regency": [*STANDARD_COLUMNS, "regency_code", "regency_name", "province", "province_code"],
+    "District": [*STANDARD_COLUMNS, "district_code", "district_name", "regency", "province", "regency_code"],
+    "Village": [*STANDARD_COLUMNS, "village_code", "village_name", "district", "regency", "province"],
+}
+
+CSV_FILES = {
+    "Province": "provinces.csv",
+    "Regency": "regencies.csv",
+    "District": "districts.csv",
+    "Village": "villages.csv",
+}
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+# File suffix of each supported compression
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+# gzip level 6 compresses the data nearly as well as 9 in a fraction of the time
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 19
+
+# Bytes read at a time when hashing the CSV files
+DIGEST_BLOCK_SIZE = 1024 * 1024
+
+# {((path, mtime_ns, size), ...): digest}
+_source_digests = {}
+
+
+def get_data_path():
+    """Return the path of the app's `data` directory."""
+    return os.path.join(frappe.get_app_path("indo_geo"), "..", "data")
+
+
+def find_data_file(file_path):
+    """Return the path of `file_path` as shipped: plain, gzip or zstd compressed.
+
+    The plain file wins when several exist. zstd files are only considered
+    when `zstandard` is installed. When none exists `file_path` itself is
+    returned, so that callers report the file they expected.
+    """
+    if os.path.exists(file_path):
+        return file_path
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if compression == "zstd" and not zstandard:
+            continue
+        if os.path.exists(file_path + suffix):
+            return file_path + suffix
+    return file_path
+
+
+def get_compressed_path(file_path, compression=None):
+    """Return the path `file_path` is written to with `compression` (None, "gzip" or "zstd")."""
+    if not compression:
+        return file_path
+    if compression not in COMPRESSION_SUFFIXES:
+        frappe.throw(
+            _("Unknown compression {0}, expected one of {1}").format(
+                compression, ", ".join(COMPRESSION_SUFFIXES)
+            )
+        )
+    if compression == "zstd" and not zstandard:
+        frappe.throw(_("zstd compression needs the zstandard package"))
+    return file_path + COMPRESSION_SUFFIXES[compression]
+
+
+def remove_other_variants(file_path):
+    """Delete the plain and compressed variants of a data file other than `file_path`.
+
+    Called after writing a data file: `find_data_file` prefers the plain
+    file, so a stale plain file left next to a new compressed one would
+    otherwise be imported instead.
+    """
+    base_path = file_path
+    for suffix in COMPRESSION_SUFFIXES.values():
+        base_path = base_path.removesuffix(suffix)
+    for path in (base_path, *(base_path + suffix for suffix in COMPRESSION_SUFFIXES.values())):
+        if path != file_path and os.path.exists(path):
+            os.remove(path)
+
+
+def open_data_file(file_path, mode="r", buffering=-1):
+    """Open a data file, compressing or decompressing it by its suffix.
+
+    Compressed files are decompressed (or compressed) as a stream, one block
+    at a time, so they are never held in memory whole. Text modes use UTF-8,
+    and `buffering` only applies to plain files.
+    """
+    encoding = None
+    if "b" not in mode:
+        # gzip and zstandard open files in binary mode unless told otherwise
+        mode, encoding = mode.replace("t", "") + "t", "utf-8"
+    if file_path.endswith(COMPRESSION_SUFFIXES["gzip"]):
+        return gzip.open(file_path, mode, compresslevel=GZIP_LEVEL, encoding=encoding)
+    if file_path.endswith(COMPRESSION_SUFFIXES["zstd"]):
+        if not zstandard:
+            frappe.throw(_("Opening {0} needs the zstandard package").format(file_path))
+        return zstandard.open(
+            file_path, mode, cctx=zstandard.ZstdCompressor(level=ZSTD_LEVEL), encoding=encoding
+        )
+    return open(file_path, mode, buffering=buffering, encoding=encoding)
+
+
+def iter_csv_locations(data_path, doctype):
+    """Yield (code, name, parent_code) for every row of a doctype's CSV file.
+
+    Handles both the shipped 2-column format (code, name), where the parent is
+    derived from the code, and the 3-column format (code, name, parent_code)
+    used by test data. Provinces have no parent. The file may be compressed.
+    """
+    file_path = find_data_file(os.path.join(data_path, CSV_FILES[doctype]))
+    with open_data_file(file_path) as csvfile:
+        for row in csv.reader(csvfile):
+            if len(row) == 2:
+                code, name = row[0].strip(), row[1].strip()
+                ancestors = ancestor_codes(code)
+                parent = ancestors[-1] if ancestors else None
+            elif len(row) == 3 and doctype != "Province":
+                code, name, parent = row[0].strip(), row[1].strip(), row[2].strip()
+            else:
+                continue
+            yield code, name, parent
+
+
+def get_source_digest(data_path):
+    """Return a digest of the decompressed CSV files in `data_path`.
+
+    Snapshots record the digest of the CSV files they were built from, see
+    `find_snapshot`. It is only recomputed when one of the files changes.
+    """
+    stats = []
+    for name in CSV_FILES.values():
+        file_path = find_data_file(os.path.join(data_path, name))
+        if os.path.exists(file_path):
+            stat = os.stat(file_path)
+            stats.append((file_path, stat.st_mtime_ns, stat.st_size))
+    stats = tuple(stats)
+    if stats not in _source_digests:
+        digest = hashlib.blake2b(digest_size=SOURCE_DIGEST_SIZE)
+        for file_path, _mtime, _size in stats:
+            digest.update(os.path.basename(file_path).encode("utf-8"))
+            with open_data_file(file_path, "rb") as f:
+                while block := f.read(DIGEST_BLOCK_SIZE):
+                    digest.update(block)
+        _source_digests[stats] = digest.digest()
+    return _source_digests[stats]
+
+
+def find_snapshot(data_path):
+    """Return the binary snapshot in `data_path`, or None if there is none usable.
+
+    A snapshot is only used while the CSV files next to it are the ones it was
+    built from, so one left behind after the CSV files were updated does not
+    shadow them. Snapshots of an older format are ignored as well.
+    """
+    snapshot_path = os.path.join(data_path, SNAPSHOT_FILE)
+    if not os.path.exists(snapshot_path):
+        return None
+    try:
+        snapshot = get_snapshot(snapshot_path)
+    except ValueError:
+        return None
+    if snapshot.source_digest != get_source_digest(data_path):
+        return None
+    return snapshot
+
+
+def iter_locations(data_path, doctype):
+    """Yield (code, name, parent_code) for a doctype from the best available source.
+
+    A binary snapshot in `data_path` built from the current CSV files is read
+    through mmap; otherwise the doctype's CSV file is parsed.
+    """
+    snapshot = find_snapshot(data_path)
+    if snapshot:
+        yield from snapshot.iter_locations(doctype)
+    else:
+        yield from iter_csv_locations(data_path, doctype)
+
+
+def build_row(doctype, code, name, parent, timestamp, owner="Administrator"):
+    """Return the values of one location row in TABLE_COLUMNS order."""
+    row = [code, timestamp, timestamp, owner, owner, 0, 0, code, name]
+    if doctype == "Regency":
+        row += [parent, parent]
+    elif doctype == "District":
+        row += [parent, *ancestor_codes(parent)[-1:], parent]
+    elif doctype == "Village":
+        row += [parent, *reversed(ancestor_codes(parent))]
+    return tuple(row)
+
+
+def iter_location_rows(data_path, doctype, timestamp=None):
+    """Yield full table rows for a doctype, built from its snapshot or CSV file."""
+    timestamp = timestamp or now_datetime().strftime(TIMESTAMP_FORMAT)
+    for code, name, parent in iter_locations(data_path, doctype):
+        yield build_row(doctype, code, name, parent, timestamp)
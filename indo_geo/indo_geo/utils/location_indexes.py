@@ -0,0 +1,95 @@
+"""Composite indexes serving the children-of-a-parent queries of the location API.
+
+Each index leads with the parent Link column and continues with the name
+column, so "children of X ordered by name" is a single index range read with
+no filesort. The indexes are added from each doctype's `on_doctype_update`
+only once its table holds data, and explicitly at the end of every bulk
+import, so imports never maintain them row by row.
+"""
+
+import time
+
+import frappe
+
+# Composite indexes of each doctype, as column lists
+LOCATION_INDEXES = {
+    "Regency": [["province", "regency_name"]],
+    "District": [["regency", "district_name"]],
+    "Village": [["district", "village_name"]],
+}
+
+# Runs per query when timing it in the benchmark
+BENCHMARK_RUNS = 50
+
+
+def get_index_name(columns):
+    return "_".join(columns) + "_index"
+
+
+def add_location_indexes(doctype=None, only_if_populated=False):
+    """Create the missing composite indexes of one location doctype, or of all of them.
+
+    With `only_if_populated`, empty tables are skipped: their indexes are
+    created by the bulk import once the rows are in.
+    """
+    for dt in [doctype] if doctype else LOCATION_INDEXES:
+        if only_if_populated and not frappe.db.sql(f"SELECT 1 FROM `tab{dt}` LIMIT 1"):
+            continue
+        for columns in LOCATION_INDEXES.get(dt, ()):
+            frappe.db.add_index(dt, columns, get_index_name(columns))
+
+
+def drop_location_indexes(doctype=None):
+    """Drop the composite indexes of one location doctype, or of all of them."""
+    for dt in [doctype] if doctype else LOCATION_INDEXES:
+        for columns in LOCATION_INDEXES.get(dt, ()):
+            index_name = get_index_name(columns)
+            if frappe.db.has_index(f"tab{dt}", index_name):
+                frappe.db.sql_ddl(f"ALTER TABLE `tab{dt}` DROP INDEX `{index_name}`")
+
+
+def benchmark_location_indexes():
+    """Compare the query plan and speed of the children queries without and with the indexes."""
+    print("Benchmarking composite location indexes...")
+    results = {}
+    for doctype, indexes in LOCATION_INDEXES.items():
+        for parent_field, name_field in indexes:
+            parent = frappe.db.sql(
+                f"""SELECT `{parent_field}` FROM `tab{doctype}`
+                GROUP BY `{parent_field}` ORDER BY COUNT(*) DESC LIMIT 1"""
+            )
+            if not parent:
+                print(f"No {doctype} records, skipping")
+                continue
+            query = (
+                f"SELECT `name`, `{name_field}` FROM `tab{doctype}` "
+                f"WHERE `{parent_field}` = %s ORDER BY `{name_field}`"
+            )
+
+            drop_location_indexes(doctype)
+            before = _measure(query, parent[0][0])
+            add_location_indexes(doctype)
+            after = _measure(query, parent[0][0])
+
+            results[doctype] = {"before": before, "after": after}
+            print(f"\n{doctype} children of {parent[0][0]}:")
+            for label, measured in (("without index", before), ("with index", after)):
+                print(
+                    f"  {label}: {measured['ms']:.3f} ms, type={measured['type']}, key={measured['key']}, "
+                    f"rows={measured['rows']}, extra={measured['extra']}"
+                )
+    return results
+
+
+def _measure(query, parent):
+    plan = frappe.db.sql(f"EXPLAIN {query}", parent, as_dict=True)[0]
+    start_time = time.perf_counter()
+    for _run in range(BENCHMARK_RUNS):
+        frappe.db.sql(query, parent)
+    return {
+        "ms": (time.perf_counter() - start_time) * 1000 / BENCHMARK_RUNS,
+        "type": plan.get("type"),
+        "key": plan.get("key"),
+        "rows": plan.get("rows"),
+        "extra": plan.get("Extra"),
+    }
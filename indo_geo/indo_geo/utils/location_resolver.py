@@ -0,0 +1,68 @@
+"""Bulk resolution of location codes to their names and hierarchy.
+
+Meant for pipelines validating many addresses at once: every code of every
+level goes into one dict, so resolving a code costs a handful of dict lookups
+(the code and its ancestors, found by slicing) and no queries.
+"""
+
+from indo_geo.indo_geo.utils.code_index import LEVELS, get_level
+from indo_geo.indo_geo.utils.location_cache import LOCATION_FIELDS, get_code_names, get_derived
+
+
+class LocationResolver:
+    def __init__(self, locations):
+        """`locations` maps each doctype to an iterable of (code, name) pairs."""
+        self._names = {}
+        for doctype, _length in LEVELS:
+            self._names.update(locations.get(doctype, ()))
+
+    def __len__(self):
+        return len(self._names)
+
+    def resolve(self, code):
+        """Return the name path and parent codes of one code.
+
+        A code is valid when it and all of its ancestors exist. Parent codes
+        are derived from the code even when they do not exist, and `path` holds
+        the names of those that do, from the province down to the code itself.
+        """
+        code = str(code or "").strip()
+        doctype = get_level(code)
+        result = {"code": code, "valid": False, "doctype": doctype, "name": None, "path": []}
+        if not doctype:
+            return result
+
+        names = self._names
+        valid = True
+        for ancestor_doctype, length in LEVELS:
+            if length >= len(code):
+                break
+            ancestor = code[:length]
+            result[ancestor_doctype.lower()] = ancestor
+            if ancestor in names:
+                result["path"].append(names[ancestor])
+            else:
+                valid = False
+
+        name = names.get(code)
+        if name is not None:
+            result["name"] = name
+            result["path"].append(name)
+        result["valid"] = valid and name is not None
+        return result
+
+    def resolve_many(self, codes):
+        """Resolve every code of `codes`, in order."""
+        resolve = self.resolve
+        return [resolve(code) for code in codes]
+
+
+def build_resolver():
+    """Build a resolver from the codes and names of the four location doctypes."""
+    locations = {doctype: get_code_names(doctype) for doctype in LOCATION_FIELDS}
+    return LocationResolver(locations)
+
+
+def resolve_codes(codes):
+    """Resolve a list of codes at any level using this worker's cached resolver."""
+    return get_derived("resolver", build_resolver).resolve_many(codes)
@@ -0,0 +1,320 @@
+"""In-memory typeahead index over the names of all locations.
+
+Every location gets an integer id, assigned in (level, code) order so that the
+descendants of any code occupy one contiguous id range per level. On top of
+that the index keeps:
+
+- per level, the normalised full names sorted alphabetically, so a name prefix
+  is a bisect range scan (a flattened prefix trie);
+- per level, every word of every name sorted alphabetically, for word-prefix
+  matches such as "barat" -> "KABUPATEN BANDUNG BARAT";
+- a trigram inverted index for infix and misspelled queries.
+
+Hits are ranked by match tier (exact name, name prefix, word prefix, trigram),
+then by level (provinces first), then alphabetically.
+"""
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+
+from indo_geo.indo_geo.utils.code_index import CODE_LENGTHS, LEVELS, ancestor_codes, code_range
+from indo_geo.indo_geo.utils.location_cache import LOCATION_FIELDS, get_code_names, get_derived
+
+MAX_LIMIT = 100
+
+# Share of the query trigrams a name must contain to count as a fuzzy hit
+TRIGRAM_THRESHOLD = 0.6
+
+# Above this many locations below `parent`, fuzzy matches come from the trigram index
+PARENT_SCAN_LIMIT = 2000
+
+# Names sharing the most rare trigrams with the query that get scored exactly
+TRIGRAM_CANDIDATES = 64
+
+_NON_ALNUM = re.compile(r"[^0-9A-Z]+")
+
+
+def normalize(text):
+    """Uppercase `text` and collapse everything but letters and digits to single spaces."""
+    return _NON_ALNUM.sub(" ", (text or "").upper()).strip()
+
+
+def trigrams(text):
+    """Return the set of trigrams of a normalised string, words padded with spaces."""
+    padded = f" {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _prefix_range(keys, prefix):
+    lo = bisect_left(keys, prefix)
+    return lo, bisect_left(keys, prefix + "￿", lo)
+
+
+class LocationSearchIndex:
+    def __init__(self, locations):
+        """`locations` maps each doctype to an iterable of (code, name) pairs."""
+        self.doctypes = []
+        self.codes = []
+        self.names = []
+        self.normalized = []
+        self.level_ranks = []
+        self._by_code = {}
+        self._level_ids = {}
+        self._level_codes = {}
+        self._names_by_level = {}
+        self._words_by_level = {}
+        postings = {}
+
+        for rank, (doctype, _length) in enumerate(LEVELS):
+            start = len(self.codes)
+            full_names = []
+            words = []
+            for code, name in sorted(locations.get(doctype, ())):
+                entry_id = len(self.codes)
+                normalized = normalize(name)
+                self.doctypes.append(doctype)
+                self.codes.append(code)
+                self.names.append(name)
+                self.normalized.append(normalized)
+                self.level_ranks.append(rank)
+                self._by_code[code] = entry_id
+                full_names.append((normalized, entry_id))
+                words.extend((word, entry_id) for word in set(normalized.split()))
+                for trigram in trigrams(normalized):
+                    postings.setdefault(trigram, array("I")).append(entry_id)
+
+            self._level_ids[doctype] = (start, len(self.codes))
+            self._level_codes[doctype] = array("Q", (int(code) for code in self.codes[start:]))
+            full_names.sort()
+            words.sort()
+            self._names_by_level[doctype] = (
+                [key for key, _entry_id in full_names],
+                array("I", (entry_id for _key, entry_id in full_names)),
+            )
+            self._words_by_level[doctype] = (
+                [key for key, _entry_id in words],
+                array("I", (entry_id for _key, entry_id in words)),
+            )
+
+        self._trigrams = postings
+
+    def __len__(self):
+        return len(self.codes)
+
+    def search(self, query, level=None, parent=None, limit=20):
+        """Return up to `limit` ranked hits for `query`.
+
+        `level` restricts hits to one doctype and `parent` to locations below
+        that code.
+        """
+        limit = max(1, min(int(limit or 20), MAX_LIMIT))
+        normalized = normalize(query)
+        if not normalized:
+            return []
+
+        doctypes = [doctype for doctype, _length in LEVELS if not level or doctype == level]
+        if parent:
+            doctypes = [doctype for doctype in doctypes if len(parent) < CODE_LENGTHS[doctype]]
+
+        if normalized.isdigit():
+            ids = self._search_code(normalized, doctypes, parent, limit)
+        elif parent and self._prefer_scan(normalized, doctypes, parent, limit):
+            ids = self._scan_below(normalized, doctypes, parent, limit)
+        else:
+            ids = self._search_name(normalized, doctypes, parent, limit)
+
+        return [self.get_hit(entry_id) for entry_id in ids]
+
+    def get_hit(self, entry_id):
+        """Return the public representation of a location, with its hierarchy path."""
+        code = self.codes[entry_id]
+        ancestors = [self._by_code[ancestor] for ancestor in ancestor_codes(code) if ancestor in self._by_code]
+        hit = {
+            "doctype": self.doctypes[entry_id],
+            "code": code,
+            "name": self.names[entry_id],
+            "path": [self.names[ancestor_id] for ancestor_id in ancestors] + [self.names[entry_id]],
+        }
+        for ancestor_id in ancestors:
+            hit[self.doctypes[ancestor_id].lower()] = self.codes[ancestor_id]
+        return hit
+
+    def _ids_below(self, parent, doctype):
+        start, _end = self._level_ids[doctype]
+        lo, hi = code_range(self._level_codes[doctype], parent, CODE_LENGTHS[doctype])
+        return range(start + lo, start + hi)
+
+    def _count_below(self, parent, doctypes):
+        return sum(len(self._ids_below(parent, doctype)) for doctype in doctypes)
+
+    def _is_below(self, entry_id, parent):
+        return not parent or (self.codes[entry_id].startswith(parent) and self.codes[entry_id] != parent)
+
+    def _search_code(self, query, doctypes, parent, limit):
+        hits = []
+        for doctype in doctypes:
+            if len(query) == CODE_LENGTHS[doctype]:
+                ids = [self._by_code[query]] if query in self._by_code else []
+            elif len(query) < CODE_LENGTHS[doctype]:
+                ids = self._ids_below(query, doctype)
+            else:
+                continue
+            for entry_id in ids:
+                if self._is_below(entry_id, parent):
+                    hits.append(entry_id)
+                    if len(hits) >= limit:
+                        return hits
+        return hits
+
+    def _prefer_scan(self, query, doctypes, parent, limit):
+        """Whether scanning everything below `parent` beats filtering the global index.
+
+        Filtering stops after `limit` hits, so its expected cost is the number of
+        matches it has to skip to find them, capped by the number of matches.
+        """
+        below = self._count_below(parent, doctypes)
+        if not below:
+            return True
+        total = sum(len(self._level_codes[doctype]) for doctype in doctypes)
+        word_ranges = self._anchor_ranges(query.split(), doctypes)
+        matches = sum(hi - lo for lo, hi in word_ranges)
+        for doctype in doctypes:
+            lo, hi = _prefix_range(self._names_by_level[doctype][0], query)
+            matches += hi - lo
+        return below < min(matches, limit * total / below)
+
+    def _anchor_ranges(self, query_words, doctypes):
+        """Return the range of name words each level holds for the rarest query word.
+
+        Word-prefix matches are found by scanning the names having one query
+        word and checking the others, so the word prefixing the fewest name
+        words is the cheapest to scan: in "kab s" or "s x" that is never "s".
+        """
+        best = None
+        for word in dict.fromkeys(query_words):
+            ranges = [_prefix_range(self._words_by_level[doctype][0], word) for doctype in doctypes]
+            size = sum(hi - lo for lo, hi in ranges)
+            if best is None or size < best[0]:
+                best = (size, ranges)
+        return best[1]
+
+    def _scan_below(self, query, doctypes, parent, limit):
+        query_words = query.split()
+        scored = []
+        for doctype in doctypes:
+            for entry_id in self._ids_below(parent, doctype):
+                tier = self._tier(self.normalized[entry_id], query, query_words)
+                if tier is not None:
+                    scored.append((tier, self.level_ranks[entry_id], self.normalized[entry_id], entry_id))
+        scored.sort()
+        ids = [entry_id for *_key, entry_id in scored[:limit]]
+        if not ids and len(query) >= 3:
+            ids = self._scan_trigrams_below(query, doctypes, parent)[:limit]
+        return ids
+
+    def _tier(self, name, query, query_words):
+        if name == query:
+            return 0
+        if name.startswith(query):
+            return 1
+        if self._words_match(name, query_words):
+            return 2
+        return None
+
+    def _scan_trigrams_below(self, query, doctypes, parent):
+        query_trigrams = trigrams(query)
+        scored = []
+        for doctype in doctypes:
+            for entry_id in self._ids_below(parent, doctype):
+                score = self._trigram_score(self.normalized[entry_id], query_trigrams)
+                if score >= TRIGRAM_THRESHOLD:
+                    scored.append((-score, self.level_ranks[entry_id], self.normalized[entry_id], entry_id))
+        scored.sort()
+        return [entry_id for *_key, entry_id in scored]
+
+    def _words_match(self, name, query_words):
+        padded = f" {name}"
+        return all(f" {query_word}" in padded for query_word in query_words)
+
+    def _trigram_score(self, name, query_trigrams):
+        padded = f" {name} "
+        return len([trigram for trigram in query_trigrams if trigram in padded]) / len(query_trigrams)
+
+    def _search_name(self, query, doctypes, parent, limit):
+        hits = []
+        seen = set()
+
+        def collect(entry_id):
+            if entry_id not in seen and self._is_below(entry_id, parent):
+                seen.add(entry_id)
+                hits.append(entry_id)
+            return len(hits) >= limit
+
+        # Exact and full-name prefix matches, alphabetical within each level
+        for doctype in doctypes:
+            keys, ids = self._names_by_level[doctype]
+            lo = bisect_left(keys, query)
+            for i in range(lo, bisect_right(keys, query, lo)):
+                if collect(ids[i]):
+                    return hits
+        for doctype in doctypes:
+            keys, ids = self._names_by_level[doctype]
+            lo, hi = _prefix_range(keys, query)
+            for i in range(lo, hi):
+                if collect(ids[i]):
+                    return hits
+
+        # Every query word is a prefix of some word of the name
+        query_words = query.split()
+        word_ranges = self._anchor_ranges(query_words, doctypes)
+        for doctype, (lo, hi) in zip(doctypes, word_ranges, strict=True):
+            ids = self._words_by_level[doctype][1]
+            for i in range(lo, hi):
+                entry_id = ids[i]
+                if entry_id not in seen and self._words_match(self.normalized[entry_id], query_words):
+                    if collect(entry_id):
+                        return hits
+
+        # Fuzzy matches only when nothing matched literally
+        if not hits and len(query) >= 3:
+            if parent and self._count_below(parent, doctypes) <= PARENT_SCAN_LIMIT:
+                fuzzy = self._scan_trigrams_below(query, doctypes, parent)
+            else:
+                fuzzy = self._search_trigrams(query, doctypes, seen)
+            for entry_id in fuzzy:
+                if collect(entry_id):
+                    return hits
+        return hits
+
+    def _search_trigrams(self, query, doctypes, seen):
+        query_trigrams = trigrams(query)
+        required = max(1, int(len(query_trigrams) * TRIGRAM_THRESHOLD + 0.999))
+        # A name sharing `required` trigrams must share one of the rarest n - required + 1
+        rarest = sorted(query_trigrams, key=lambda trigram: len(self._trigrams.get(trigram, ())))
+        candidates = Counter()
+        for trigram in rarest[: len(query_trigrams) - required + 1]:
+            candidates.update(self._trigrams.get(trigram, ()))
+
+        allowed = {rank for rank, (doctype, _length) in enumerate(LEVELS) if doctype in doctypes}
+        scored = []
+        for entry_id, _count in candidates.most_common(TRIGRAM_CANDIDATES):
+            if entry_id in seen or self.level_ranks[entry_id] not in allowed:
+                continue
+            score = self._trigram_score(self.normalized[entry_id], query_trigrams)
+            if score >= TRIGRAM_THRESHOLD:
+                scored.append((-score, self.level_ranks[entry_id], self.normalized[entry_id], entry_id))
+        scored.sort()
+        return [entry_id for *_key, entry_id in scored]
+
+
+def build_search_index():
+    """Build a search index from the codes and names of the four location doctypes."""
+    locations = {doctype: get_code_names(doctype) for doctype in LOCATION_FIELDS}
+    return LocationSearchIndex(locations)
+
+
+def search_locations(query, level=None, parent=None, limit=20):
+    """Search all location names using this worker's cached search index."""
+    return get_derived("search_index", build_search_index).search(query, level=level, parent=parent, limit=limit)
@@ -0,0 +1,77 @@
+"""Hierarchy checks shared by the location doctype controllers and the importers.
+
+A location code must have the exact length of its level, and the parent it
+links to must be the code's own prefix and must exist. Existence is checked
+through the location cache (see `location_exists`), so validating a row never
+loads the parent document.
+"""
+
+import frappe
+from frappe import _
+
+from indo_geo.indo_geo.utils.code_index import CODE_LENGTHS, PARENT_DOCTYPES, parent_code
+from indo_geo.indo_geo.utils.location_cache import LOCATION_FIELDS, get_code_set, location_exists
+
+# Link field of each doctype pointing at its direct parent
+PARENT_FIELDS = {doctype: parent_doctype.lower() for doctype, parent_doctype in PARENT_DOCTYPES.items()}
+
+
+def check_location(doctype, code, parent=None, parent_codes=None):
+    """Return the first problem with a location code and its parent link, or None.
+
+    `parent_codes` is the set of existing parent codes. Without it the parent
+    is looked up in the location cache.
+    """
+    length = CODE_LENGTHS[doctype]
+    if not code or not code.isdigit() or len(code) != length:
+        return _("{0} Code must be exactly {1} digits").format(doctype, length)
+
+    parent_doctype = PARENT_DOCTYPES.get(doctype)
+    if not parent_doctype or not parent:
+        return None
+
+    expected = parent_code(code)
+    if parent != expected:
+        return _("{0} code mismatch. {1} code {2} should belong to {3} {4}, not {5}").format(
+            parent_doctype, doctype, code, parent_doctype.lower(), expected, parent
+        )
+
+    exists = location_exists(parent_doctype, parent) if parent_codes is None else parent in parent_codes
+    if not exists:
+        return _("{0} {1} does not exist").format(parent_doctype, parent)
+    return None
+
+
+def validate_location(doctype, code, parent=None):
+    """Throw if a location code or its parent link is invalid."""
+    error = check_location(doctype, code, parent)
+    if error:
+        frappe.throw(error)
+
+
+def validate_many(doctype, rows, parent_codes=None):
+    """Check many rows of one location doctype at once.
+
+    `rows` are dicts keyed by the doctype's fieldnames or (code, parent)
+    pairs. Codes repeated within `rows` are reported too. Returns a list of
+    (row index, message) for the invalid rows.
+    """
+    code_field = LOCATION_FIELDS[doctype][2]
+    parent_field = PARENT_FIELDS.get(doctype)
+    if parent_codes is None and parent_field:
+        parent_codes = get_code_set(PARENT_DOCTYPES[doctype])
+
+    errors = []
+    seen = set()
+    for i, row in enumerate(rows):
+        if isinstance(row, dict):
+            code, parent = row.get(code_field), row.get(parent_field) if parent_field else None
+        else:
+            code, parent = row
+        error = check_location(doctype, code, parent, parent_codes)
+        if not error and code in seen:
+            error = _("Duplicate {0} code {1}").format(doctype, code)
+        if error:
+            errors.append((i, error))
+        seen.add(code)
+    return errors
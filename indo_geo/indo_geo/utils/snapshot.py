@@ -0,0 +1,322 @@
+"""Packed binary snapshot of the whole location hierarchy, readable through mmap.
+
+Layout (little-endian, every section starts on an 8-byte boundary):
+
+    header          magic, format version, digest of the CSV files it was
+                    built from, per level (province, regency, district,
+                    village) the row count, distinct name count and name
+                    blob size, array typecode of every section below
+    per level       name lengths, name blob offsets of every
+                    NAME_INDEX_STRIDE-th name, name blob, name ids,
+                    code suffixes, child starts
+
+Rows are ordered by code, so the children of a parent row are one run of rows
+in the level below. Instead of a parent per row, each level stores where the
+run of every parent row starts (a single run for provinces), and a row's parent
+is found by bisecting those starts. Since a code starts with its parent's
+code, only the digits below the parent are stored (the whole code for
+provinces), which keeps even village codes within 16 bits.
+
+Names such as SIDOMULYO repeat dozens of times, so each level stores every
+distinct name once, as UTF-8 in its name blob. Keeping a string table per level
+keeps every name id within 16 bits. Names are located by their one-byte
+lengths plus a sparse offset index, instead of an offset per name.
+
+Every integer section is fixed width, using the narrowest of uint8/16/32/64
+that fits its largest value. Reading maps the file and casts the sections to
+typed memoryviews, so nothing is copied until a name or code is decoded.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+from indo_geo.indo_geo.utils.code_index import CODE_LENGTHS, LEVELS, get_level, parent_code
+
+MAGIC = b"IGEOSNAP"
+FORMAT_VERSION = 2
+SNAPSHOT_FILE = "locations.snapshot"
+
+# Bytes of the CSV digest kept in the header (see location_data.get_source_digest)
+SOURCE_DIGEST_SIZE = 16
+
+# Names between two entries of the sparse name offset index
+NAME_INDEX_STRIDE = 32
+
+# Name lengths, name index, name ids, code suffixes and child starts of each level
+_SECTION_COUNT = 5 * len(LEVELS)
+_HEADER = struct.Struct(f"<8sI{SOURCE_DIGEST_SIZE}s{3 * len(LEVELS)}I{_SECTION_COUNT}s")
+
+_PARENT_LEVELS = {doctype: LEVELS[i - 1][0] if i else None for i, (doctype, _length) in enumerate(LEVELS)}
+
+
+def _narrowest(values):
+    """Return the narrowest unsigned array that holds `values`."""
+    largest = max(values, default=0)
+    for typecode in ("B", "H", "I", "Q"):
+        if largest < 256 ** struct.calcsize(typecode):
+            return array(typecode, values)
+    raise OverflowError(f"{largest} does not fit in a snapshot section")
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def write_snapshot(file_path, locations, source_digest=b""):
+    """Write a snapshot file.
+
+    `locations` maps each doctype to an iterable of (code, name, parent_code)
+    tuples; every code below province level must start with its parent's code,
+    which must be present in the level above. `source_digest` identifies the
+    CSV files the locations were read from.
+    """
+    levels = []
+    parent_rows = {None: 0}
+
+    for doctype, _length in LEVELS:
+        rows = sorted(locations.get(doctype, ()))
+        name_ids = {}
+        suffixes = []
+        ids = []
+        starts = [0] * (len(parent_rows) + 1)
+        last_parent_row = 0
+        for row, (code, name, parent) in enumerate(rows):
+            if _PARENT_LEVELS[doctype]:
+                if parent not in parent_rows or not code.startswith(parent):
+                    raise ValueError(f"Parent {parent} of {doctype} {code} is not in the snapshot")
+                suffixes.append(int(code[len(parent) :]))
+            else:
+                parent = None
+                suffixes.append(int(code))
+            ids.append(name_ids.setdefault(name, len(name_ids)))
+
+            # Parents without children start where the next parent does
+            parent_row = parent_rows[parent]
+            for skipped in range(last_parent_row + 1, parent_row + 1):
+                starts[skipped] = row
+            last_parent_row = parent_row
+        for skipped in range(last_parent_row + 1, len(starts)):
+            starts[skipped] = len(rows)
+        parent_rows = {code: i for i, (code, _name, _parent) in enumerate(rows)}
+
+        names = [name.encode("utf-8") for name in name_ids]
+        index = [0]
+        offset = 0
+        for i, name in enumerate(names, 1):
+            offset += len(name)
+            if i % NAME_INDEX_STRIDE == 0:
+                index.append(offset)
+        levels.append((
+            len(rows),
+            len(names),
+            b"".join(names),
+            [
+                _narrowest([len(name) for name in names]),
+                _narrowest(index),
+                _narrowest(ids),
+                _narrowest(suffixes),
+                _narrowest(starts),
+            ],
+        ))
+
+    typecodes = "".join(section.typecode for *_counts, arrays in levels for section in arrays)
+    with open(file_path, "wb") as f:
+        f.write(_HEADER.pack(
+            MAGIC, FORMAT_VERSION, source_digest,
+            *(count for count, *_rest in levels),
+            *(name_count for _count, name_count, *_rest in levels),
+            *(len(blob) for _count, _name_count, blob, _arrays in levels),
+            typecodes.encode("ascii"),
+        ))
+        for _count, _name_count, blob, (lengths, index, ids, suffixes, starts) in levels:
+            for section in (lengths, index, blob, ids, suffixes, starts):
+                f.write(b"\0" * (_align(f.tell()) - f.tell()))
+                f.write(_to_little_endian(section))
+
+
+def _to_little_endian(section):
+    if isinstance(section, array) and sys.byteorder != "little":
+        section = array(section.typecode, section)
+        section.byteswap()
+    return section.tobytes() if isinstance(section, array) else section
+
+
+class LocationSnapshot:
+    """Read-only view of a snapshot file."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        with open(file_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        magic, version, self.source_digest, *counts, typecodes = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError(f"{file_path} is not a location snapshot")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported location snapshot version {version}")
+        typecodes = iter(typecodes.decode("ascii"))
+        level_count = len(LEVELS)
+        row_counts = counts[:level_count]
+        name_counts = counts[level_count : 2 * level_count]
+        blob_sizes = counts[2 * level_count :]
+
+        self._name_lengths = {}
+        self._name_index = {}
+        self._blobs = {}
+        self._name_ids = {}
+        self._suffixes = {}
+        self._starts = {}
+        self._codes = {}
+        offset = _HEADER.size
+        for i, (doctype, _length) in enumerate(LEVELS):
+            name_count = name_counts[i]
+            parent_count = row_counts[i - 1] if i else 1
+            self._name_lengths[doctype], offset = self._section(view, offset, next(typecodes), name_count)
+            self._name_index[doctype], offset = self._section(
+                view, offset, next(typecodes), name_count // NAME_INDEX_STRIDE + 1
+            )
+            offset = _align(offset)
+            self._blobs[doctype] = view[offset : offset + blob_sizes[i]]
+            offset += blob_sizes[i]
+            self._name_ids[doctype], offset = self._section(view, offset, next(typecodes), row_counts[i])
+            self._suffixes[doctype], offset = self._section(view, offset, next(typecodes), row_counts[i])
+            self._starts[doctype], offset = self._section(view, offset, next(typecodes), parent_count + 1)
+
+    @staticmethod
+    def _section(view, offset, typecode, count):
+        offset = _align(offset)
+        size = count * struct.calcsize(typecode)
+        data = view[offset : offset + size]
+        if sys.byteorder == "little":
+            section = data.cast(typecode)
+        else:
+            section = array(typecode, data.tobytes())
+            section.byteswap()
+        return section, offset + size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Release the memory views and unmap the file."""
+        self._codes.clear()
+        for views in (
+            self._name_lengths, self._name_index, self._blobs, self._name_ids, self._suffixes, self._starts
+        ):
+            for section in views.values():
+                if isinstance(section, memoryview):
+                    section.release()
+            views.clear()
+        self._mmap.close()
+
+    def __len__(self):
+        return sum(len(suffixes) for suffixes in self._suffixes.values())
+
+    def count(self, doctype):
+        """Return the number of rows of a level."""
+        return len(self._suffixes[doctype])
+
+    def codes(self, doctype):
+        """Return the ascending integer codes of a level, decoded once and kept."""
+        if doctype not in self._codes:
+            parent_doctype = _PARENT_LEVELS[doctype]
+            suffixes = self._suffixes[doctype]
+            if parent_doctype:
+                starts = self._starts[doctype]
+                scale = 10 ** (CODE_LENGTHS[doctype] - CODE_LENGTHS[parent_doctype])
+                codes = array("Q")
+                for parent_row, base in enumerate(self.codes(parent_doctype)):
+                    rows = range(starts[parent_row], starts[parent_row + 1])
+                    codes.extend(base * scale + suffixes[row] for row in rows)
+            else:
+                codes = array("Q", suffixes)
+            self._codes[doctype] = codes
+        return self._codes[doctype]
+
+    def get_name(self, doctype, name_id):
+        """Decode one name from the string table of a level."""
+        lengths = self._name_lengths[doctype]
+        block_start = name_id - name_id % NAME_INDEX_STRIDE
+        start = self._name_index[doctype][name_id // NAME_INDEX_STRIDE] + sum(lengths[block_start:name_id])
+        return str(self._blobs[doctype][start : start + lengths[name_id]], "utf-8")
+
+    def get_code(self, doctype, row):
+        """Return the code of a row as a zero-padded string."""
+        suffix = self._suffixes[doctype][row]
+        parent_doctype = _PARENT_LEVELS[doctype]
+        if not parent_doctype:
+            return f"{suffix:0{CODE_LENGTHS[doctype]}d}"
+        width = CODE_LENGTHS[doctype] - CODE_LENGTHS[parent_doctype]
+        return f"{self.get_code(parent_doctype, self._get_parent_row(doctype, row))}{suffix:0{width}d}"
+
+    def find(self, code):
+        """Return the row number of `code` within its level, or None."""
+        doctype = get_level(code)
+        if not doctype:
+            return None
+        parent = parent_code(code)
+        parent_row = 0
+        if parent:
+            parent_row = self.find(parent)
+            if parent_row is None:
+                return None
+        starts = self._starts[doctype]
+        lo, hi = starts[parent_row], starts[parent_row + 1]
+        value = int(code[len(parent or "") :])
+        row = bisect_left(self._suffixes[doctype], value, lo, hi)
+        return row if row < hi and self._suffixes[doctype][row] == value else None
+
+    def get(self, code):
+        """Return (name, parent_code) of a location, or None if it is not in the snapshot."""
+        row = self.find(code)
+        if row is None:
+            return None
+        doctype = get_level(code)
+        parent_doctype = _PARENT_LEVELS[doctype]
+        parent = self.get_code(parent_doctype, self._get_parent_row(doctype, row)) if parent_doctype else None
+        return self.get_name(doctype, self._name_ids[doctype][row]), parent
+
+    def iter_codes(self, doctype):
+        """Yield the code of every row of a level as a string, ordered by code."""
+        for code, _name, _parent in self.iter_locations(doctype, names=False):
+            yield code
+
+    def iter_locations(self, doctype, names=True):
+        """Yield (code, name, parent_code) for every row of a level, ordered by code.
+
+        With `names` false the names are not decoded and come back as None.
+        """
+        name_ids = self._name_ids[doctype]
+        suffixes = self._suffixes[doctype]
+        starts = self._starts[doctype]
+        parent_doctype = _PARENT_LEVELS[doctype]
+        parents = self.iter_codes(parent_doctype) if parent_doctype else [None]
+        width = CODE_LENGTHS[doctype] - (CODE_LENGTHS[parent_doctype] if parent_doctype else 0)
+        for parent_row, parent in enumerate(parents):
+            for row in range(starts[parent_row], starts[parent_row + 1]):
+                name = self.get_name(doctype, name_ids[row]) if names else None
+                yield f"{parent or ''}{suffixes[row]:0{width}d}", name, parent
+
+    def _get_parent_row(self, doctype, row):
+        return bisect_right(self._starts[doctype], row) - 1
+
+
+_open_snapshots = {}
+
+
+def get_snapshot(file_path):
+    """Return a process-wide LocationSnapshot of `file_path`, reopened when the file changes."""
+    mtime = os.path.getmtime(file_path)
+    cached = _open_snapshots.get(file_path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, LocationSnapshot(file_path))
+        _open_snapshots[file_path] = cached
+    return cached[1]
@@ -0,0 +1,158 @@
+"""Static JSON shards of the location hierarchy, served as app assets.
+
+Forms that load the shards (see public/js/location_bundle.js) never call the
+location API. Every site has its own bundle, in its public files, served at
+`/files/indo_geo_locations/`:
+
+    manifest.json               dataset version, all provinces, and the file
+                                name of each province's shard
+    <province>.<hash>.json      regencies, districts and villages of one
+                                province as [code, name] pairs
+
+Shard names carry a hash of their content, so they can be cached forever; only
+the small manifest has to be revalidated. Parents are not stored, the client
+derives them from the codes. Every file is written next to a `.gz` copy for
+servers using gzip_static.
+
+Imports and syncs rebuild the bundle when they finish. Edits made through the
+forms queue a rebuild once they commit, see location_cache.clear_location_cache.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+
+import frappe
+
+from indo_geo.indo_geo.utils.code_index import LEVELS
+from indo_geo.indo_geo.utils.import_metrics import current_job, report, tracked, warn
+from indo_geo.indo_geo.utils.location_cache import LOCATION_FIELDS, get_version
+
+# Directory of the bundle within the site's public files
+BUNDLE_DIR = "indo_geo_locations"
+
+MANIFEST_FILE = "manifest.json"
+
+BUNDLE_JOB_ID = "indo_geo_location_bundle"
+
+# Builds a queued rebuild runs at most, while edits keep landing during the build
+MAX_BUNDLE_BUILDS = 3
+
+# Keys of each level in a shard
+SHARD_KEYS = {"Regency": "regencies", "District": "districts", "Village": "villages"}
+
+
+def get_bundle_path():
+    """Return the directory the shards of the current site are written to."""
+    return frappe.get_site_path("public", "files", BUNDLE_DIR)
+
+
+def get_dataset_version():
+    """Return the version the manifest records, which changes whenever any location changes."""
+    return "-".join(get_version(doctype) for doctype in LOCATION_FIELDS)
+
+
+@tracked
+def build_location_bundle(output_path=None):
+    """Write one JSON shard per province plus the manifest, and remove stale shards."""
+    report("Building static location bundle...")
+    start_time = time.time()
+    output_path = output_path or get_bundle_path()
+    os.makedirs(output_path, exist_ok=True)
+
+    job = current_job()
+    with job.span("read"):
+        locations = {doctype: _load_locations(doctype) for doctype, _length in LEVELS}
+    with job.span("transform"):
+        shards = {code: {key: [] for key in SHARD_KEYS.values()} for code, _name in locations["Province"]}
+        for doctype, key in SHARD_KEYS.items():
+            for code, name in locations[doctype]:
+                if code[:2] in shards:
+                    shards[code[:2]][key].append([code, name])
+
+    files = {}
+    for province, shard in shards.items():
+        with job.span("transform"):
+            content = _dump(shard)
+            file_name = f"{province}.{hashlib.sha256(content).hexdigest()[:12]}.json"
+        with job.span("execute"):
+            _write(os.path.join(output_path, file_name), content)
+        files[province] = file_name
+
+    manifest = {
+        "version": get_dataset_version(),
+        "provinces": [[code, name] for code, name in locations["Province"]],
+        "shards": files,
+    }
+    with job.span("execute"):
+        _write(os.path.join(output_path, MANIFEST_FILE), _dump(manifest))
+
+        keep = {MANIFEST_FILE, *files.values()}
+        for file_name in os.listdir(output_path):
+            if file_name.removesuffix(".gz") not in keep:
+                os.remove(os.path.join(output_path, file_name))
+    job.add_rows(sum(len(rows) for rows in locations.values()))
+
+    report(f"Wrote {len(files)} location shards to {output_path} in {time.time() - start_time:.2f} seconds")
+    return manifest
+
+
+def _load_locations(doctype):
+    name_field, code_field = LOCATION_FIELDS[doctype][1], LOCATION_FIELDS[doctype][2]
+    return frappe.db.sql(f"SELECT `{code_field}`, `{name_field}` FROM `tab{doctype}` ORDER BY `{name_field}`")
+
+
+def _dump(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write(file_path, content):
+    with open(file_path, "wb") as f:
+        f.write(content)
+    with open(f"{file_path}.gz", "wb") as f:
+        f.write(gzip.compress(content, compresslevel=9, mtime=0))
+
+
+def rebuild_after_import():
+    """Rebuild the bundle once an import has finished, without failing the import.
+
+    Skipped in tests and while benchmarking, whose data must not end up in the
+    site's public files.
+    """
+    if frappe.flags.in_test or frappe.flags.in_location_benchmark:
+        return
+    _rebuild_bundle()
+
+
+def enqueue_bundle_rebuild():
+    """Queue a rebuild of the bundle, unless one is already queued or running."""
+    if frappe.flags.in_test or frappe.flags.in_location_benchmark:
+        return
+    frappe.enqueue(
+        "indo_geo.indo_geo.utils.static_bundle.rebuild_queued_bundle",
+        queue="long",
+        job_id=BUNDLE_JOB_ID,
+        deduplicate=True,
+    )
+
+
+def rebuild_queued_bundle():
+    """Background job of `enqueue_bundle_rebuild`.
+
+    Edits committed while the job runs do not queue another one, so it builds
+    again until the bundle is current, up to MAX_BUNDLE_BUILDS times.
+    """
+    for _attempt in range(MAX_BUNDLE_BUILDS):
+        manifest = _rebuild_bundle()
+        if not manifest or manifest["version"] == get_dataset_version():
+            return
+
+
+def _rebuild_bundle():
+    try:
+        return build_location_bundle()
+    except Exception as e:
+        frappe.log_error(f"Error building static location bundle: {e!s}")
+        warn(f"Could not build static location bundle: {e!s}")
@@ -0,0 +1,188 @@
+"""Bring the location tables in line with a new data release without wiping them.
+
+The shipped snapshot or CSV files are compared with the database by code: rows
+whose content differs are updated in place and new codes are inserted. Codes no
+longer in the data are only deleted on request, and only when no document links
+to them any more. Document names stay the codes, so every Link pointing at an
+unchanged or renamed location keeps working.
+"""
+
+import time
+
+import frappe
+from frappe.utils import now_datetime
+
+from indo_geo.indo_geo.utils.code_index import LEVELS
+from indo_geo.indo_geo.utils.import_metrics import current_job, report, timed_commit, tracked, warn
+from indo_geo.indo_geo.utils.location_cache import adopt_snapshot, bump_version
+from indo_geo.indo_geo.utils.location_data import (
+    STANDARD_COLUMNS,
+    TABLE_COLUMNS,
+    TIMESTAMP_FORMAT,
+    build_row,
+    get_data_path,
+    iter_locations,
+)
+from indo_geo.indo_geo.utils.static_bundle import rebuild_after_import
+
+SYNC_BATCH_SIZE = 2000
+
+# Everything after the standard columns is derived from the data release
+_DATA_START = len(STANDARD_COLUMNS)
+
+# Still linked codes listed per doctype in the sync warning
+LINKED_CODES_SHOWN = 20
+
+
+@tracked
+def sync_all_locations(data_path=None, delete=False, batch_size=SYNC_BATCH_SIZE):
+    """Apply the differences between the shipped location data and the database.
+
+    Inserts and updates run from provinces down so parents exist first.
+    Locations dropped from the data release are kept unless `delete` is set;
+    deletions then run from villages up, and skip the locations some document
+    (including a location below them that was kept) still links to.
+    """
+    report("Starting location sync...")
+    start_time = time.time()
+    data_path = data_path or get_data_path()
+    timestamp = now_datetime().strftime(TIMESTAMP_FORMAT)
+    job = current_job()
+
+    changes = {}
+    for doctype, _length in LEVELS:
+        rows = (
+            build_row(doctype, code, name, parent, timestamp)
+            for code, name, parent in job.iter_span("read", iter_locations(data_path, doctype))
+        )
+        with job.span("transform"):
+            changes[doctype] = diff_locations(get_location_hashes(doctype), rows)
+
+    summary = {}
+    for doctype, _length in LEVELS:
+        inserts, updates, removed = changes[doctype]
+        with job.span("execute"):
+            apply_inserts(doctype, inserts, batch_size)
+            apply_updates(doctype, updates, timestamp, batch_size)
+        summary[doctype] = {"inserted": len(inserts), "updated": len(updates), "deleted": 0, "kept": len(removed)}
+        timed_commit()
+
+    if delete:
+        for doctype, _length in reversed(LEVELS):
+            removed = changes[doctype][2]
+            with job.span("execute"):
+                linked = apply_deletes(doctype, removed, batch_size)
+            summary[doctype]["deleted"] = len(removed) - len(linked)
+            summary[doctype]["kept"] = len(linked)
+            timed_commit()
+            if linked:
+                shown = ", ".join(linked[:LINKED_CODES_SHOWN])
+                more = f" and {len(linked) - LINKED_CODES_SHOWN} more" if len(linked) > LINKED_CODES_SHOWN else ""
+                warn(f"Kept {len(linked)} removed {doctype} records still linked from other documents: {shown}{more}")
+
+    job.add_rows(sum(counts["inserted"] + counts["updated"] + counts["deleted"] for counts in summary.values()))
+    if any(counts["inserted"] or counts["updated"] or counts["deleted"] for counts in summary.values()):
+        bump_version()
+        rebuild_after_import()
+    adopt_snapshot()
+
+    report_sync_summary(summary, time.time() - start_time)
+    return summary
+
+
+def get_location_hashes(doctype):
+    """Return {code: content hash} of the data columns of every row of a doctype."""
+    columns = ", ".join(f"`{column}`" for column in TABLE_COLUMNS[doctype][_DATA_START:])
+    return {row[0]: hash(row) for row in frappe.db.sql(f"SELECT {columns} FROM `tab{doctype}`")}
+
+
+def diff_locations(db_hashes, rows):
+    """Split full table `rows` into (inserts, updates, deleted codes) against `db_hashes`.
+
+    `db_hashes` is consumed: codes left in it after the comparison are the
+    ones missing from `rows`.
+    """
+    inserts = []
+    updates = []
+    for row in rows:
+        code = row[0]
+        db_hash = db_hashes.pop(code, None)
+        if db_hash is None:
+            inserts.append(row)
+        elif db_hash != hash(row[_DATA_START:]):
+            updates.append(row)
+    return inserts, updates, sorted(db_hashes)
+
+
+def apply_inserts(doctype, rows, batch_size=SYNC_BATCH_SIZE):
+    if rows:
+        frappe.db.bulk_insert(doctype, TABLE_COLUMNS[doctype], rows, chunk_size=batch_size)
+
+
+def apply_updates(doctype, rows, timestamp, batch_size=SYNC_BATCH_SIZE):
+    """Rewrite the data columns of changed rows, one CASE statement per batch."""
+    columns = TABLE_COLUMNS[doctype][_DATA_START:]
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start : start + batch_size]
+        assignments = []
+        values = []
+        for i, column in enumerate(columns, _DATA_START):
+            assignments.append(f"`{column}` = CASE `name` {' '.join(['WHEN %s THEN %s'] * len(batch))} END")
+            for row in batch:
+                values.extend((row[0], row[i]))
+        values.append(timestamp)
+        values.extend(row[0] for row in batch)
+        frappe.db.sql(
+            f"""UPDATE `tab{doctype}` SET {", ".join(assignments)}, `modified` = %s
+            WHERE `name` IN ({", ".join(["%s"] * len(batch))})""",
+            values,
+        )
+
+
+def apply_deletes(doctype, codes, batch_size=SYNC_BATCH_SIZE):
+    """Delete the rows of `codes` that no document links to, and return the others."""
+    link_fields = get_link_fields(doctype)
+    linked = []
+    for start in range(0, len(codes), batch_size):
+        batch = codes[start : start + batch_size]
+        in_use = get_linked_codes(link_fields, batch)
+        linked.extend(code for code in batch if code in in_use)
+        batch = [code for code in batch if code not in in_use]
+        if batch:
+            frappe.db.sql(
+                f"DELETE FROM `tab{doctype}` WHERE `name` IN ({', '.join(['%s'] * len(batch))})", batch
+            )
+    return linked
+
+
+def get_link_fields(doctype):
+    """Return (doctype, fieldname) of every Link field pointing at `doctype`, standard or custom."""
+    filters = {"fieldtype": "Link", "options": doctype}
+    fields = frappe.get_all("DocField", filters=filters, fields=["parent", "fieldname"], as_list=True)
+    fields += frappe.get_all("Custom Field", filters=filters, fields=["dt", "fieldname"], as_list=True)
+    # Single and virtual doctypes have no table to look in
+    return sorted({(dt, fieldname) for dt, fieldname in fields if frappe.db.table_exists(dt)})
+
+
+def get_linked_codes(link_fields, codes):
+    """Return the subset of `codes` that some row links to through `link_fields`."""
+    placeholders = ", ".join(["%s"] * len(codes))
+    linked = set()
+    for dt, fieldname in link_fields:
+        linked.update(
+            frappe.db.sql_list(
+                f"SELECT DISTINCT `{fieldname}` FROM `tab{dt}` WHERE `{fieldname}` IN ({placeholders})",
+                codes,
+            )
+        )
+    return linked
+
+
+def report_sync_summary(summary, elapsed):
+    report("\nLocation sync summary:")
+    for doctype, counts in summary.items():
+        report(
+            f"  {doctype}: {counts['inserted']} inserted, {counts['updated']} updated, "
+            f"{counts['deleted']} deleted, {counts['kept']} removed from the data but kept"
+        )
+    report(f"Location sync completed in {elapsed:.2f} seconds!")
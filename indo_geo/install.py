@@ -1,16 +1,21 @@
 import frappe
 
-from indo_geo.indo_geo.utils.import_locations import import_all_locations, import_all_locations_sql
+from indo_geo.indo_geo.utils.import_job import enqueue_location_import
+from indo_geo.indo_geo.utils.import_metrics import report, warn
 
 
 def after_install():
-    """Import location data after app installation."""
+    """Queue the location data import after app installation.
+
+    The data is loaded by a resumable background job, so installing the app
+    does not wait for it (see utils/import_job.py).
+    """
     try:
-        print("Starting post-installation setup for Indo Geo...")
-        import_all_locations()
-        print("Indo Geo setup completed successfully!")
+        report("Starting post-installation setup for Indo Geo...")
+        enqueue_location_import()
+        report("Indo Geo setup completed, location data is being imported in the background")
     except Exception as e:
         frappe.log_error(f"Error during Indo Geo setup: {e!s}")
-        print(f"Error during setup: {e!s}")
+        warn(f"Error during setup: {e!s}")
         raise
 
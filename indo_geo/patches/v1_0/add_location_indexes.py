@@ -0,0 +1,5 @@
+from indo_geo.indo_geo.utils.location_indexes import add_location_indexes
+
+
+def execute():
+    add_location_indexes()
@@ -0,0 +1,109 @@
+// Copyright (c) 2025, Nuwaira Technology and Contributors
+// For license information, please see license.txt
+
+// Reads the static location shards written by
+// indo_geo.indo_geo.utils.static_bundle.build_location_bundle, so location
+// dropdowns need no API calls. Every getter resolves to the same rows as the
+// matching indo_geo.api.get_* endpoint; when the bundle has not been built it
+// falls back to that endpoint.
+
+frappe.provide("indo_geo.locations");
+
+(function () {
+	const BUNDLE_URL = "/files/indo_geo_locations/";
+	const API_METHODS = {
+		Province: "indo_geo.api.get_provinces",
+		Regency: "indo_geo.api.get_regencies",
+		District: "indo_geo.api.get_districts",
+		Village: "indo_geo.api.get_villages",
+	};
+	const SHARD_KEYS = { Regency: "regencies", District: "districts", Village: "villages" };
+	const PARENT_FIELDS = { Regency: "province", District: "regency", Village: "district" };
+
+	let manifest_promise = null;
+	const shard_promises = {};
+
+	function fetch_json(url) {
+		return fetch(url, { credentials: "same-origin" }).then((response) => {
+			if (!response.ok) {
+				throw new Error(`${url}: ${response.status}`);
+			}
+			return response.json();
+		});
+	}
+
+	function load_manifest() {
+		if (!manifest_promise) {
+			// The manifest is not content-hashed, so always revalidate it
+			manifest_promise = fetch(BUNDLE_URL + "manifest.json", { cache: "no-cache" })
+				.then((response) => (response.ok ? response.json() : null))
+				.catch(() => null);
+		}
+		return manifest_promise;
+	}
+
+	function load_shard(province) {
+		if (!shard_promises[province]) {
+			shard_promises[province] = load_manifest().then((manifest) => {
+				const file_name = manifest && manifest.shards[province];
+				return file_name ? fetch_json(BUNDLE_URL + file_name) : null;
+			});
+		}
+		return shard_promises[province];
+	}
+
+	function to_row(doctype, code, name) {
+		const fieldname = doctype.toLowerCase();
+		const row = { name: code };
+		row[`${fieldname}_name`] = name;
+		row[`${fieldname}_code`] = code;
+		// Ancestor links, derived from the code as on the server
+		if (code.length > 2) row.province = code.slice(0, 2);
+		if (code.length > 4) row.regency = code.slice(0, 4);
+		if (code.length > 7) row.district = code.slice(0, 7);
+		return row;
+	}
+
+	function from_api(doctype, parent) {
+		const args = {};
+		if (parent) args[PARENT_FIELDS[doctype]] = parent;
+		return frappe
+			.call({ method: API_METHODS[doctype], args: args, type: "GET" })
+			.then((r) => (r.message && r.message.data) || []);
+	}
+
+	// Rows of `doctype` below the `parent` code (all rows of the level without one)
+	indo_geo.locations.get_children = function (doctype, parent) {
+		if (doctype === "Province") {
+			return load_manifest().then((manifest) =>
+				manifest
+					? manifest.provinces.map(([code, name]) => to_row(doctype, code, name))
+					: from_api(doctype)
+			);
+		}
+		if (!parent) {
+			return from_api(doctype);
+		}
+		return load_shard(parent.slice(0, 2)).then((shard) => {
+			if (!shard) {
+				return from_api(doctype, parent);
+			}
+			return shard[SHARD_KEYS[doctype]]
+				.filter(([code]) => code.startsWith(parent) && code !== parent)
+				.map(([code, name]) => to_row(doctype, code, name));
+		});
+	};
+
+	// Dataset version of the bundle, or null when it has not been built
+	indo_geo.locations.get_version = function () {
+		return load_manifest().then((manifest) => (manifest ? manifest.version : null));
+	};
+
+	indo_geo.locations.get_provinces = () => indo_geo.locations.get_children("Province");
+	indo_geo.locations.get_regencies = (province) =>
+		indo_geo.locations.get_children("Regency", province);
+	indo_geo.locations.get_districts = (regency) =>
+		indo_geo.locations.get_children("District", regency);
+	indo_geo.locations.get_villages = (district) =>
+		indo_geo.locations.get_children("Village", district);
+})();
@@ -0,0 +1,205 @@
+// Copyright (c) 2025, Nuwaira Technology and Contributors
+// For license information, please see license.txt
+
+// Cascading Province -> Regency -> District -> Village pickers for Link fields.
+//
+// Each child list is fetched once per parent (from the static bundle or the
+// API, see location_bundle.js), kept in sessionStorage under the dataset
+// version and filtered in the browser as the user types. Link fields without
+// a known parent search on the server instead, debounced.
+//
+//     indo_geo.location_picker.setup("Customer Address", {
+//         fields: {
+//             Province: "province",
+//             Regency: "regency",
+//             District: "district",
+//             Village: "village",
+//         },
+//     });
+//
+// `code_field` names a field holding the document's own location code, whose
+// prefix then scopes the Link fields above it (used by the location doctypes).
+
+frappe.provide("indo_geo.location_picker");
+
+(function () {
+	const LEVELS = ["Province", "Regency", "District", "Village"];
+	const CODE_LENGTHS = { Province: 2, Regency: 4, District: 7, Village: 10 };
+	const STORAGE_PREFIX = "indo_geo:locations:";
+	const MAX_ITEMS = 50;
+	const SERVER_DEBOUNCE_MS = 300;
+
+	const memory = {};
+	let version_promise = null;
+
+	function get_version() {
+		if (!version_promise) {
+			version_promise = indo_geo.locations.get_version().then(
+				(version) =>
+					version ||
+					frappe
+						.call({ method: "indo_geo.api.get_dataset_version", type: "GET" })
+						.then((r) => r.message)
+			);
+		}
+		return version_promise;
+	}
+
+	function read_storage(key) {
+		try {
+			const value = sessionStorage.getItem(key);
+			return value ? JSON.parse(value) : null;
+		} catch (e) {
+			return null;
+		}
+	}
+
+	function write_storage(key, rows) {
+		try {
+			sessionStorage.setItem(key, JSON.stringify(rows));
+		} catch (e) {
+			// Storage full or disabled: the in-memory copy still serves this page
+		}
+	}
+
+	function clear_old_versions(version) {
+		try {
+			Object.keys(sessionStorage)
+				.filter(
+					(key) =>
+						key.startsWith(STORAGE_PREFIX) && !key.startsWith(STORAGE_PREFIX + version)
+				)
+				.forEach((key) => sessionStorage.removeItem(key));
+		} catch (e) {
+			// Nothing to clean up without storage
+		}
+	}
+
+	// [[code, name], ...] of `level` below `parent`, fetched once per parent and version
+	indo_geo.location_picker.get_options = function (level, parent) {
+		return get_version().then((version) => {
+			const key = `${STORAGE_PREFIX}${version}:${level}:${parent || ""}`;
+			if (!memory[key]) {
+				const stored = read_storage(key);
+				if (stored) {
+					memory[key] = Promise.resolve(stored);
+				} else {
+					const fieldname = level.toLowerCase();
+					memory[key] = indo_geo.locations.get_children(level, parent).then((rows) => {
+						const options = rows.map((row) => [row.name, row[`${fieldname}_name`]]);
+						clear_old_versions(version);
+						write_storage(key, options);
+						return options;
+					});
+					memory[key].catch(() => delete memory[key]);
+				}
+			}
+			return memory[key];
+		});
+	};
+
+	function filter_options(options, text) {
+		const query = (text || "").trim().toUpperCase();
+		const items = [];
+		for (const [code, name] of options) {
+			if (!query || name.includes(query) || code.startsWith(query)) {
+				items.push({ label: `${name} (${code})`, value: code });
+				if (items.length >= MAX_ITEMS) break;
+			}
+		}
+		return items;
+	}
+
+	function get_parent(frm, config, level) {
+		const index = LEVELS.indexOf(level);
+		if (index === 0) return null;
+		const parent_level = LEVELS[index - 1];
+		const parent_field = config.fields[parent_level];
+		if (parent_field && frm.doc[parent_field]) {
+			return frm.doc[parent_field];
+		}
+		const code = config.code_field && frm.doc[config.code_field];
+		if (code && code.length > CODE_LENGTHS[parent_level]) {
+			return code.slice(0, CODE_LENGTHS[parent_level]);
+		}
+		return undefined;
+	}
+
+	const search_server = frappe.utils.debounce((level, text, callback) => {
+		frappe
+			.call({
+				method: "indo_geo.api.search_locations",
+				args: { q: text, level: level, limit: MAX_ITEMS },
+				type: "GET",
+			})
+			.then((r) => {
+				const hits = (r.message && r.message.data) || [];
+				callback(
+					hits.map((hit) => ({ label: `${hit.name} (${hit.code})`, value: hit.code }))
+				);
+			});
+	}, SERVER_DEBOUNCE_MS);
+
+	function bind_field(frm, config, level) {
+		const field = frm.get_field(config.fields[level]);
+		const bound = field && field.$input && field.$input.data("indo-geo-picker");
+		if (!field || !field.$input || !field.awesomplete || bound) {
+			return;
+		}
+		field.$input.data("indo-geo-picker", true);
+
+		const show = (items) => {
+			field.awesomplete.list = items;
+			field.awesomplete.evaluate();
+		};
+		const update = () => {
+			const text = field.$input.val();
+			const parent = get_parent(frm, config, level);
+			if (parent === undefined) {
+				if (text) search_server(level, text, show);
+				return;
+			}
+			indo_geo.location_picker.get_options(level, parent).then((options) => {
+				// Skip lists for a value the user has typed past in the meantime
+				if (field.$input.val() === text) show(filter_options(options, text));
+			});
+		};
+
+		// Show the local list at once. Frappe's own handlers stay bound, so its
+		// Link search still runs; scope it to the same parent unless the form
+		// already set a query.
+		field.$input.off(".indo_geo").on("input.indo_geo focus.indo_geo", update);
+		if (!field.get_query && level !== "Province") {
+			const parent_field = LEVELS[LEVELS.indexOf(level) - 1].toLowerCase();
+			frm.set_query(config.fields[level], () => {
+				const parent = get_parent(frm, config, level);
+				return parent ? { filters: { [parent_field]: parent } } : {};
+			});
+		}
+	}
+
+	function clear_children(frm, config, level) {
+		const code = frm.doc[config.fields[level]];
+		LEVELS.slice(LEVELS.indexOf(level) + 1).forEach((child) => {
+			const fieldname = config.fields[child];
+			const value = fieldname && frm.doc[fieldname];
+			if (value && (!code || !value.startsWith(code))) {
+				frm.set_value(fieldname, "");
+			}
+		});
+	}
+
+	indo_geo.location_picker.setup = function (doctype, config) {
+		const handlers = {
+			refresh(frm) {
+				LEVELS.filter((level) => config.fields[level]).forEach((level) =>
+					bind_field(frm, config, level)
+				);
+			},
+		};
+		LEVELS.filter((level) => config.fields[level]).forEach((level) => {
+			handlers[config.fields[level]] = (frm) => clear_children(frm, config, level);
+		});
+		frappe.ui.form.on(doctype, handlers);
+	};
+})();
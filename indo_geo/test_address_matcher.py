@@ -0,0 +1,54 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.address_matcher import AddressMatcher, split_name
+
+
+class TestAddressMatcher(FrappeTestCase):
+	def setUp(self):
+		self.matcher = AddressMatcher({
+			"Province": [("31", "DKI JAKARTA"), ("32", "JAWA BARAT")],
+			"Regency": [
+				("3171", "KOTA JAKARTA SELATAN"),
+				("3204", "KABUPATEN BANDUNG"),
+				("3217", "KABUPATEN BANDUNG BARAT"),
+				("3273", "KOTA BANDUNG"),
+			],
+			"District": [("3204010", "CIWIDEY"), ("3217010", "LEMBANG"), ("3273010", "SUKASARI")],
+			"Village": [("3217010001", "JAYAGIRI"), ("3273010001", "GEGERKALONG")],
+		})
+
+	def test_split_name(self):
+		"""Test punctuation, abbreviations and kind-of-area prefixes are normalised."""
+		self.assertEqual(split_name("Kab. Bandung Brt", "Regency"), ("KABUPATEN", ("BANDUNG", "BARAT")))
+		self.assertEqual(split_name("KOTA JAKARTA SEL.", "Regency"), ("KOTA", ("JAKARTA", "SELATAN")))
+		self.assertEqual(split_name("Kec. Lembang", "District"), (None, ("LEMBANG",)))
+		self.assertEqual(split_name("Jabar", "Province"), (None, ("JAWA", "BARAT")))
+
+	def test_match_many(self):
+		"""Test abbreviated, partial and misspelled names resolve to codes."""
+		results = self.matcher.match_many([
+			{"regency": "Kab. Bandung Brt"},
+			{"regency": "KOTA JAKARTA SEL."},
+			{"regency": "Kota Bandung"},
+			{"province": "Jabar", "regency": "Bandung Barat", "district": "Kec. Lembang", "village": "Ds. Jayagiri"},
+			{"regency": "Bandunk Barat"},
+		])
+
+		self.assertEqual([result["code"] for result in results], ["3217", "3171", "3273", "3217010001", "3217"])
+		self.assertEqual(results[0]["regency"]["score"], 1.0)
+		self.assertEqual(results[0]["province"], {"code": "32", "name": "JAWA BARAT", "score": None})
+		self.assertLess(results[4]["regency"]["score"], 1.0)
+
+	def test_hierarchy_constraint(self):
+		"""Test a district only matches inside the regency resolved above it."""
+		inside, outside = self.matcher.match_many([
+			{"regency": "Kota Bandung", "district": "Sukasari"},
+			{"regency": "Kota Bandung", "district": "Lembang"},
+		])
+
+		self.assertEqual(inside["code"], "3273010")
+		self.assertIsNone(outside["district"])
+		self.assertEqual(outside["code"], "3273")
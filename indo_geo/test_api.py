@@ -0,0 +1,34 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.api import MAX_PAGE_SIZE, get_villages
+
+
+class TestApi(FrappeTestCase):
+	def test_keyset_pagination(self):
+		"""Test pages follow each other by code without gaps or overlaps."""
+		first = get_villages(limit=50)
+		second = get_villages(limit=50, after=first["next_after"])
+
+		codes = [row["village_code"] for row in first["data"] + second["data"]]
+		expected = frappe.get_all("Village", order_by="village_code asc", limit=100, pluck="village_code")
+		self.assertEqual(codes, expected)
+
+	def test_field_projection(self):
+		"""Test only the requested fields are returned, and unknown fields are refused."""
+		page = get_villages(district="3201010", fields="village_code,village_name")
+
+		self.assertTrue(page["data"])
+		self.assertEqual(set(page["data"][0]), {"village_code", "village_name"})
+		self.assertIsNone(page["next_after"])
+		with self.assertRaises(frappe.ValidationError):
+			get_villages(fields="village_code,password")
+
+	def test_unfiltered_requests_are_capped(self):
+		"""Test a request without a parent never returns a whole table."""
+		self.assertLessEqual(len(get_villages()["data"]), MAX_PAGE_SIZE)
+		with self.assertRaises(frappe.ValidationError):
+			get_villages(limit=MAX_PAGE_SIZE + 1)
@@ -0,0 +1,46 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import os
+import tempfile
+
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.benchmarks.synthetic import get_shape, iter_synthetic_locations, write_synthetic_data
+from indo_geo.indo_geo.utils.code_index import get_level, parent_code
+from indo_geo.indo_geo.utils.location_data import iter_csv_locations
+
+
+class TestBenchmarks(FrappeTestCase):
+	def test_shape_fits_codes(self):
+		"""Test every benchmark scale fits the Kemendagri code lengths."""
+		for scale in (1, 10, 100):
+			shape = get_shape(80534 * scale)
+			self.assertLessEqual(shape["District"], 999)
+			self.assertLessEqual(shape["Village"], 999)
+
+		with self.assertRaises(ValueError):
+			get_shape(10**10)
+
+	def test_synthetic_hierarchy(self):
+		"""Test the hierarchy has the requested villages and every parent comes first."""
+		seen = set()
+		villages = 0
+		for doctype, code, name in iter_synthetic_locations(5000):
+			self.assertEqual(get_level(code), doctype)
+			self.assertTrue(name)
+			if doctype != "Province":
+				self.assertIn(parent_code(code), seen)
+			self.assertNotIn(code, seen)
+			seen.add(code)
+			villages += doctype == "Village"
+		self.assertEqual(villages, 5000)
+
+	def test_write_synthetic_data(self):
+		"""Test the written CSV files read back through the import readers."""
+		with tempfile.TemporaryDirectory() as data_path:
+			counts = write_synthetic_data(data_path, 500, sql=False)
+			self.assertEqual(counts["Village"], 500)
+			for doctype, count in counts.items():
+				self.assertEqual(len(list(iter_csv_locations(data_path, doctype))), count)
+			self.assertFalse(os.path.exists(os.path.join(data_path, "sql")))
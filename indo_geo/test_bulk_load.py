@@ -0,0 +1,56 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.bulk_load import bulk_load_mode, check_location_integrity
+from indo_geo.indo_geo.utils.location_indexes import LOCATION_INDEXES, get_index_name
+
+
+class TestBulkLoad(FrappeTestCase):
+	def test_integrity_check(self):
+		"""Test orphans and parent links that do not match the code are reported."""
+		self.assertEqual(check_location_integrity(), [])
+
+		frappe.db.sql("""INSERT INTO `tabVillage` (name, village_code, village_name, district)
+			VALUES ('9999999001', '9999999001', 'ORPHAN', '9999999')""")
+		frappe.db.sql("""INSERT INTO `tabVillage` (name, village_code, village_name, district)
+			VALUES ('3201010999', '3201010999', 'MISMATCH', '3201020')""")
+		try:
+			problems = check_location_integrity()
+		finally:
+			frappe.db.sql("DELETE FROM `tabVillage` WHERE name IN ('9999999001', '3201010999')")
+
+		self.assertEqual(len(problems), 2)
+		self.assertTrue(any("9999999001" in problem for problem in problems))
+		self.assertTrue(any("3201010999" in problem for problem in problems))
+
+	def has_indexes(self):
+		return all(
+			frappe.db.has_index(f"tab{doctype}", get_index_name(columns))
+			for doctype, indexes in LOCATION_INDEXES.items()
+			for columns in indexes
+		)
+
+	def test_failed_load_is_rolled_back(self):
+		"""Test an error inside bulk load mode undoes the load and still restores the indexes."""
+		with self.assertRaises(ZeroDivisionError):
+			with bulk_load_mode():
+				frappe.db.sql("""INSERT INTO `tabVillage` (name, village_code, village_name, district)
+					VALUES ('3201010999', '3201010999', 'GAGAL', '3201010')""")
+				1 / 0
+
+		self.assertFalse(frappe.db.exists("Village", "3201010999"))
+		self.assertTrue(self.has_indexes())
+
+	def test_orphans_fail_the_load(self):
+		"""Test bulk load mode throws when the loaded tables hold orphans."""
+		self.addCleanup(frappe.db.commit)
+		self.addCleanup(frappe.db.sql, "DELETE FROM `tabVillage` WHERE name = '9999999001'")
+		with self.assertRaises(frappe.ValidationError):
+			with bulk_load_mode():
+				frappe.db.sql("""INSERT INTO `tabVillage` (name, village_code, village_name, district)
+					VALUES ('9999999001', '9999999001', 'ORPHAN', '9999999')""")
+
+		self.assertTrue(self.has_indexes())
@@ -0,0 +1,31 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+from array import array
+
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.code_index import ancestor_codes, code_range, get_level, is_under, parent_code
+
+
+class TestCodeIndex(FrappeTestCase):
+	def test_code_arithmetic(self):
+		"""Test levels, parents and ancestors are derived from the code alone."""
+		self.assertEqual(get_level("3201010001"), "Village")
+		self.assertIsNone(get_level("320101"))
+		self.assertIsNone(get_level("32A1"))
+		self.assertEqual(parent_code("3201010"), "3201")
+		self.assertIsNone(parent_code("32"))
+		self.assertEqual(ancestor_codes("3201010001"), ["32", "3201", "3201010"])
+		self.assertTrue(is_under("3201010001", "3201"))
+		self.assertFalse(is_under("3201010001", "3202"))
+		self.assertFalse(is_under("3201", "3201"))
+
+	def test_code_range(self):
+		"""Test the codes below a parent are one range of the sorted codes."""
+		villages = array("Q", [3201010001, 3201010002, 3201020001, 3202010001])
+		self.assertEqual(code_range(villages, "3201010", 10), (0, 2))
+		self.assertEqual(code_range(villages, "32", 10), (0, 4))
+		self.assertEqual(code_range(villages, "3203", 10), (4, 4))
+		self.assertEqual(code_range(villages, None, 10), (0, 4))
+		self.assertEqual(code_range(villages, "3201010001", 10), (0, 0))
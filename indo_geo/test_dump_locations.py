@@ -0,0 +1,59 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import datetime
+import gzip
+import os
+import shutil
+import tempfile
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.dump_locations import dump_villages, generate_village_sql
+from indo_geo.indo_geo.utils.import_locations import iter_sql_chunks
+
+
+class TestDumpLocations(FrappeTestCase):
+	def setUp(self):
+		self.sql_path = tempfile.mkdtemp(prefix="indo_geo_dump_")
+		self.addCleanup(shutil.rmtree, self.sql_path, ignore_errors=True)
+
+	def test_dump_villages(self):
+		"""Test the streamed village dump holds every village in small INSERT statements."""
+		if not frappe.db.count("Village"):
+			self.skipTest("No villages to dump")
+
+		dump_villages(self.sql_path, batch_size=500)
+		file_path = os.path.join(self.sql_path, "villages.sql")
+		with open(file_path, encoding="utf-8") as f:
+			plain_dump = f.read()
+
+		rows = 0
+		for statement, _bytes_read in iter_sql_chunks(file_path):
+			self.assertIn("INSERT IGNORE INTO tabVillage", statement)
+			self.assertNotIn("district_code", statement)
+			statement_rows = statement.count("\n('")
+			self.assertLessEqual(statement_rows, 500)
+			rows += statement_rows
+		self.assertEqual(rows, frappe.db.count("Village"))
+
+		# The gzipped dump holds the same statements and replaces the plain one
+		dump_villages(self.sql_path, compression="gzip", batch_size=500)
+		self.assertFalse(os.path.exists(file_path))
+		with gzip.open(file_path + ".gz", "rt", encoding="utf-8") as f:
+			self.assertEqual(f.read(), plain_dump)
+
+	def test_generate_village_sql(self):
+		"""Test village rows are escaped and their timestamps formatted."""
+		creation = datetime.datetime(2025, 1, 2, 3, 4, 5, 6)
+		sql = generate_village_sql(
+			[("1101010001", creation, creation, None, None, "1101010001", "LA'UT", "1101010", "1101", "11")]
+		)
+		self.assertTrue(sql.startswith("INSERT IGNORE INTO tabVillage"))
+		self.assertIn(
+			"('1101010001', '2025-01-02 03:04:05.000006', '2025-01-02 03:04:05.000006', "
+			"'Administrator', 'Administrator', 0, 0, '1101010001', 'LA''UT', '1101010', '1101', '11');",
+			sql,
+		)
+		self.assertEqual(generate_village_sql([]), "")
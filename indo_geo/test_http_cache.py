@@ -0,0 +1,67 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.http_cache import not_modified
+from indo_geo.indo_geo.utils.location_cache import VERSION_KEY, bump_version
+
+
+class TestHttpCache(FrappeTestCase):
+	def setUp(self):
+		self.saved = {
+			key: getattr(frappe.local, key, None) for key in ("request", "response", "response_headers")
+		}
+		frappe.local.response = frappe._dict()
+
+	def tearDown(self):
+		for key, value in self.saved.items():
+			setattr(frappe.local, key, value)
+
+	def get(self, *params, **headers):
+		frappe.local.request = frappe._dict(method="GET", headers=headers)
+		frappe.local.response = frappe._dict()
+		frappe.local.response_headers = {}
+		return not_modified(["Regency"], *params)
+
+	def test_etag_revalidation(self):
+		"""Test a matching If-None-Match gets a 304 until the data changes."""
+		self.assertFalse(self.get("32"))
+		etag = frappe.local.response_headers["ETag"]
+		self.assertIn("max-age", frappe.local.response_headers["Cache-Control"])
+		self.assertTrue(frappe.local.response_headers["Cache-Control"].startswith("private"))
+
+		self.assertTrue(self.get("32", **{"If-None-Match": etag}))
+		self.assertEqual(frappe.local.response.http_status_code, 304)
+
+		self.assertFalse(self.get("33", **{"If-None-Match": etag}))
+
+		bump_version("Regency")
+		self.assertFalse(self.get("32", **{"If-None-Match": etag}))
+		self.assertNotEqual(frappe.local.response_headers["ETag"], etag)
+
+	def test_if_modified_since(self):
+		"""Test Last-Modified is honoured when the client sends no ETag."""
+		self.get("32")
+		last_modified = frappe.local.response_headers["Last-Modified"]
+
+		self.assertTrue(self.get("32", **{"If-Modified-Since": last_modified}))
+		self.assertFalse(self.get("32", **{"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"}))
+
+	def test_outside_requests(self):
+		"""Test nothing happens when called from Python rather than over HTTP."""
+		frappe.local.request = None
+		self.assertFalse(not_modified(["Regency"], "32"))
+
+	def test_shared_mode_etag_follows_served_version(self):
+		"""Test the ETag keeps the stamp the worker reads with until it re-reads it."""
+		frappe.local.conf.indo_geo_cache_backend = "redis"
+		self.addCleanup(frappe.local.conf.pop, "indo_geo_cache_backend", None)
+		self.get("32")
+		etag = frappe.local.response_headers["ETag"]
+
+		# Another worker's bump is only seen once this worker's copy of the stamp expires
+		self.addCleanup(bump_version, "Regency")
+		frappe.cache().set_value(f"{VERSION_KEY}:Regency", "1")
+		self.assertTrue(self.get("32", **{"If-None-Match": etag}))
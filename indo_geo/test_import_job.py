@@ -0,0 +1,134 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import csv
+import os
+import tempfile
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_to_date, now_datetime
+from frappe.utils.background_jobs import execute_job
+
+from indo_geo.indo_geo.utils.import_job import (
+	IMPORT_TIMEOUT,
+	STATE_DOCTYPE,
+	build_valid_rows,
+	get_state,
+	resume_location_import,
+	run_location_import,
+)
+from indo_geo.indo_geo.utils.import_locations import clear_all_locations, get_data_counts, get_location_counts
+from indo_geo.indo_geo.utils.location_data import CSV_FILES, get_data_path, iter_locations
+
+
+class TestImportJob(FrappeTestCase):
+	def test_full_import(self):
+		"""Test the job imports every table and marks each one completed."""
+		clear_all_locations()
+		run_location_import()
+
+		counts = get_location_counts()
+		data_counts = get_data_counts()
+		self.assertEqual(counts["provinces"], data_counts["provinces"])
+		self.assertEqual(counts["regencies"], data_counts["regencies"])
+		self.assertEqual(counts["villages"], data_counts["villages"])
+
+		for state in frappe.get_all(STATE_DOCTYPE, fields=["status", "rows_imported", "total_rows"]):
+			self.assertEqual(state.status, "Completed")
+			self.assertEqual(state.rows_imported, state.total_rows)
+
+	def test_resume_after_crash(self):
+		"""Test an interrupted village import resumes from its checkpoint."""
+		clear_all_locations()
+		run_location_import()
+		expected = get_location_counts()
+
+		# Roll the village table back to a checkpoint 1000 rows short of the end
+		state = get_state("Village")
+		checkpoint = state.total_rows - 1000
+		locations = list(iter_locations(get_data_path(), "Village"))
+		frappe.db.delete("Village", {"name": ("in", [code for code, _name, _parent in locations[checkpoint:]])})
+		frappe.db.set_value(
+			STATE_DOCTYPE,
+			"Village",
+			{
+				"status": "Running",
+				"rows_processed": checkpoint,
+				"rows_imported": frappe.db.count("Village"),
+				"last_code": locations[checkpoint - 1][0],
+			},
+		)
+		frappe.db.commit()
+
+		run_location_import()
+		self.assertEqual(get_location_counts(), expected)
+		self.assertEqual(frappe.db.get_value(STATE_DOCTYPE, "Village", "status"), "Completed")
+
+	def test_failed_run_is_recorded(self):
+		"""Test a failed run keeps its Failed state and error log once the worker rolls the job back."""
+		clear_all_locations()
+		self.addCleanup(run_location_import)
+		with tempfile.TemporaryDirectory() as data_path:
+			with open(os.path.join(data_path, CSV_FILES["Province"]), "w", newline="") as f:
+				csv.writer(f).writerow(("1", "TOO SHORT"))
+			with self.assertRaises(frappe.ValidationError):
+				execute_job(
+					site=frappe.local.site,
+					method="indo_geo.indo_geo.utils.import_job.run_location_import",
+					event=None,
+					job_name="test_failed_run_is_recorded",
+					kwargs={"data_path": data_path},
+					is_async=False,
+				)
+
+		self.assertEqual(frappe.db.get_value(STATE_DOCTYPE, "Province", "status"), "Failed")
+		self.assertTrue(frappe.db.exists("Error Log", {"method": "Location import of Province failed"}))
+
+	def test_scheduler_resumes_unfinished_import(self):
+		"""Test the scheduler hook restarts an import that stopped moving, and leaves others alone."""
+		clear_all_locations()
+		run_location_import()
+		expected = get_location_counts()
+		stale = add_to_date(now_datetime(), seconds=-IMPORT_TIMEOUT - 60)
+
+		# A run that saved its checkpoint recently may still be going
+		frappe.db.set_value(STATE_DOCTYPE, "Village", "status", "Running")
+		frappe.db.commit()
+		resume_location_import()
+		self.assertEqual(frappe.db.get_value(STATE_DOCTYPE, "Village", "status"), "Running")
+
+		frappe.db.set_value(STATE_DOCTYPE, "Village", "modified", stale, update_modified=False)
+		frappe.db.commit()
+		resume_location_import()
+		self.assertEqual(frappe.db.get_value(STATE_DOCTYPE, "Village", "status"), "Completed")
+		self.assertEqual(get_location_counts(), expected)
+
+		# Without any checkpoint no import was started, so none is resumed
+		frappe.db.delete(STATE_DOCTYPE)
+		resume_location_import()
+		self.assertEqual(frappe.db.count(STATE_DOCTYPE), 0)
+
+	def test_scheduler_leaves_failed_import(self):
+		"""Test the scheduler hook does not retry a failed import."""
+		clear_all_locations()
+		run_location_import()
+		stale = add_to_date(now_datetime(), seconds=-IMPORT_TIMEOUT - 60)
+
+		frappe.db.set_value(STATE_DOCTYPE, "Village", {"status": "Failed", "modified": stale}, update_modified=False)
+		frappe.db.commit()
+		resume_location_import()
+		self.assertEqual(frappe.db.get_value(STATE_DOCTYPE, "Village", "status"), "Failed")
+
+	def test_build_valid_rows(self):
+		"""Test existing codes and orphans are skipped and invalid codes throw."""
+		codes = {"11"}
+		rows = build_valid_rows("Province", [("11", "ACEH", None), ("12", "SUMATERA UTARA", None)], None, codes)
+		self.assertEqual([row[0] for row in rows], ["12"])
+		self.assertEqual(codes, {"11", "12"})
+
+		rows = build_valid_rows("Regency", [("1101", "SIMEULUE", "11"), ("9901", "ORPHAN", "99")], {"11"})
+		self.assertEqual([row[0] for row in rows], ["1101"])
+
+		with self.assertRaises(frappe.ValidationError):
+			build_valid_rows("Regency", [("110", "TOO SHORT", "11")], {"11"})
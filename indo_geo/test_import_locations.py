@@ -0,0 +1,154 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import csv
+import gzip
+import os
+import shutil
+import tempfile
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.dump_locations import convert_districts_csv_to_sql, convert_villages_csv_to_sql
+from indo_geo.indo_geo.utils.import_locations import (
+	clear_all_locations,
+	import_all_locations_sql,
+	import_provinces_sql,
+	import_regencies_sql,
+	import_sql_parallel,
+	iter_sql_chunks,
+)
+from indo_geo.indo_geo.utils.location_data import (
+	find_data_file,
+	get_data_path,
+	iter_csv_locations,
+	open_data_file,
+	remove_other_variants,
+)
+
+
+class TestImportLocations(FrappeTestCase):
+	def write_sql(self, temp_dir, content):
+		file_path = os.path.join(temp_dir, "villages.sql")
+		with open(file_path, "w", encoding="utf-8") as f:
+			f.write(content)
+		return file_path
+
+	def test_iter_sql_chunks(self):
+		"""Test the village dump is streamed one statement per chunk marker."""
+		content = (
+			"-- Villages from CSV\n\n"
+			"-- Chunk 1 (2 records)\n"
+			"INSERT INTO tabVillage (name) VALUES\n('9901001001'),\n('9901001002');\n\n"
+			"-- Chunk 2 (1 records)\n"
+			"INSERT INTO tabVillage (name) VALUES\n('9901001003');\n"
+		)
+		with tempfile.TemporaryDirectory() as temp_dir:
+			file_path = self.write_sql(temp_dir, content)
+			chunks = list(iter_sql_chunks(file_path))
+
+		self.assertEqual(len(chunks), 2)
+		self.assertIn("'9901001002'", chunks[0][0])
+		self.assertNotIn("'9901001003'", chunks[0][0])
+		self.assertTrue(chunks[1][0].startswith("-- Chunk 2"))
+		self.assertLess(chunks[0][1], chunks[1][1])
+		self.assertEqual(chunks[1][1], len(content.encode("utf-8")))
+
+	def test_iter_sql_chunks_without_markers(self):
+		"""Test a dump without chunk markers is executed as a single statement."""
+		content = "INSERT INTO tabVillage (name) VALUES\n('9901001001');\n"
+		with tempfile.TemporaryDirectory() as temp_dir:
+			file_path = self.write_sql(temp_dir, content)
+			self.assertEqual(list(iter_sql_chunks(file_path)), [(content, len(content))])
+
+	def test_iter_sql_chunks_max_rows(self):
+		"""Test long multi-row INSERTs are split into statements of at most max_rows rows."""
+		header = "INSERT INTO tabDistrict (name) VALUES\n"
+		content = "-- Districts from CSV\n" + header + "('9901001'),\n('9901002'),\n('9901003'),\n('9901004'),\n('9901005');\n"
+		with tempfile.TemporaryDirectory() as temp_dir:
+			file_path = self.write_sql(temp_dir, content)
+			statements = [statement for statement, _bytes_read in iter_sql_chunks(file_path, max_rows=2)]
+
+		self.assertEqual(statements, [
+			"-- Districts from CSV\n" + header + "('9901001'),\n('9901002');\n",
+			header + "('9901003'),\n('9901004');\n",
+			header + "('9901005');\n",
+		])
+
+	def test_iter_sql_chunks_gzip(self):
+		"""Test a gzipped dump is streamed like the plain one."""
+		content = (
+			"-- Chunk 1 (1 records)\n"
+			"INSERT INTO tabVillage (name) VALUES\n('9901001001');\n"
+			"-- Chunk 2 (1 records)\n"
+			"INSERT INTO tabVillage (name) VALUES\n('9901001002');\n"
+		)
+		with tempfile.TemporaryDirectory() as temp_dir:
+			plain_chunks = list(iter_sql_chunks(self.write_sql(temp_dir, content)))
+			with gzip.open(os.path.join(temp_dir, "villages.sql.gz"), "wt", encoding="utf-8") as f:
+				f.write(content)
+			os.remove(os.path.join(temp_dir, "villages.sql"))
+
+			file_path = find_data_file(os.path.join(temp_dir, "villages.sql"))
+			self.assertTrue(file_path.endswith(".gz"))
+			self.assertEqual(list(iter_sql_chunks(file_path)), plain_chunks)
+
+	def test_compressed_csv(self):
+		"""Test a gzipped CSV file is read in place of the plain one, and replaces it when written."""
+		with tempfile.TemporaryDirectory() as temp_dir:
+			plain_path = os.path.join(temp_dir, "regencies.csv")
+			shutil.copy(find_data_file(os.path.join(get_data_path(), "regencies.csv")), plain_path)
+			expected = list(iter_csv_locations(temp_dir, "Regency"))
+
+			with open(plain_path, "rb") as source, open_data_file(plain_path + ".gz", "wb") as target:
+				shutil.copyfileobj(source, target)
+			remove_other_variants(plain_path + ".gz")
+
+			self.assertFalse(os.path.exists(plain_path))
+			self.assertEqual(list(iter_csv_locations(temp_dir, "Regency")), expected)
+
+
+class TestParallelImport(FrappeTestCase):
+	"""Runs the multi-connection loader on the districts and villages of one province."""
+
+	def setUp(self):
+		self.data_path = tempfile.mkdtemp(prefix="indo_geo_parallel_")
+		self.addCleanup(shutil.rmtree, self.data_path, ignore_errors=True)
+		self.sql_path = os.path.join(self.data_path, "sql")
+		os.makedirs(self.sql_path)
+
+		self.expected = {}
+		for doctype, file_name in (("District", "districts.csv"), ("Village", "villages.csv")):
+			locations = [
+				(code, name) for code, name, _parent in iter_csv_locations(get_data_path(), doctype)
+				if code.startswith("11")
+			]
+			with open(os.path.join(self.data_path, file_name), "w", encoding="utf-8", newline="") as f:
+				csv.writer(f).writerows(locations)
+			self.expected[doctype] = len(locations)
+		convert_districts_csv_to_sql(self.data_path, self.sql_path)
+		convert_villages_csv_to_sql(self.data_path, self.sql_path)
+
+		clear_all_locations()
+		self.addCleanup(import_all_locations_sql)
+		self.addCleanup(clear_all_locations)
+		shipped_sql_path = os.path.join(get_data_path(), "sql")
+		import_provinces_sql(shipped_sql_path)
+		import_regencies_sql(shipped_sql_path)
+
+	def test_parallel_import(self):
+		"""Test two worker connections load every district and village."""
+		import_sql_parallel(self.sql_path, 2)
+		self.assertEqual(frappe.db.count("District"), self.expected["District"])
+		self.assertEqual(frappe.db.count("Village"), self.expected["Village"])
+
+	def test_failed_worker_empties_tables(self):
+		"""Test a failing chunk leaves no partial load behind, so a rerun starts over."""
+		with open(os.path.join(self.sql_path, "villages.sql"), "a", encoding="utf-8") as f:
+			f.write("-- Chunk 999\nINSERT INTO tabVillage (no_such_column) VALUES\n('x');\n")
+
+		with self.assertRaises(Exception):
+			import_sql_parallel(self.sql_path, 2)
+		self.assertEqual(frappe.db.count("District"), 0)
+		self.assertEqual(frappe.db.count("Village"), 0)
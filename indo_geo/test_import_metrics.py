@@ -0,0 +1,70 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import time
+
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.import_metrics import (
+	ImportJob,
+	get_last_metrics,
+	get_metrics_text,
+	track_job,
+)
+
+
+class TestImportMetrics(FrappeTestCase):
+	def test_spans_are_exclusive(self):
+		"""Test time in a nested span is not charged to the enclosing one."""
+		job = ImportJob("test")
+		with job.span("execute"):
+			time.sleep(0.02)
+			with job.span("commit"):
+				time.sleep(0.05)
+
+		self.assertGreaterEqual(job.spans["commit"], 0.05)
+		self.assertGreaterEqual(job.spans["execute"], 0.02)
+		self.assertLess(job.spans["execute"], 0.05)
+
+	def test_iter_span(self):
+		"""Test only the time spent producing items is charged to the span."""
+
+		def slow_items():
+			for i in range(3):
+				time.sleep(0.01)
+				yield i
+
+		job = ImportJob("test")
+		with job.span("execute"):
+			for _item in job.iter_span("read", slow_items()):
+				time.sleep(0.02)
+
+		self.assertGreaterEqual(job.spans["read"], 0.03)
+		self.assertGreaterEqual(job.spans["execute"], 0.06)
+		self.assertLess(job.spans["read"], 0.06)
+
+	def test_nested_jobs_record_once(self):
+		"""Test a job started inside another one records into the outer job."""
+		with track_job("test_outer_job") as outer:
+			outer.add_rows(3)
+			with track_job("test_inner_job") as inner:
+				self.assertIs(inner, outer)
+				inner.add_rows(2)
+				inner.add_bytes(100)
+
+		metrics = get_last_metrics()["test_outer_job"]
+		self.assertEqual(metrics["status"], "success")
+		self.assertEqual(metrics["rows"], 5)
+		self.assertEqual(metrics["bytes_read"], 100)
+		self.assertNotIn("test_inner_job", get_last_metrics())
+
+		text = get_metrics_text()
+		self.assertIn('indo_geo_import_rows{job="test_outer_job"} 5', text)
+		self.assertIn('indo_geo_import_success{job="test_outer_job"} 1', text)
+
+	def test_failed_job(self):
+		"""Test a job that raises is recorded as failed."""
+		with self.assertRaises(ValueError), track_job("test_failed_job"):
+			raise ValueError
+
+		self.assertEqual(get_last_metrics()["test_failed_job"]["status"], "failed")
@@ -4,7 +4,8 @@
 import frappe
 from frappe.tests.utils import FrappeTestCase
 
-from indo_geo.indo_geo.utils.import_locations import clear_all_locations, get_data_counts
+from indo_geo.indo_geo.install.after_install import fallback_import
+from indo_geo.indo_geo.utils.import_locations import clear_all_locations, get_data_counts, get_location_counts
 from indo_geo.install import after_install
 
 
@@ -55,3 +56,26 @@ class TestInstall(FrappeTestCase):
 		self.assertEqual(initial_regencies, final_regencies,
 			"Regency count should not change on second install")
 
+
+	def test_fallback_import(self):
+		"""Test the batched fallback import loads every level with derived parent links."""
+		clear_all_locations()
+		fallback_import()
+
+		counts = get_location_counts()
+		data_counts = get_data_counts()
+		self.assertEqual(counts["provinces"], data_counts["provinces"])
+		self.assertEqual(counts["regencies"], data_counts["regencies"])
+		self.assertGreater(counts["villages"], 0)
+
+		village = frappe.db.get_value(
+			"Village", {}, ["name", "village_code", "district", "regency", "province"], as_dict=True
+		)
+		self.assertEqual(village.name, village.village_code)
+		self.assertEqual(village.district, village.village_code[:7])
+		self.assertEqual(village.regency, village.village_code[:4])
+		self.assertEqual(village.province, village.village_code[:2])
+
+		# A second run finds every location in place and inserts nothing
+		fallback_import()
+		self.assertEqual(get_location_counts(), counts)
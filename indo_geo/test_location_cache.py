@@ -0,0 +1,77 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.location_cache import (
+	_get_entry,
+	clear_location_cache,
+	get_children,
+	get_derived,
+	get_rows,
+	get_version,
+	location_exists,
+)
+
+
+class TestLocationCache(FrappeTestCase):
+	def test_version_bumped_after_commit(self):
+		"""Test an edit only bumps the version stamp once its transaction commits."""
+		version = get_version("Province")
+		clear_location_cache(frappe._dict(doctype="Province"))
+		self.assertEqual(get_version("Province"), version)
+
+		frappe.db.after_commit.run()
+		self.assertNotEqual(get_version("Province"), version)
+
+	def test_rollback_discards_uncommitted_rows(self):
+		"""Test a rolled back edit is neither bumped nor kept in this worker's cache."""
+		province = frappe.db.get_value("Province", {}, ["name", "province_name"], as_dict=True)
+		if not province:
+			self.skipTest("No provinces to edit")
+
+		version = get_version("Province")
+		frappe.db.set_value("Province", province.name, "province_name", "ROLLED BACK")
+		clear_location_cache(frappe._dict(doctype="Province"))
+		names = {row.name: row.province_name for row in get_rows("Province")}
+		self.assertEqual(names[province.name], "ROLLED BACK")
+
+		frappe.db.rollback()
+		self.assertEqual(get_version("Province"), version)
+		names = {row.name: row.province_name for row in get_rows("Province")}
+		self.assertEqual(names[province.name], province.province_name)
+
+	def test_edit_only_drops_dependent_structures(self):
+		"""Test an edit only drops the derived structures built from its doctype."""
+		provinces = get_derived("test_provinces", object, doctypes=["Province"])
+		villages = get_derived("test_villages", object, doctypes=["Village"])
+		everything = get_derived("test_everything", object)
+
+		clear_location_cache(frappe._dict(doctype="Village"))
+		self.assertIs(get_derived("test_provinces", object, doctypes=["Province"]), provinces)
+		self.assertIsNot(get_derived("test_villages", object, doctypes=["Village"]), villages)
+		self.assertIsNot(get_derived("test_everything", object), everything)
+		frappe.db.rollback()
+
+	def test_children_need_a_parent_code(self):
+		"""Test children are only looked up below a code of the level right above."""
+		for parent in ("3", "32010", "320101000", "abcd"):
+			with self.assertRaises(frappe.ValidationError):
+				get_children("Village", parent)
+
+		# A well-formed code without children is not remembered
+		self.assertEqual(get_children("Village", "9999999"), [])
+		self.assertNotIn("9999999", _get_entry("Village")["children"])
+
+	def test_location_exists(self):
+		"""Test code lookups agree between the per-worker and the shared Redis cache."""
+		province = frappe.db.get_value("Province", {}, "name")
+		if not province:
+			self.skipTest("No provinces to look up")
+
+		for backend in (None, "redis"):
+			frappe.local.conf.indo_geo_cache_backend = backend
+			self.addCleanup(frappe.local.conf.pop, "indo_geo_cache_backend", None)
+			self.assertTrue(location_exists("Province", province))
+			self.assertFalse(location_exists("Province", "00"))
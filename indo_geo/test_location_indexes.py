@@ -0,0 +1,39 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.location_indexes import (
+	LOCATION_INDEXES,
+	add_location_indexes,
+	drop_location_indexes,
+	get_index_name,
+)
+
+
+class TestLocationIndexes(FrappeTestCase):
+	def has_indexes(self, doctype):
+		return all(
+			frappe.db.has_index(f"tab{doctype}", get_index_name(columns)) for columns in LOCATION_INDEXES[doctype]
+		)
+
+	def test_add_and_drop(self):
+		"""Test the composite indexes can be dropped and recreated, and are created only once."""
+		drop_location_indexes("Village")
+		self.assertFalse(self.has_indexes("Village"))
+
+		add_location_indexes("Village")
+		add_location_indexes("Village")
+		self.assertTrue(self.has_indexes("Village"))
+
+	def test_children_query_uses_index(self):
+		"""Test a children-by-name query reads the composite index without a filesort."""
+		add_location_indexes("District")
+		plan = frappe.db.sql(
+			"EXPLAIN SELECT `name` FROM `tabDistrict` WHERE `regency` = %s ORDER BY `district_name`",
+			"3201",
+			as_dict=True,
+		)[0]
+		self.assertEqual(plan.key, get_index_name(["regency", "district_name"]))
+		self.assertNotIn("filesort", plan.Extra or "")
@@ -0,0 +1,40 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.location_resolver import LocationResolver
+
+
+class TestLocationResolver(FrappeTestCase):
+	def setUp(self):
+		self.resolver = LocationResolver({
+			"Province": [("32", "JAWA BARAT")],
+			"Regency": [("3201", "KABUPATEN BOGOR")],
+			"District": [("3201010", "CIBINONG")],
+			"Village": [("3201010001", "PAKANSARI"), ("3202010001", "YATIM")],
+		})
+
+	def test_resolve_many(self):
+		"""Test codes of any level resolve to their name path and parent codes, in order."""
+		village, district = self.resolver.resolve_many(["3201010001", "3201010"])
+
+		self.assertTrue(village["valid"])
+		self.assertEqual(village["doctype"], "Village")
+		self.assertEqual(village["name"], "PAKANSARI")
+		self.assertEqual(village["path"], ["JAWA BARAT", "KABUPATEN BOGOR", "CIBINONG", "PAKANSARI"])
+		self.assertEqual((village["province"], village["regency"], village["district"]), ("32", "3201", "3201010"))
+		self.assertEqual(district["path"], ["JAWA BARAT", "KABUPATEN BOGOR", "CIBINONG"])
+		self.assertNotIn("district", district)
+
+	def test_invalid_codes(self):
+		"""Test unknown codes, codes with missing ancestors and malformed codes are invalid."""
+		unknown, orphan, malformed = self.resolver.resolve_many(["3201010999", "3202010001", "32-01"])
+
+		self.assertFalse(unknown["valid"])
+		self.assertIsNone(unknown["name"])
+		self.assertEqual(unknown["path"], ["JAWA BARAT", "KABUPATEN BOGOR", "CIBINONG"])
+		self.assertFalse(orphan["valid"])
+		self.assertEqual(orphan["regency"], "3202")
+		self.assertFalse(malformed["valid"])
+		self.assertIsNone(malformed["doctype"])
@@ -0,0 +1,50 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.location_search import LocationSearchIndex
+
+
+class TestLocationSearch(FrappeTestCase):
+	def setUp(self):
+		self.index = LocationSearchIndex({
+			"Province": [("32", "JAWA BARAT"), ("33", "JAWA TENGAH")],
+			"Regency": [("3204", "KABUPATEN BANDUNG"), ("3217", "KABUPATEN BANDUNG BARAT"), ("3301", "KABUPATEN CILACAP")],
+			"District": [("3204010", "CIWIDEY"), ("3217010", "BANDUNG"), ("3301010", "DAYEUHLUHUR")],
+			"Village": [("3204010001", "SUKAMAJU"), ("3217010001", "SUKAMAJU"), ("3301010001", "BANDUNG")],
+		})
+
+	def test_ranking(self):
+		"""Test exact names rank before prefixes, and higher levels first."""
+		hits = self.index.search("bandung")
+		self.assertEqual([hit["code"] for hit in hits], ["3217010", "3301010001", "3204", "3217"])
+
+	def test_word_prefix(self):
+		"""Test every query word may match the start of any word of the name."""
+		hits = self.index.search("kab band bar")
+		self.assertEqual([hit["code"] for hit in hits], ["3217"])
+
+		# A one-letter word is checked against the names found by the rarer one
+		hits = self.index.search("b kab")
+		self.assertEqual([hit["code"] for hit in hits], ["3204", "3217"])
+
+	def test_trigram_fallback(self):
+		"""Test misspelled queries fall back to trigram matches."""
+		hits = self.index.search("ciwidei")
+		self.assertEqual(hits[0]["code"], "3204010")
+
+	def test_filters_and_path(self):
+		"""Test level/parent filters and the hierarchy path of each hit."""
+		hits = self.index.search("sukamaju", parent="3204")
+		self.assertEqual(len(hits), 1)
+		self.assertEqual(hits[0]["path"], ["JAWA BARAT", "KABUPATEN BANDUNG", "CIWIDEY", "SUKAMAJU"])
+		self.assertEqual(hits[0]["district"], "3204010")
+
+		hits = self.index.search("bandung", level="Village")
+		self.assertEqual([hit["code"] for hit in hits], ["3301010001"])
+
+	def test_code_prefix(self):
+		"""Test numeric queries search by code prefix."""
+		hits = self.index.search("3217")
+		self.assertEqual([hit["code"] for hit in hits], ["3217", "3217010", "3217010001"])
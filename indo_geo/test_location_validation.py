@@ -0,0 +1,33 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.location_validation import check_location, validate_many
+
+
+class TestLocationValidation(FrappeTestCase):
+	def test_check_location(self):
+		"""Test code format, parent prefix and parent existence are checked."""
+		regencies = {"3201"}
+		self.assertIsNone(check_location("District", "3201010", "3201", regencies))
+		self.assertIsNone(check_location("Province", "32"))
+		self.assertIn("7 digits", check_location("District", "320101", "3201", regencies))
+		self.assertIn("7 digits", check_location("District", "32010AB", "3201", regencies))
+		self.assertIn("mismatch", check_location("District", "3202010", "3201", regencies))
+		self.assertIn("does not exist", check_location("District", "3299010", "3299", regencies))
+
+	def test_validate_many(self):
+		"""Test invalid and duplicate rows are reported by index."""
+		rows = [
+			{"village_code": "3201010001", "district": "3201010"},
+			("3201010002", "3201010"),
+			("3201010001", "3201010"),
+			("3201020001", "3201010"),
+			("3201030001", "3201030"),
+		]
+
+		errors = validate_many("Village", rows, parent_codes={"3201010", "3201020"})
+
+		self.assertEqual([index for index, _message in errors], [2, 3, 4])
+		self.assertIn("Duplicate", errors[0][1])
@@ -0,0 +1,113 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import csv
+import os
+import tempfile
+
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.location_cache import (
+	LOCATION_FIELDS,
+	_read_locations,
+	adopt_snapshot,
+	bump_version,
+	get_adopted_snapshot,
+	get_code_names,
+	get_rows,
+)
+from indo_geo.indo_geo.utils.location_data import (
+	CSV_FILES,
+	find_snapshot,
+	get_data_path,
+	get_source_digest,
+	iter_csv_locations,
+)
+from indo_geo.indo_geo.utils.snapshot import SNAPSHOT_FILE, LocationSnapshot, write_snapshot
+
+
+class TestSnapshot(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.temp_dir = tempfile.TemporaryDirectory()
+		cls.locations = {
+			doctype: sorted(iter_csv_locations(get_data_path(), doctype))
+			for doctype in CSV_FILES
+		}
+		cls.file_path = os.path.join(cls.temp_dir.name, "locations.snapshot")
+		write_snapshot(cls.file_path, cls.locations)
+
+	@classmethod
+	def tearDownClass(cls):
+		cls.temp_dir.cleanup()
+		super().tearDownClass()
+
+	def test_round_trip(self):
+		"""Test every CSV row reads back unchanged from the snapshot."""
+		with LocationSnapshot(self.file_path) as snapshot:
+			for doctype, rows in self.locations.items():
+				self.assertEqual(snapshot.count(doctype), len(rows))
+				self.assertEqual(list(snapshot.iter_locations(doctype)), rows,
+					f"{doctype} rows differ after snapshot round trip")
+
+	def test_lookup(self):
+		"""Test point lookups and decoded codes on the mapped file."""
+		with LocationSnapshot(self.file_path) as snapshot:
+			self.assertEqual(snapshot.get("11"), ("ACEH", None))
+			self.assertEqual(snapshot.get("3201010002")[1], "3201010")
+			self.assertIsNone(snapshot.get("3201010999"))
+			self.assertIsNone(snapshot.get("not a code"))
+
+			self.assertIn(3201, snapshot.codes("Regency"))
+			self.assertEqual(list(snapshot.codes("Province")), sorted(snapshot.codes("Province")))
+
+	def test_smaller_than_csv(self):
+		"""Test deduplicated names and packed codes keep the snapshot well below the CSV size."""
+		csv_size = sum(os.path.getsize(os.path.join(get_data_path(), name)) for name in CSV_FILES.values())
+		self.assertLess(os.path.getsize(self.file_path), csv_size * 0.6)
+
+	def test_rejects_other_files(self):
+		"""Test files without the snapshot header are refused."""
+		file_path = os.path.join(self.temp_dir.name, "not_a_snapshot")
+		with open(file_path, "wb") as f:
+			f.write(b"\0" * 128)
+		with self.assertRaises(ValueError):
+			LocationSnapshot(file_path)
+
+	def test_stale_snapshot_is_ignored(self):
+		"""Test a snapshot only shadows the CSV files it was built from."""
+		with tempfile.TemporaryDirectory() as data_path:
+			csv_path = os.path.join(data_path, CSV_FILES["Province"])
+			with open(csv_path, "w", newline="") as f:
+				csv.writer(f).writerows([("11", "ACEH"), ("12", "SUMATERA UTARA")])
+			write_snapshot(
+				os.path.join(data_path, SNAPSHOT_FILE),
+				{"Province": [("11", "ACEH", None), ("12", "SUMATERA UTARA", None)]},
+				get_source_digest(data_path),
+			)
+			self.assertIsNotNone(find_snapshot(data_path))
+
+			with open(csv_path, "a", newline="") as f:
+				csv.writer(f).writerow(("13", "SUMATERA BARAT"))
+			self.assertIsNone(find_snapshot(data_path))
+
+	def test_lookups_read_adopted_snapshot(self):
+		"""Test the cached lookups read a snapshot matching the tables until the next change."""
+		snapshot_path = os.path.join(get_data_path(), SNAPSHOT_FILE)
+		if os.path.exists(snapshot_path):
+			self.skipTest("The data directory already has a snapshot")
+		locations = {doctype: _read_locations(doctype) for doctype in LOCATION_FIELDS}
+		write_snapshot(snapshot_path, locations, get_source_digest(get_data_path()))
+		self.addCleanup(adopt_snapshot)
+		self.addCleanup(os.remove, snapshot_path)
+
+		self.assertEqual(adopt_snapshot(), list(LOCATION_FIELDS))
+		self.assertIsNotNone(get_adopted_snapshot("Village"))
+		self.assertEqual(get_code_names("Province"), [(code, name) for code, name, _parent in locations["Province"]])
+		regency_codes = {row.regency_code: row.province for row in get_rows("Regency")}
+		self.assertEqual(regency_codes, {code: parent for code, _name, parent in locations["Regency"]})
+
+		bump_version("Village")
+		self.assertIsNone(get_adopted_snapshot("Village"))
+		self.assertIsNotNone(get_adopted_snapshot("Province"))
@@ -0,0 +1,56 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.static_bundle import (
+	MANIFEST_FILE,
+	build_location_bundle,
+	get_bundle_path,
+	rebuild_after_import,
+)
+
+
+class TestStaticBundle(FrappeTestCase):
+	def test_build_location_bundle(self):
+		"""Test one content-hashed shard is written per province, with a gzip copy."""
+		with tempfile.TemporaryDirectory() as temp_dir:
+			stale = os.path.join(temp_dir, "99.000000000000.json")
+			open(stale, "w").close()
+
+			manifest = build_location_bundle(temp_dir)
+
+			self.assertEqual(len(manifest["provinces"]), frappe.db.count("Province"))
+			self.assertEqual(set(manifest["shards"]), {code for code, _name in manifest["provinces"]})
+			self.assertFalse(os.path.exists(stale))
+
+			with open(os.path.join(temp_dir, MANIFEST_FILE), encoding="utf-8") as f:
+				self.assertEqual(json.load(f), manifest)
+
+			file_name = manifest["shards"]["32"]
+			with open(os.path.join(temp_dir, file_name), "rb") as f:
+				content = f.read()
+			with open(os.path.join(temp_dir, f"{file_name}.gz"), "rb") as f:
+				self.assertEqual(gzip.decompress(f.read()), content)
+			self.assertEqual(file_name, f"32.{hashlib.sha256(content).hexdigest()[:12]}.json")
+
+			shard = json.loads(content)
+			self.assertEqual(len(shard["regencies"]), frappe.db.count("Regency", {"province": "32"}))
+			self.assertTrue(all(code.startswith("32") for code, _name in shard["villages"]))
+
+	def test_bundle_is_per_site(self):
+		"""Test the bundle goes into the site's public files and is left alone by tests."""
+		bundle_path = os.path.realpath(get_bundle_path())
+		self.assertTrue(bundle_path.startswith(os.path.realpath(frappe.get_site_path("public", "files"))))
+
+		manifest_path = os.path.join(bundle_path, MANIFEST_FILE)
+		mtime = os.path.getmtime(manifest_path) if os.path.exists(manifest_path) else None
+		rebuild_after_import()
+		self.assertEqual(os.path.getmtime(manifest_path) if os.path.exists(manifest_path) else None, mtime)
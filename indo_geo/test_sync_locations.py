@@ -0,0 +1,53 @@
+# Copyright (c) 2025, Nuwaira Technology and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from indo_geo.indo_geo.utils.location_data import build_row
+from indo_geo.indo_geo.utils.sync_locations import apply_deletes, apply_inserts, diff_locations
+
+
+class TestSyncLocations(FrappeTestCase):
+	def row(self, code, name):
+		return build_row("District", code, name, code[:4], "2025-01-01 00:00:00.000000")
+
+	def db_hashes(self, *rows):
+		return {row[7]: hash(row[7:]) for row in rows}
+
+	def test_diff_locations(self):
+		"""Test rows are split into inserts, renames and deletions by code."""
+		db_hashes = self.db_hashes(
+			self.row("9901001", "LAMA"),
+			self.row("9901002", "SAMA"),
+			self.row("9901003", "HAPUS"),
+		)
+		rows = [self.row("9901001", "BARU"), self.row("9901002", "SAMA"), self.row("9901004", "TAMBAH")]
+
+		inserts, updates, deletes = diff_locations(db_hashes, rows)
+
+		self.assertEqual([row[0] for row in inserts], ["9901004"])
+		self.assertEqual([(row[0], row[8]) for row in updates], [("9901001", "BARU")])
+		self.assertEqual(deletes, ["9901003"])
+
+	def test_diff_ignores_timestamps(self):
+		"""Test rows built at a different time are not reported as changed."""
+		db_hashes = self.db_hashes(self.row("9901001", "SAMA"))
+		row = build_row("District", "9901001", "SAMA", "9901", "2030-01-01 00:00:00.000000")
+
+		self.assertEqual(diff_locations(db_hashes, [row]), ([], [], []))
+
+	def test_linked_locations_are_kept(self):
+		"""Test deletions skip locations that other rows still link to."""
+		timestamp = "2025-01-01 00:00:00.000000"
+		apply_inserts("Province", [build_row("Province", "99", "UJI", None, timestamp)])
+		apply_inserts("Regency", [build_row("Regency", "9901", "UJI", "99", timestamp)])
+		apply_inserts("District", [
+			build_row("District", "9901001", "TERPAKAI", "9901", timestamp),
+			build_row("District", "9901002", "KOSONG", "9901", timestamp),
+		])
+		apply_inserts("Village", [build_row("Village", "9901001001", "UJI", "9901001", timestamp)])
+
+		self.assertEqual(apply_deletes("District", ["9901001", "9901002"]), ["9901001"])
+		self.assertTrue(frappe.db.exists("District", "9901001"))
+		self.assertFalse(frappe.db.exists("District", "9901002"))